@@ -0,0 +1,59 @@
+"""Add daily_spending_rollups table
+
+Revision ID: 4f2a9c1d7e3b
+Revises: cbada860f8c8
+Create Date: 2026-01-12 10:14:03.512118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2a9c1d7e3b'
+down_revision: Union[str, None] = 'cbada860f8c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_spending_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('transaction_type', sa.String(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_daily_spending_rollups_id'), 'daily_spending_rollups', ['id'], unique=False)
+    op.create_index(op.f('ix_daily_spending_rollups_user_id'), 'daily_spending_rollups', ['user_id'], unique=False)
+    op.create_index('uq_daily_spending_rollups_key', 'daily_spending_rollups', ['user_id', 'category_id', 'transaction_type', 'day'], unique=True, postgresql_nulls_not_distinct=True)
+
+    # Populate from existing history. The lock holds off writers still running
+    # the previous release until the migration commits, so no transaction is
+    # written between the snapshot and the rollup going live.
+    op.execute("LOCK TABLE transactions IN SHARE MODE")
+    op.execute(
+        """
+        INSERT INTO daily_spending_rollups
+            (user_id, category_id, transaction_type, day, total_amount, transaction_count, updated_at)
+        SELECT user_id, category_id, transaction_type, CAST(transaction_date AS DATE),
+               SUM(amount), COUNT(id), now()
+        FROM transactions
+        GROUP BY user_id, category_id, transaction_type, CAST(transaction_date AS DATE)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_daily_spending_rollups_key', table_name='daily_spending_rollups')
+    op.drop_index(op.f('ix_daily_spending_rollups_user_id'), table_name='daily_spending_rollups')
+    op.drop_index(op.f('ix_daily_spending_rollups_id'), table_name='daily_spending_rollups')
+    op.drop_table('daily_spending_rollups')
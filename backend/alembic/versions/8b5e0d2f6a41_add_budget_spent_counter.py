@@ -0,0 +1,51 @@
+"""Add materialized spent counter to budgets
+
+Revision ID: 8b5e0d2f6a41
+Revises: 4f2a9c1d7e3b
+Create Date: 2026-01-19 09:42:17.204583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b5e0d2f6a41'
+down_revision: Union[str, None] = '4f2a9c1d7e3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('budgets', sa.Column('spent', sa.Numeric(precision=15, scale=2), server_default='0', nullable=False))
+
+    # Seed counters from the daily spending rollup
+    op.execute(
+        """
+        UPDATE budgets b
+        SET spent = s.spent
+        FROM (
+            SELECT b2.id, COALESCE(SUM(r.total_amount), 0) AS spent
+            FROM budgets b2
+            LEFT JOIN daily_spending_rollups r
+                ON r.user_id = b2.user_id
+               AND r.category_id = b2.category_id
+               AND r.transaction_type = 'expense'
+               AND r.day >= CAST(b2.start_date AS DATE)
+               AND r.day <= CAST(
+                    CASE b2.period
+                        WHEN 'monthly' THEN b2.start_date + INTERVAL '30 days'
+                        WHEN 'yearly' THEN b2.start_date + INTERVAL '365 days'
+                        ELSE timezone('UTC', now())
+                    END AS DATE)
+            GROUP BY b2.id
+        ) s
+        WHERE b.id = s.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('budgets', 'spent')
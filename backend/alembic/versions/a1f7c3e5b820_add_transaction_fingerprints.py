@@ -0,0 +1,50 @@
+"""Add content fingerprints for duplicate transaction detection
+
+Revision ID: a1f7c3e5b820
+Revises: e9b4d2a8c613
+Create Date: 2026-03-16 14:22:05.731940
+
+Adds a stored generated fingerprint column to transactions and
+transactions_archive, with hash indexes for equality lookups. Adding the
+column rewrites both tables; indexes on the partitioned transactions table
+cannot be built concurrently, so run this in a maintenance window.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f7c3e5b820'
+down_revision: Union[str, None] = 'e9b4d2a8c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same expression as app.models.transaction.FINGERPRINT_SQL
+FINGERPRINT = (
+    "md5((account_id)::text || '|' || "
+    "((transaction_date)::date - DATE '2000-01-01')::text || '|' || "
+    "(amount)::numeric(15, 2)::text || '|' || "
+    "btrim(regexp_replace(lower(description), '[^a-z0-9]+', ' ', 'g')))"
+)
+
+
+def upgrade() -> None:
+    for table in ('transactions', 'transactions_archive'):
+        op.add_column(table, sa.Column(
+            'fingerprint', sa.String(), sa.Computed(FINGERPRINT, persisted=True), nullable=True
+        ))
+    op.create_index('ix_transactions_fingerprint', 'transactions', ['fingerprint'],
+                    unique=False, postgresql_using='hash')
+    op.create_index('ix_transactions_archive_fingerprint', 'transactions_archive', ['fingerprint'],
+                    unique=False, postgresql_using='hash')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_archive_fingerprint', table_name='transactions_archive')
+    op.drop_index('ix_transactions_fingerprint', table_name='transactions')
+    for table in ('transactions_archive', 'transactions'):
+        op.drop_column(table, 'fingerprint')
@@ -0,0 +1,105 @@
+"""Add account balance ledger and snapshots
+
+Revision ID: a93d5e17c4b8
+Revises: f5c0b7d94a12
+Create Date: 2026-02-10 13:52:09.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93d5e17c4b8'
+down_revision: Union[str, None] = 'f5c0b7d94a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('account_balance_ledger',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('net_change', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_account_balance_ledger_id'), 'account_balance_ledger', ['id'], unique=False)
+    op.create_index('uq_account_balance_ledger_account_day', 'account_balance_ledger', ['account_id', 'day'], unique=True, postgresql_include=['net_change'])
+
+    op.create_table('account_balance_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('balance', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_account_balance_snapshots_id'), 'account_balance_snapshots', ['id'], unique=False)
+    op.create_index('uq_account_balance_snapshots_account_day', 'account_balance_snapshots', ['account_id', 'day'], unique=True, postgresql_include=['balance'])
+
+    # Replay transaction history per account and day
+    op.execute(
+        """
+        INSERT INTO account_balance_ledger (account_id, day, net_change, transaction_count, updated_at)
+        SELECT account_id, CAST(transaction_date AS DATE),
+               SUM(CASE transaction_type
+                       WHEN 'income' THEN amount
+                       WHEN 'expense' THEN -amount
+                       ELSE 0
+                   END),
+               COUNT(id), now()
+        FROM transactions
+        GROUP BY account_id, CAST(transaction_date AS DATE)
+        """
+    )
+
+    # Opening entries: the part of the current balance that history does not explain
+    op.execute(
+        """
+        INSERT INTO account_balance_ledger (account_id, day, net_change, transaction_count, updated_at)
+        SELECT a.id,
+               COALESCE(LEAST(h.first_day, CAST(a.created_at AS DATE)), CURRENT_DATE),
+               a.balance - COALESCE(h.total, 0), 0, now()
+        FROM accounts a
+        LEFT JOIN (
+            SELECT account_id, MIN(day) AS first_day, SUM(net_change) AS total
+            FROM account_balance_ledger
+            GROUP BY account_id
+        ) h ON h.account_id = a.id
+        ON CONFLICT (account_id, day)
+        DO UPDATE SET net_change = account_balance_ledger.net_change + EXCLUDED.net_change
+        """
+    )
+
+    # One snapshot per account and month, on the last day with activity
+    op.execute(
+        """
+        INSERT INTO account_balance_snapshots (account_id, day, balance, created_at)
+        SELECT account_id, day, balance, now()
+        FROM (
+            SELECT account_id, day,
+                   SUM(net_change) OVER (PARTITION BY account_id ORDER BY day) AS balance,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY account_id, date_trunc('month', day) ORDER BY day DESC
+                   ) AS position
+            FROM account_balance_ledger
+        ) s
+        WHERE position = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_account_balance_snapshots_account_day', table_name='account_balance_snapshots')
+    op.drop_index(op.f('ix_account_balance_snapshots_id'), table_name='account_balance_snapshots')
+    op.drop_table('account_balance_snapshots')
+    op.drop_index('uq_account_balance_ledger_account_day', table_name='account_balance_ledger')
+    op.drop_index(op.f('ix_account_balance_ledger_id'), table_name='account_balance_ledger')
+    op.drop_table('account_balance_ledger')
@@ -0,0 +1,54 @@
+"""Add transactions_archive table for cold transaction storage
+
+Revision ID: b61e3f9d2a47
+Revises: d4f8a2c6e0b5
+Create Date: 2026-02-23 15:19:36.274051
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b61e3f9d2a47'
+down_revision: Union[str, None] = 'd4f8a2c6e0b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('transactions_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('description', sa.String(), nullable=False),
+    sa.Column('merchant', sa.String(), nullable=True),
+    sa.Column('transaction_type', sa.String(), nullable=False),
+    sa.Column('transaction_date', sa.DateTime(), nullable=False),
+    sa.Column('tags', postgresql.ARRAY(sa.String()), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_transactions_archive_user_date_id', 'transactions_archive', ['user_id', 'transaction_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    # Bring archived rows back before dropping the table
+    op.execute(
+        """
+        INSERT INTO transactions (id, user_id, account_id, category_id, amount, description, merchant,
+                                  transaction_type, transaction_date, tags, notes, created_at, updated_at)
+        SELECT id, user_id, account_id, category_id, amount, description, merchant,
+               transaction_type, transaction_date, tags, notes, created_at, updated_at
+        FROM transactions_archive
+        """
+    )
+    op.drop_index('ix_transactions_archive_user_date_id', table_name='transactions_archive')
+    op.drop_table('transactions_archive')
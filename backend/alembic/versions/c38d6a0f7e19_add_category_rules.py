@@ -0,0 +1,47 @@
+"""Add category_rules for automatic categorization
+
+Revision ID: c38d6a0f7e19
+Revises: b61e3f9d2a47
+Create Date: 2026-03-02 11:06:51.420873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c38d6a0f7e19'
+down_revision: Union[str, None] = 'b61e3f9d2a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('category_rules',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('transaction_type', sa.String(), nullable=False),
+    sa.Column('pattern', sa.String(), nullable=False),
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_category_rules_id'), 'category_rules', ['id'], unique=False)
+    op.create_index(op.f('ix_category_rules_user_id'), 'category_rules', ['user_id'], unique=False)
+    op.create_index('uq_category_rules_user_type_pattern', 'category_rules', ['user_id', 'transaction_type', 'pattern'], unique=True, postgresql_where=sa.text('user_id IS NOT NULL'))
+    op.create_index('uq_category_rules_system_type_pattern', 'category_rules', ['transaction_type', 'pattern'], unique=True, postgresql_where=sa.text('user_id IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_category_rules_system_type_pattern', table_name='category_rules', postgresql_where=sa.text('user_id IS NULL'))
+    op.drop_index('uq_category_rules_user_type_pattern', table_name='category_rules', postgresql_where=sa.text('user_id IS NOT NULL'))
+    op.drop_index(op.f('ix_category_rules_user_id'), table_name='category_rules')
+    op.drop_index(op.f('ix_category_rules_id'), table_name='category_rules')
+    op.drop_table('category_rules')
@@ -0,0 +1,51 @@
+"""Add composite and covering indexes for per-user hot queries
+
+Revision ID: c7d13e9a5f20
+Revises: 8b5e0d2f6a41
+Create Date: 2026-01-26 14:05:51.880412
+
+Indexes are built with CREATE INDEX CONCURRENTLY outside the migration
+transaction, so writes to the tables are not blocked while they build.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d13e9a5f20'
+down_revision: Union[str, None] = '8b5e0d2f6a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # Newest-first listing, keyset paging, recent transactions
+    ('ix_transactions_user_date_id', 'transactions', ['user_id', 'transaction_date', 'id'],
+     {'postgresql_include': ['amount', 'transaction_type', 'category_id', 'account_id']}),
+    # Listing filtered by category or account
+    ('ix_transactions_user_category_date_id', 'transactions', ['user_id', 'category_id', 'transaction_date', 'id'], {}),
+    ('ix_transactions_user_account_date_id', 'transactions', ['user_id', 'account_id', 'transaction_date', 'id'], {}),
+    # Rollup range sums and category breakdowns by type
+    ('ix_daily_spending_rollups_user_type_day', 'daily_spending_rollups', ['user_id', 'transaction_type', 'day'],
+     {'postgresql_include': ['category_id', 'total_amount', 'transaction_count']}),
+    # Budget counter maintenance joins on (user_id, category_id)
+    ('ix_budgets_user_category', 'budgets', ['user_id', 'category_id'], {}),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True, **kwargs
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,176 @@
+"""Partition transactions by month on transaction_date
+
+Revision ID: d4f8a2c6e0b5
+Revises: a93d5e17c4b8
+Create Date: 2026-02-16 10:31:44.902517
+
+The table is rebuilt as a range-partitioned table with one partition per
+month plus a default partition for out-of-range dates. The primary key
+becomes (id, transaction_date), since PostgreSQL requires the partition key
+in every unique constraint; ids keep coming from transactions_id_seq.
+
+create_transaction_partitions(from_month, months_ahead) creates any
+missing monthly partitions up to months_ahead months from now, moving rows
+that already landed in the default partition. It is called here for the
+existing history and afterwards by scripts/transaction_partitions.py.
+
+The rebuild copies every row and holds an exclusive lock on transactions
+for its duration; run it in a maintenance window.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f8a2c6e0b5'
+down_revision: Union[str, None] = 'a93d5e17c4b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PARTITIONS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, account_id, category_id, amount, description, merchant, "
+    "transaction_type, transaction_date, tags, notes, created_at, updated_at"
+)
+
+TABLE_BODY = """
+    id INTEGER NOT NULL DEFAULT nextval('transactions_id_seq'),
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    account_id INTEGER NOT NULL REFERENCES accounts (id),
+    category_id INTEGER REFERENCES categories (id),
+    amount NUMERIC(15, 2) NOT NULL,
+    description VARCHAR NOT NULL,
+    merchant VARCHAR,
+    transaction_type VARCHAR NOT NULL,
+    transaction_date TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    tags VARCHAR[],
+    notes TEXT,
+    created_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(description, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(merchant, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(notes, '')), 'B')
+    ) STORED,
+    search_text TEXT GENERATED ALWAYS AS (
+        lower(coalesce(description, '') || ' ' || coalesce(merchant, '') || ' ' || coalesce(notes, ''))
+    ) STORED
+"""
+
+CREATE_PARTITIONS_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION create_transaction_partitions(from_month DATE, months_ahead INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_month)::date;
+    last_month DATE := (date_trunc('month', now()) + make_interval(months => months_ahead))::date;
+    month_end DATE;
+    partition_name TEXT;
+    has_default_rows BOOLEAN;
+    created INTEGER := 0;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        month_end := (month_start + INTERVAL '1 month')::date;
+        partition_name := 'transactions_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM');
+
+        IF to_regclass(partition_name) IS NULL THEN
+            SELECT EXISTS (
+                SELECT 1 FROM transactions_default
+                WHERE transaction_date >= month_start AND transaction_date < month_end
+            ) INTO has_default_rows;
+
+            IF has_default_rows THEN
+                -- A new partition may not overlap rows held by the default partition
+                EXECUTE format(
+                    'CREATE TEMP TABLE transactions_moved AS SELECT {COLUMNS} FROM transactions_default '
+                    'WHERE transaction_date >= %L AND transaction_date < %L',
+                    month_start, month_end
+                );
+                DELETE FROM transactions_default
+                    WHERE transaction_date >= month_start AND transaction_date < month_end;
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, month_end
+            );
+
+            IF has_default_rows THEN
+                EXECUTE 'INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_moved';
+                DROP TABLE transactions_moved;
+            END IF;
+            created := created + 1;
+        END IF;
+
+        month_start := month_end;
+    END LOOP;
+    RETURN created;
+END;
+$$
+"""
+
+INDEXES = [
+    (op.f('ix_transactions_account_id'), ['account_id'], {}),
+    (op.f('ix_transactions_category_id'), ['category_id'], {}),
+    (op.f('ix_transactions_id'), ['id'], {}),
+    (op.f('ix_transactions_transaction_date'), ['transaction_date'], {}),
+    (op.f('ix_transactions_user_id'), ['user_id'], {}),
+    ('ix_transactions_user_date_id', ['user_id', 'transaction_date', 'id'],
+     {'postgresql_include': ['amount', 'transaction_type', 'category_id', 'account_id']}),
+    ('ix_transactions_user_category_date_id', ['user_id', 'category_id', 'transaction_date', 'id'], {}),
+    ('ix_transactions_user_account_date_id', ['user_id', 'account_id', 'transaction_date', 'id'], {}),
+    ('ix_transactions_user_search_vector', ['user_id', 'search_vector'], {'postgresql_using': 'gin'}),
+    ('ix_transactions_user_search_text_trgm', ['user_id', 'search_text'],
+     {'postgresql_using': 'gin', 'postgresql_ops': {'search_text': 'gin_trgm_ops'}}),
+    ('ix_transactions_user_tags', ['user_id', 'tags'], {'postgresql_using': 'gin'}),
+]
+
+
+def create_indexes() -> None:
+    for name, columns, kwargs in INDEXES:
+        op.create_index(name, 'transactions', columns, unique=False, **kwargs)
+
+
+def upgrade() -> None:
+    # Keep the id sequence alive when the old table is dropped
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE transactions RENAME TO transactions_legacy")
+
+    op.execute(f"CREATE TABLE transactions ({TABLE_BODY}) PARTITION BY RANGE (transaction_date)")
+    op.execute("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT")
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(
+        f"""
+        SELECT create_transaction_partitions(
+            COALESCE((SELECT MIN(transaction_date) FROM transactions_legacy)::date, CURRENT_DATE),
+            {PARTITIONS_AHEAD}
+        )
+        """
+    )
+
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_legacy")
+    op.execute("DROP TABLE transactions_legacy")
+
+    op.execute("ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id, transaction_date)")
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE transactions RENAME TO transactions_partitioned")
+
+    op.execute(f"CREATE TABLE transactions ({TABLE_BODY})")
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_partitioned")
+    op.execute("DROP TABLE transactions_partitioned")
+    op.execute("DROP FUNCTION create_transaction_partitions(DATE, INTEGER)")
+
+    op.execute("ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id)")
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    create_indexes()
@@ -0,0 +1,67 @@
+"""Add full-text and trigram search over transactions
+
+Revision ID: e2a84f6b1c93
+Revises: c7d13e9a5f20
+Create Date: 2026-02-02 11:27:40.615904
+
+Adds two stored generated columns (a weighted tsvector and a lowercased
+search text) and GIN indexes over them. Adding a stored generated column
+rewrites the transactions table; the indexes are then built concurrently.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a84f6b1c93'
+down_revision: Union[str, None] = 'c7d13e9a5f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(merchant, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'B')"
+)
+SEARCH_TEXT = (
+    "lower(coalesce(description, '') || ' ' || coalesce(merchant, '') || ' ' || coalesce(notes, ''))"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+
+    op.add_column('transactions', sa.Column(
+        'search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True
+    ))
+    op.add_column('transactions', sa.Column(
+        'search_text', sa.Text(), sa.Computed(SEARCH_TEXT, persisted=True), nullable=True
+    ))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transactions_user_search_vector', 'transactions', ['user_id', 'search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_transactions_user_search_text_trgm', 'transactions', ['user_id', 'search_text'],
+            unique=False, postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_transactions_user_search_text_trgm', table_name='transactions',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transactions_user_search_vector', table_name='transactions',
+                      postgresql_concurrently=True, if_exists=True)
+
+    op.drop_column('transactions', 'search_text')
+    op.drop_column('transactions', 'search_vector')
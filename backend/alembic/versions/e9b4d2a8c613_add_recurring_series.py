@@ -0,0 +1,55 @@
+"""Add recurring_series for detected subscriptions and bills
+
+Revision ID: e9b4d2a8c613
+Revises: c38d6a0f7e19
+Create Date: 2026-03-09 09:41:27.615304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b4d2a8c613'
+down_revision: Union[str, None] = 'c38d6a0f7e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('recurring_series',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=True),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('merchant_key', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('transaction_type', sa.String(), nullable=False),
+    sa.Column('frequency', sa.String(), nullable=False),
+    sa.Column('interval_days', sa.Integer(), nullable=False),
+    sa.Column('average_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('last_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('amount_variation', sa.Numeric(precision=8, scale=4), nullable=False),
+    sa.Column('occurrences', sa.Integer(), nullable=False),
+    sa.Column('first_date', sa.Date(), nullable=False),
+    sa.Column('last_date', sa.Date(), nullable=False),
+    sa.Column('next_date', sa.Date(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('detected_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recurring_series_id'), 'recurring_series', ['id'], unique=False)
+    op.create_index('uq_recurring_series_user_type_key', 'recurring_series', ['user_id', 'transaction_type', 'merchant_key'], unique=True)
+    op.create_index('ix_recurring_series_user_next_date', 'recurring_series', ['user_id', 'next_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recurring_series_user_next_date', table_name='recurring_series')
+    op.drop_index('uq_recurring_series_user_type_key', table_name='recurring_series')
+    op.drop_index(op.f('ix_recurring_series_id'), table_name='recurring_series')
+    op.drop_table('recurring_series')
@@ -0,0 +1,34 @@
+"""Add GIN index on transaction tags
+
+Revision ID: f5c0b7d94a12
+Revises: e2a84f6b1c93
+Create Date: 2026-02-05 16:08:22.347190
+
+(user_id, tags) relies on btree_gin, created in e2a84f6b1c93.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c0b7d94a12'
+down_revision: Union[str, None] = 'e2a84f6b1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_transactions_user_tags', 'transactions', ['user_id', 'tags'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_transactions_user_tags', table_name='transactions',
+                      postgresql_concurrently=True, if_exists=True)
@@ -1,11 +1,14 @@
-from typing import Generator
+from typing import AsyncGenerator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.auth_cache import auth_cache
 from app.core.config import settings
-from app.core.database import SessionLocal
+from app.core.database import AsyncSessionLocal, get_async_db, get_db  # noqa: F401 - session dependencies
+from app.core.read_routing import read_router
 from app.crud import user as crud_user
 from app.models.user import User
 from app.schemas.token import TokenPayload
@@ -13,17 +16,41 @@ from app.schemas.token import TokenPayload
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
-def get_db() -> Generator:
-    """Get database session dependency."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def get_user_from_token(db: Session, token: str, *, use_cache: bool = True) -> Optional[User]:
+    """Resolve a bearer token to its user, or None when it is invalid.
+
+    Verified tokens and loaded users are cached (see app.core.auth_cache),
+    so a warm request neither decodes the JWT nor queries the users table:
+    the cached detached user is re-attached to this session with
+    merge(load=False), which copies its state without a SELECT.
+    """
+    user_id = auth_cache.get_user_id(token) if use_cache else None
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            if payload.get("sub") is None:
+                return None
+            user_id = int(TokenPayload(sub=payload["sub"]).sub)
+        except (JWTError, ValueError):
+            return None
+        if use_cache:
+            auth_cache.set_token(token, user_id, payload.get("exp"))
+
+    cached = auth_cache.get_user(user_id) if use_cache else None
+    if cached is not None:
+        return db.merge(cached, load=False)
+
+    version = auth_cache.user_version(user_id) if use_cache else None
+    user = crud_user.get(db, id=user_id)
+    if user is None or not use_cache:
+        return user
+    db.expunge(user)
+    auth_cache.set_user(user, version)
+    return db.merge(user, load=False)
 
 
 async def get_current_user(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token: str = Depends(oauth2_scheme)
 ) -> User:
     """Get current authenticated user from JWT token."""
@@ -33,19 +60,12 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenPayload(sub=user_id)
-    except JWTError:
-        raise credentials_exception
-
-    user = crud_user.get(db, id=int(token_data.sub))
+    user = await db.run_sync(get_user_from_token, token)
     if user is None:
         raise credentials_exception
 
+    # Commits on this session start the user's read-your-writes window
+    db.info["user_id"] = user.id
     return user
 
 
@@ -56,3 +76,32 @@ async def get_current_active_user(
     if not crud_user.is_active(current_user):
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def get_current_active_superuser(
+    current_user: User = Depends(get_current_active_user),
+) -> User:
+    """Get current active user, requiring superuser rights."""
+    if not crud_user.is_superuser(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough privileges",
+        )
+    return current_user
+
+
+async def get_read_db(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints: the read replica when it is safe to use.
+
+    Falls back to the request's primary session when there is no replica,
+    the user wrote recently or the replica lags (see app.core.read_routing).
+    """
+    replica = await read_router.read_engine(current_user.id)
+    if replica is None:
+        yield db
+        return
+    async with AsyncSessionLocal(bind=replica) as replica_db:
+        yield replica_db
@@ -1,52 +1,58 @@
-from typing import Any, List
+from typing import Any, List, Literal, Optional
+from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud
+from app.crud import aio
 from app.api import deps
+from app.core.cache import response_cache
 from app.models.user import User
-from app.schemas.account import Account, AccountCreate, AccountUpdate
+from app.crud.balance_ledger import series_days
+from app.schemas.account import Account, AccountCreate, AccountUpdate, BalancePoint
 
 router = APIRouter()
 
+MAX_SERIES_POINTS = 1000
+
 
 @router.get("/", response_model=List[Account])
-def read_accounts(
-    db: Session = Depends(deps.get_db),
+async def read_accounts(
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """Get all accounts for current user."""
-    accounts = crud.account.get_by_user(
+    accounts = await aio.account.get_by_user(
         db, user_id=current_user.id, skip=skip, limit=limit
     )
     return accounts
 
 
 @router.post("/", response_model=Account, status_code=status.HTTP_201_CREATED)
-def create_account(
+async def create_account(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     account_in: AccountCreate,
 ) -> Any:
     """Create new account."""
-    account = crud.account.create_with_user(
+    account = await aio.account.create_with_user(
         db, obj_in=account_in, user_id=current_user.id
     )
+    response_cache.bump_version(current_user.id)
     return account
 
 
 @router.get("/{account_id}", response_model=Account)
-def read_account(
+async def read_account(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     account_id: int,
 ) -> Any:
     """Get account by ID."""
-    account = crud.account.get_user_account(
+    account = await aio.account.get_user_account(
         db, account_id=account_id, user_id=current_user.id
     )
     if not account:
@@ -57,16 +63,63 @@ def read_account(
     return account
 
 
+@router.get("/{account_id}/balance-history", response_model=List[BalancePoint])
+async def read_balance_history(
+    *,
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    account_id: int,
+    resolution: Literal["daily", "weekly", "monthly"] = "daily",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> Any:
+    """End-of-day balance series of an account (default: the last year)."""
+    account = await aio.account.get_user_account(
+        db, account_id=account_id, user_id=current_user.id
+    )
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Account not found",
+        )
+
+    end_date = end_date or datetime.utcnow().date()
+    start_date = start_date or end_date - timedelta(days=365)
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date",
+        )
+    days = series_days(start_date, end_date, resolution)
+    if len(days) > MAX_SERIES_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range too large: at most {MAX_SERIES_POINTS} points per request",
+        )
+
+    async def compute_series():
+        return [
+            {"day": day, "balance": balance}
+            for day, balance in await aio.balance_ledger.get_series(db, account_id=account_id, days=days)
+        ]
+
+    return await response_cache.get_or_compute_async(
+        f"balance_history:{account_id}:{start_date}:{end_date}:{resolution}",
+        current_user.id,
+        compute_series,
+    )
+
+
 @router.put("/{account_id}", response_model=Account)
-def update_account(
+async def update_account(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     account_id: int,
     account_in: AccountUpdate,
 ) -> Any:
     """Update account."""
-    account = crud.account.get_user_account(
+    account = await aio.account.get_user_account(
         db, account_id=account_id, user_id=current_user.id
     )
     if not account:
@@ -75,19 +128,20 @@ def update_account(
             detail="Account not found",
         )
 
-    account = crud.account.update(db, db_obj=account, obj_in=account_in)
+    account = await aio.account.update(db, db_obj=account, obj_in=account_in)
+    response_cache.bump_version(current_user.id)
     return account
 
 
 @router.delete("/{account_id}")
-def delete_account(
+async def delete_account(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     account_id: int,
 ) -> Any:
     """Delete account."""
-    account = crud.account.get_user_account(
+    account = await aio.account.get_user_account(
         db, account_id=account_id, user_id=current_user.id
     )
     if not account:
@@ -96,5 +150,6 @@ def delete_account(
             detail="Account not found",
         )
 
-    crud.account.delete(db, id=account_id)
+    await aio.account.delete(db, id=account_id)
+    response_cache.bump_version(current_user.id)
     return {"message": "Account deleted successfully"}
@@ -2,12 +2,14 @@ from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
+from app.crud import aio
 from app.api import deps
 from app.core import security
 from app.core.config import settings
+from app.core.password_pool import password_hasher
 from app.schemas.token import Token
 from app.schemas.user import User, UserCreate
 
@@ -15,14 +17,24 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-def login(
-    db: Session = Depends(deps.get_db),
+async def login(
+    db: AsyncSession = Depends(deps.get_async_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
-    """OAuth2 compatible token login, get an access token for future requests."""
-    user = crud.user.authenticate(
-        db, email=form_data.username, password=form_data.password
-    )
+    """OAuth2 compatible token login, get an access token for future requests.
+
+    The bcrypt check runs in the password process pool and is awaited on
+    the event loop; hashes made with an outdated cost are replaced on success.
+    """
+    user = await aio.user.get_by_email(db, email=form_data.username)
+    if user:
+        valid, new_hash = await password_hasher.verify(form_data.password, user.hashed_password)
+        if not valid:
+            user = None
+        elif new_hash:
+            user = await aio.user.update_password_hash(
+                db, db_obj=user, hashed_password=new_hash
+            )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -46,25 +58,26 @@ def login(
 
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     user_in: UserCreate,
 ) -> Any:
     """Register a new user."""
-    user = crud.user.get_by_email(db, email=user_in.email)
+    user = await aio.user.get_by_email(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A user with this email already exists.",
         )
 
-    user = crud.user.create(db, obj_in=user_in)
+    hashed_password = await password_hasher.hash(user_in.password)
+    user = await aio.user.create(db, obj_in=user_in, hashed_password=hashed_password)
     return user
 
 
 @router.get("/me", response_model=User)
-def read_current_user(
+async def read_current_user(
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Get current user."""
@@ -1,14 +1,13 @@
 from typing import Any, List
-from datetime import datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud
+from app.crud import aio
 from app.api import deps
+from app.core.cache import response_cache
 from app.models.user import User
-from app.models.transaction import Transaction
 from app.schemas.budget import Budget, BudgetCreate, BudgetUpdate
 from pydantic import BaseModel
 
@@ -34,27 +33,8 @@ class BudgetWithSpending(BaseModel):
         from_attributes = True
 
 
-def calculate_budget_spending(db: Session, budget: Budget, user_id: int) -> BudgetWithSpending:
-    """Calculate spending for a budget period."""
-    # Calculate period end date
-    if budget.period == "monthly":
-        end_date = budget.start_date + timedelta(days=30)
-    elif budget.period == "yearly":
-        end_date = budget.start_date + timedelta(days=365)
-    else:
-        end_date = datetime.utcnow()
-
-    # CRITICAL: Server-side calculation of spending
-    spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == user_id,
-            Transaction.category_id == budget.category_id,
-            Transaction.transaction_type == "expense",
-            Transaction.transaction_date >= budget.start_date,
-            Transaction.transaction_date <= end_date,
-        )
-    ).scalar() or Decimal("0.00")
-
+def build_budget_with_spending(budget: Budget, spent: Decimal) -> BudgetWithSpending:
+    """Derive remaining, percentage and status for a budget's spent amount."""
     remaining = budget.amount - spent
     percentage = float((spent / budget.amount) * 100) if budget.amount > 0 else 0
 
@@ -83,31 +63,42 @@ def calculate_budget_spending(db: Session, budget: Budget, user_id: int) -> Budg
     )
 
 
+def calculate_budgets_spending(budgets: List[Budget]) -> List[BudgetWithSpending]:
+    """Build spending views for many budgets from their materialized counters."""
+    # CRITICAL: spent is maintained server-side on every transaction write
+    return [build_budget_with_spending(budget, budget.spent) for budget in budgets]
+
+
+def calculate_budget_spending(budget: Budget) -> BudgetWithSpending:
+    """Calculate spending for a budget period."""
+    return calculate_budgets_spending([budget])[0]
+
+
 @router.get("/", response_model=List[BudgetWithSpending])
-def read_budgets(
-    db: Session = Depends(deps.get_db),
+async def read_budgets(
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """Get all budgets for current user with spending calculation."""
-    budgets = crud.budget.get_by_user(
+    budgets = await aio.budget.get_by_user(
         db, user_id=current_user.id, skip=skip, limit=limit
     )
 
-    return [calculate_budget_spending(db, budget, current_user.id) for budget in budgets]
+    return calculate_budgets_spending(budgets)
 
 
 @router.post("/", response_model=Budget, status_code=status.HTTP_201_CREATED)
-def create_budget(
+async def create_budget(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     budget_in: BudgetCreate,
 ) -> Any:
     """Create new budget."""
     # Verify category exists and user has access
-    category = crud.category.get_user_category(
+    category = await aio.category.get_user_category(
         db, category_id=budget_in.category_id, user_id=current_user.id
     )
     if not category:
@@ -117,7 +108,7 @@ def create_budget(
         )
 
     # Check if budget already exists for this category
-    existing_budget = crud.budget.get_by_category(
+    existing_budget = await aio.budget.get_by_category(
         db, category_id=budget_in.category_id, user_id=current_user.id
     )
     if existing_budget:
@@ -126,21 +117,22 @@ def create_budget(
             detail=f"Budget already exists for category '{category.name}'. Please update the existing budget instead.",
         )
 
-    budget = crud.budget.create_with_user(
+    budget = await aio.budget.create_with_user(
         db, obj_in=budget_in, user_id=current_user.id
     )
+    response_cache.bump_version(current_user.id)
     return budget
 
 
 @router.get("/{budget_id}", response_model=BudgetWithSpending)
-def read_budget(
+async def read_budget(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     budget_id: int,
 ) -> Any:
     """Get budget by ID with spending calculation."""
-    budget = crud.budget.get_user_budget(
+    budget = await aio.budget.get_user_budget(
         db, budget_id=budget_id, user_id=current_user.id
     )
     if not budget:
@@ -149,19 +141,19 @@ def read_budget(
             detail="Budget not found",
         )
 
-    return calculate_budget_spending(db, budget, current_user.id)
+    return calculate_budget_spending(budget)
 
 
 @router.put("/{budget_id}", response_model=Budget)
-def update_budget(
+async def update_budget(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     budget_id: int,
     budget_in: BudgetUpdate,
 ) -> Any:
     """Update budget."""
-    budget = crud.budget.get_user_budget(
+    budget = await aio.budget.get_user_budget(
         db, budget_id=budget_id, user_id=current_user.id
     )
     if not budget:
@@ -170,19 +162,20 @@ def update_budget(
             detail="Budget not found",
         )
 
-    budget = crud.budget.update(db, db_obj=budget, obj_in=budget_in)
+    budget = await aio.budget.update(db, db_obj=budget, obj_in=budget_in)
+    response_cache.bump_version(current_user.id)
     return budget
 
 
 @router.delete("/{budget_id}")
-def delete_budget(
+async def delete_budget(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     budget_id: int,
 ) -> Any:
     """Delete budget."""
-    budget = crud.budget.get_user_budget(
+    budget = await aio.budget.get_user_budget(
         db, budget_id=budget_id, user_id=current_user.id
     )
     if not budget:
@@ -191,5 +184,6 @@ def delete_budget(
             detail="Budget not found",
         )
 
-    crud.budget.delete(db, id=budget_id)
+    await aio.budget.delete(db, id=budget_id)
+    response_cache.bump_version(current_user.id)
     return {"message": "Budget deleted successfully"}
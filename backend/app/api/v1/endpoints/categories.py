@@ -1,24 +1,129 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud
+from app.crud import aio
 from app.api import deps
+from app.core.cache import response_cache
+from app.crud.category_rule import RULE_TYPES, normalize_text
 from app.models.user import User
-from app.schemas.category import Category
+from app.schemas.category import Category, CategoryRule, CategoryRuleCreate
+from app.services.categorization import CategorizationService
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[Category])
-def read_categories(
-    db: Session = Depends(deps.get_db),
+async def read_categories(
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """Get all categories for current user (system + user-specific)."""
-    categories = crud.category.get_by_user(
+    categories = await aio.category.get_by_user(
         db, user_id=current_user.id, skip=skip, limit=limit
     )
     return categories
+
+
+@router.get("/rules", response_model=List[CategoryRule])
+async def read_category_rules(
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    skip: int = 0,
+    limit: int = 100,
+) -> Any:
+    """Get all categorization rules for current user (system + user-specific)."""
+    return await aio.category_rule.get_by_user(
+        db, user_id=current_user.id, skip=skip, limit=limit
+    )
+
+
+@router.post("/rules", response_model=CategoryRule, status_code=status.HTTP_201_CREATED)
+async def create_category_rule(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    rule_in: CategoryRuleCreate,
+) -> Any:
+    """Create a rule assigning a category to matching merchants and descriptions.
+
+    A rule with the same words replaces the previous one.
+    """
+    category = await aio.category.get_user_category(
+        db, category_id=rule_in.category_id, user_id=current_user.id
+    )
+    if not category or category.category_type not in RULE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Category not found",
+        )
+
+    pattern = normalize_text(rule_in.pattern)
+    if not pattern:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pattern must contain at least one word without digits",
+        )
+
+    rule = await aio.category_rule.create_with_user(
+        db,
+        pattern=pattern,
+        category_id=category.id,
+        transaction_type=category.category_type,
+        user_id=current_user.id,
+    )
+    CategorizationService.invalidate(current_user.id)
+    return rule
+
+
+@router.delete("/rules/{rule_id}")
+async def delete_category_rule(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    rule_id: int,
+) -> Any:
+    """Delete one of the current user's rules."""
+    rule = await aio.category_rule.get_user_rule(db, rule_id=rule_id, user_id=current_user.id)
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Rule not found",
+        )
+
+    await aio.category_rule.delete(db, id=rule_id)
+    CategorizationService.invalidate(current_user.id)
+    return {"message": "Rule deleted successfully"}
+
+
+@router.post("/rules/learn")
+async def learn_category_rules(
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Learn rules from how the current user has categorized past transactions."""
+    learned = await db.run_sync(CategorizationService.learn_from_history, user_id=current_user.id)
+    return {"learned": learned}
+
+
+@router.post("/recategorize")
+async def recategorize_transactions(
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    only_uncategorized: bool = True,
+) -> Any:
+    """Apply the current rules to the user's whole transaction history.
+
+    By default only uncategorized transactions are touched; with
+    only_uncategorized=false every transaction matching a rule is updated.
+    """
+    updated = await db.run_sync(
+        CategorizationService.recategorize,
+        user_id=current_user.id,
+        only_uncategorized=only_uncategorized,
+    )
+    if updated:
+        response_cache.bump_version(current_user.id)
+    return {"updated": updated}
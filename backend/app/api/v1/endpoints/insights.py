@@ -1,18 +1,21 @@
 """AI Insights API endpoints."""
 from typing import Any, List
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.cache import response_cache
+from app.core.read_routing import read_router
 from app.models.user import User
+from app.schemas.recurring import RecurringSeries, UpcomingCharge
 from app.services.ai_insights import AIInsightsService
+from app.services.recurring import RecurringDetectionService
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[dict])
-def get_financial_insights(
-    db: Session = Depends(deps.get_db),
+async def get_financial_insights(
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
@@ -21,13 +24,48 @@ def get_financial_insights(
     Returns:
         List of insight objects with type, title, message, and icon.
     """
-    # Analyze user's spending patterns
-    financial_data = AIInsightsService.analyze_spending_patterns(
-        db=db,
-        user_id=current_user.id
-    )
+    async def compute_insights() -> List[dict]:
+        # Analyze user's spending patterns
+        replica = await read_router.read_engine(current_user.id)
+        financial_data = await AIInsightsService.analyze_spending_patterns_async(
+            user_id=current_user.id, bind=replica
+        )
 
-    # Generate insights based on the analysis
-    insights = AIInsightsService.generate_insights(financial_data)
+        # Generate insights based on the analysis
+        return AIInsightsService.generate_insights(financial_data)
 
-    return insights
+    return await response_cache.get_or_compute_async("insights", current_user.id, compute_insights)
+
+
+@router.get("/recurring", response_model=List[RecurringSeries])
+async def get_recurring_series(
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Detected subscriptions, bills and other recurring transactions.
+
+    Returns the stored series; POST /recurring/refresh re-runs detection.
+    """
+    return await RecurringDetectionService.get_series_async(db, current_user.id)
+
+
+@router.post("/recurring/refresh", response_model=List[RecurringSeries])
+async def refresh_recurring_series(
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Re-run recurring detection over the full transaction history."""
+    return await RecurringDetectionService.refresh_async(db, current_user.id)
+
+
+@router.get("/upcoming", response_model=List[UpcomingCharge])
+async def get_upcoming_charges(
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    days: int = Query(30, ge=1, le=366),
+) -> Any:
+    """Predicted recurring charges and income over the next `days` days.
+
+    Occurrences that are due but not yet seen are included as overdue.
+    """
+    return await RecurringDetectionService.get_upcoming_async(db, current_user.id, days=days)
@@ -1,10 +1,11 @@
 from typing import Any, List
 from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud
+from app.crud import aio
 from app.api import deps
+from app.core.cache import response_cache
 from app.models.user import User
 from app.schemas.investment import Investment, InvestmentCreate, InvestmentUpdate
 from pydantic import BaseModel
@@ -71,28 +72,9 @@ def calculate_investment_roi(investment: Investment) -> InvestmentWithROI:
     )
 
 
-@router.get("/", response_model=List[InvestmentWithROI])
-def read_investments(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_user),
-    skip: int = 0,
-    limit: int = 100,
-) -> Any:
-    """Get all investments for current user with ROI calculation."""
-    investments = crud.investment.get_by_user(
-        db, user_id=current_user.id, skip=skip, limit=limit
-    )
-
-    return [calculate_investment_roi(inv) for inv in investments]
-
-
-@router.get("/summary", response_model=PortfolioSummary)
-def get_portfolio_summary(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_user),
-) -> Any:
-    """Get portfolio summary with total ROI."""
-    investments = crud.investment.get_by_user(db, user_id=current_user.id)
+async def build_portfolio_summary(db: AsyncSession, user_id: int) -> PortfolioSummary:
+    """Aggregate a user's holdings into a portfolio summary."""
+    investments = await aio.investment.get_by_user(db, user_id=user_id)
 
     total_invested = Decimal("0.00")
     current_value = Decimal("0.00")
@@ -126,29 +108,58 @@ def get_portfolio_summary(
     )
 
 
+@router.get("/", response_model=List[InvestmentWithROI])
+async def read_investments(
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    skip: int = 0,
+    limit: int = 100,
+) -> Any:
+    """Get all investments for current user with ROI calculation."""
+    investments = await aio.investment.get_by_user(
+        db, user_id=current_user.id, skip=skip, limit=limit
+    )
+
+    return [calculate_investment_roi(inv) for inv in investments]
+
+
+@router.get("/summary", response_model=PortfolioSummary)
+async def get_portfolio_summary(
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Get portfolio summary with total ROI."""
+    return await response_cache.get_or_compute_async(
+        "portfolio_summary",
+        current_user.id,
+        lambda: build_portfolio_summary(db, current_user.id),
+    )
+
+
 @router.post("/", response_model=Investment, status_code=status.HTTP_201_CREATED)
-def create_investment(
+async def create_investment(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     investment_in: InvestmentCreate,
 ) -> Any:
     """Create new investment."""
-    investment = crud.investment.create_with_user(
+    investment = await aio.investment.create_with_user(
         db, obj_in=investment_in, user_id=current_user.id
     )
+    response_cache.bump_version(current_user.id)
     return investment
 
 
 @router.get("/{investment_id}", response_model=InvestmentWithROI)
-def read_investment(
+async def read_investment(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     investment_id: int,
 ) -> Any:
     """Get investment by ID with ROI calculation."""
-    investment = crud.investment.get_user_investment(
+    investment = await aio.investment.get_user_investment(
         db, investment_id=investment_id, user_id=current_user.id
     )
     if not investment:
@@ -161,15 +172,15 @@ def read_investment(
 
 
 @router.put("/{investment_id}", response_model=Investment)
-def update_investment(
+async def update_investment(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     investment_id: int,
     investment_in: InvestmentUpdate,
 ) -> Any:
     """Update investment."""
-    investment = crud.investment.get_user_investment(
+    investment = await aio.investment.get_user_investment(
         db, investment_id=investment_id, user_id=current_user.id
     )
     if not investment:
@@ -178,19 +189,20 @@ def update_investment(
             detail="Investment not found",
         )
 
-    investment = crud.investment.update(db, db_obj=investment, obj_in=investment_in)
+    investment = await aio.investment.update(db, db_obj=investment, obj_in=investment_in)
+    response_cache.bump_version(current_user.id)
     return investment
 
 
 @router.delete("/{investment_id}")
-def delete_investment(
+async def delete_investment(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     investment_id: int,
 ) -> Any:
     """Delete investment."""
-    investment = crud.investment.get_user_investment(
+    investment = await aio.investment.get_user_investment(
         db, investment_id=investment_id, user_id=current_user.id
     )
     if not investment:
@@ -199,5 +211,6 @@ def delete_investment(
             detail="Investment not found",
         )
 
-    crud.investment.delete(db, id=investment_id)
+    await aio.investment.delete(db, id=investment_id)
+    response_cache.bump_version(current_user.id)
     return {"message": "Investment deleted successfully"}
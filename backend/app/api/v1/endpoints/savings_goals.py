@@ -1,10 +1,11 @@
 from typing import Any, List
 from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud
+from app.crud import aio
 from app.api import deps
+from app.core.cache import response_cache
 from app.models.user import User
 from app.schemas.savings_goal import SavingsGoal, SavingsGoalCreate, SavingsGoalUpdate
 from pydantic import BaseModel
@@ -30,14 +31,14 @@ class SavingsGoalWithProgress(BaseModel):
 
 
 @router.get("/", response_model=List[SavingsGoalWithProgress])
-def read_savings_goals(
-    db: Session = Depends(deps.get_db),
+async def read_savings_goals(
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """Get all savings goals for current user with progress calculation."""
-    goals = crud.savings_goal.get_by_user(
+    goals = await aio.savings_goal.get_by_user(
         db, user_id=current_user.id, skip=skip, limit=limit
     )
 
@@ -60,28 +61,29 @@ def read_savings_goals(
 
 
 @router.post("/", response_model=SavingsGoal, status_code=status.HTTP_201_CREATED)
-def create_savings_goal(
+async def create_savings_goal(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     goal_in: SavingsGoalCreate,
 ) -> Any:
     """Create new savings goal."""
-    goal = crud.savings_goal.create_with_user(
+    goal = await aio.savings_goal.create_with_user(
         db, obj_in=goal_in, user_id=current_user.id
     )
+    response_cache.bump_version(current_user.id)
     return goal
 
 
 @router.get("/{goal_id}", response_model=SavingsGoalWithProgress)
-def read_savings_goal(
+async def read_savings_goal(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     goal_id: int,
 ) -> Any:
     """Get savings goal by ID with progress calculation."""
-    goal = crud.savings_goal.get_user_goal(
+    goal = await aio.savings_goal.get_user_goal(
         db, goal_id=goal_id, user_id=current_user.id
     )
     if not goal:
@@ -106,15 +108,15 @@ def read_savings_goal(
 
 
 @router.put("/{goal_id}", response_model=SavingsGoal)
-def update_savings_goal(
+async def update_savings_goal(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     goal_id: int,
     goal_in: SavingsGoalUpdate,
 ) -> Any:
     """Update savings goal."""
-    goal = crud.savings_goal.get_user_goal(
+    goal = await aio.savings_goal.get_user_goal(
         db, goal_id=goal_id, user_id=current_user.id
     )
     if not goal:
@@ -123,19 +125,20 @@ def update_savings_goal(
             detail="Savings goal not found",
         )
 
-    goal = crud.savings_goal.update(db, db_obj=goal, obj_in=goal_in)
+    goal = await aio.savings_goal.update(db, db_obj=goal, obj_in=goal_in)
+    response_cache.bump_version(current_user.id)
     return goal
 
 
 @router.delete("/{goal_id}")
-def delete_savings_goal(
+async def delete_savings_goal(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     goal_id: int,
 ) -> Any:
     """Delete savings goal."""
-    goal = crud.savings_goal.get_user_goal(
+    goal = await aio.savings_goal.get_user_goal(
         db, goal_id=goal_id, user_id=current_user.id
     )
     if not goal:
@@ -144,5 +147,6 @@ def delete_savings_goal(
             detail="Savings goal not found",
         )
 
-    crud.savings_goal.delete(db, id=goal_id)
+    await aio.savings_goal.delete(db, id=goal_id)
+    response_cache.bump_version(current_user.id)
     return {"message": "Savings goal deleted successfully"}
@@ -1,29 +1,123 @@
-from typing import Any, List, Optional
+import base64
+import binascii
+import json
+import shutil
+import tempfile
+from typing import Any, List, Literal, Optional, Tuple
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from decimal import Decimal
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
+from app.crud import aio
 from app.api import deps
+from app.core.cache import response_cache
+from app.core.database import SessionLocal
 from app.models.user import User
-from app.schemas.transaction import Transaction, TransactionCreate, TransactionUpdate
+from app.schemas.transaction import (
+    DuplicateGroup,
+    TagTotal,
+    Transaction,
+    TransactionBatchRequest,
+    TransactionBatchResponse,
+    TransactionCreate,
+    TransactionUpdate,
+)
+from app.services.categorization import CategorizationService
+from app.services.recurring import RecurringDetectionService
+from app.services.transaction_export import EXPORT_FORMATS, MEDIA_TYPES, parquet_available, stream_export
+from app.services.transaction_import import (
+    DUPLICATE_MODES,
+    SUPPORTED_FORMATS,
+    TransactionImporter,
+    parse_csv,
+    parse_ofx,
+)
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Deeper pages must be fetched with the cursor; OFFSET cost grows with depth
+MAX_OFFSET = 10000
+DUPLICATE_OF_HEADER = "X-Duplicate-Of"
+
+
+def encode_token(data: dict) -> str:
+    """Encode a keyset position as an opaque, URL-safe token."""
+    raw = json.dumps(data)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_token(cursor: str) -> dict:
+    """Decode a token produced by encode_token."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor",
+    )
+
+
+def encode_cursor(transaction_date: datetime, transaction_id: int) -> str:
+    """Encode a (transaction_date, id) keyset position."""
+    return encode_token({"d": transaction_date.isoformat(), "i": transaction_id})
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a token produced by encode_cursor."""
+    try:
+        data = decode_token(cursor)
+        return datetime.fromisoformat(data["d"]), int(data["i"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise invalid_cursor()
+
+
+def encode_search_cursor(rank: float, transaction_id: int) -> str:
+    """Encode a (rank, id) keyset position of a search result."""
+    return encode_token({"r": rank, "i": transaction_id})
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """Decode a token produced by encode_search_cursor."""
+    try:
+        data = decode_token(cursor)
+        return float(data["r"]), int(data["i"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise invalid_cursor()
+
 
 @router.get("/", response_model=List[Transaction])
-def read_transactions(
-    db: Session = Depends(deps.get_db),
+async def read_transactions(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
-    skip: int = 0,
+    skip: int = Query(0, ge=0, le=MAX_OFFSET),
     limit: int = 100,
+    cursor: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     account_id: Optional[int] = None,
     category_id: Optional[int] = None,
+    tags: Optional[List[str]] = Query(None),
+    tags_match: Literal["any", "all"] = "any",
 ) -> Any:
-    """Get all transactions for current user with optional filters."""
-    transactions = crud.transaction.get_by_user(
+    """Get all transactions for current user with optional filters.
+
+    Repeat `tags` to filter by several tags; tags_match selects whether a
+    transaction needs any or all of them.
+
+    When a full page is returned, the X-Next-Cursor response header holds a
+    cursor for the next page. Passing it back as `cursor` pages by keyset
+    instead of offset, so deep pages stay fast and stable under inserts;
+    `skip` is capped at MAX_OFFSET rows.
+    """
+    transactions = await aio.transaction.get_by_user(
         db,
         user_id=current_user.id,
         skip=skip,
@@ -32,22 +126,100 @@ def read_transactions(
         end_date=end_date,
         account_id=account_id,
         category_id=category_id,
+        tags=tags,
+        tags_match=tags_match,
+        after=decode_cursor(cursor) if cursor else None,
     )
+
+    if transactions and len(transactions) == limit:
+        last = transactions[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.transaction_date, last.id)
+
     return transactions
 
 
+@router.get("/search", response_model=List[Transaction])
+async def search_transactions(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    q: str = Query(..., min_length=2, max_length=200),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    category_id: Optional[int] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+) -> Any:
+    """Search transactions by description, merchant and notes.
+
+    Matches full-text terms, substrings and misspellings, best match first.
+    When a full page is returned, X-Next-Cursor holds the cursor for the
+    next page.
+    """
+    results = await aio.transaction.search(
+        db,
+        user_id=current_user.id,
+        query=q,
+        limit=limit,
+        start_date=start_date,
+        end_date=end_date,
+        category_id=category_id,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        after=decode_search_cursor(cursor) if cursor else None,
+    )
+
+    if len(results) == limit:
+        last, rank = results[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_search_cursor(rank, last.id)
+
+    return [transaction for transaction, _ in results]
+
+
 @router.post("/", response_model=Transaction, status_code=status.HTTP_201_CREATED)
-def create_transaction(
+async def create_transaction(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     transaction_in: TransactionCreate,
+    response: Response,
+    duplicates: Literal["allow", "reject"] = "allow",
 ) -> Any:
-    """Create new transaction."""
+    """Create new transaction.
+
+    Without a category_id, the user's categorization rules pick one. A
+    transaction matching an existing one (same account, day, amount and
+    description) is rejected with 409 when duplicates=reject; otherwise it
+    is created and the existing id is returned in the X-Duplicate-Of header.
+    """
+    [(_, duplicate_of)] = await aio.transaction.find_duplicates(
+        db, user_id=current_user.id, rows=[transaction_in]
+    )
+    if duplicate_of is not None:
+        if duplicates == "reject":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Duplicate of transaction {duplicate_of}",
+            )
+        response.headers[DUPLICATE_OF_HEADER] = str(duplicate_of)
+
+    if transaction_in.category_id is None:
+        category_id = await db.run_sync(
+            CategorizationService.categorize,
+            user_id=current_user.id,
+            transaction_type=transaction_in.transaction_type,
+            merchant=transaction_in.merchant,
+            description=transaction_in.description,
+        )
+        transaction_in = transaction_in.model_copy(update={"category_id": category_id})
+
     try:
-        transaction = crud.transaction.create_with_user(
+        transaction = await aio.transaction.create_with_user(
             db, obj_in=transaction_in, user_id=current_user.id
         )
+        response_cache.bump_version(current_user.id)
         return transaction
     except ValueError as e:
         raise HTTPException(
@@ -56,15 +228,189 @@ def create_transaction(
         )
 
 
+@router.post("/batch", response_model=TransactionBatchResponse)
+async def batch_transactions(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    batch_in: TransactionBatchRequest,
+) -> Any:
+    """Create, update and delete many transactions in one request."""
+    results = await aio.transaction.apply_batch(
+        db,
+        operations=batch_in.operations,
+        user_id=current_user.id,
+        atomic=batch_in.atomic,
+        duplicates=batch_in.duplicates,
+    )
+
+    succeeded = sum(1 for r in results if r.status == "ok")
+    if succeeded:
+        response_cache.bump_version(current_user.id)
+
+    return TransactionBatchResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=sum(1 for r in results if r.status == "error"),
+    )
+
+
+@router.post("/import")
+async def import_transactions(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    account_id: int = Form(...),
+    file_format: Optional[str] = Form(None),
+    duplicates: str = Form("skip"),
+    file: UploadFile = File(...),
+) -> Any:
+    """Bulk import a CSV or OFX statement into one account.
+
+    Streams newline-delimited JSON progress events while the file is
+    imported, ending with a "completed" (or "failed") summary. Rows that
+    duplicate existing transactions are skipped, or imported and counted
+    with duplicates=allow.
+    """
+    # CRITICAL: Verify account ownership once for the whole import
+    if not await aio.account.get_user_account(db, account_id=account_id, user_id=current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account not found or access denied",
+        )
+
+    file_format = (file_format or (file.filename or "").rsplit(".", 1)[-1]).lower()
+    if file_format not in SUPPORTED_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported format. Use one of: {', '.join(SUPPORTED_FORMATS)}",
+        )
+
+    if duplicates not in DUPLICATE_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported duplicates mode. Use one of: {', '.join(DUPLICATE_MODES)}",
+        )
+
+    # The upload and request session are closed before a streaming body runs,
+    # so the import works from its own spooled copy and (sync) session; the
+    # generator is iterated on the threadpool.
+    spool = tempfile.TemporaryFile()
+    await run_in_threadpool(shutil.copyfileobj, file.file, spool)
+    spool.seek(0)
+    user_id = current_user.id
+    parser = parse_ofx if file_format == "ofx" else parse_csv
+
+    def stream_progress():
+        import_db = SessionLocal()
+        import_db.info["user_id"] = user_id  # commits start the read-your-writes window
+        try:
+            importer = TransactionImporter(
+                import_db, user_id=user_id, account_id=account_id, duplicates=duplicates
+            )
+            for event in importer.run(parser(spool)):
+                if event["status"] == "completed":
+                    response_cache.bump_version(user_id)
+                    RecurringDetectionService.refresh(import_db, user_id)
+                yield json.dumps(event, default=str) + "\n"
+        finally:
+            import_db.close()
+            spool.close()
+
+    return StreamingResponse(stream_progress(), media_type="application/x-ndjson")
+
+
+@router.get("/duplicates", response_model=List[DuplicateGroup])
+async def read_duplicate_groups(
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    limit: int = Query(100, ge=1, le=1000),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> Any:
+    """Suspected duplicates: transactions sharing account, day, amount and description."""
+    return await aio.transaction.get_duplicate_groups(
+        db,
+        user_id=current_user.id,
+        limit=limit,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+@router.get("/tags", response_model=List[TagTotal])
+async def read_tag_totals(
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+    transaction_type: Literal["income", "expense", "transfer"] = "expense",
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> Any:
+    """Total amount per tag over a date range (expenses by default)."""
+    return await aio.transaction.get_tag_totals(
+        db,
+        user_id=current_user.id,
+        transaction_type=transaction_type,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+@router.get("/export")
+async def export_transactions(
+    *,
+    current_user: User = Depends(deps.get_current_active_user),
+    format: str = "csv",
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    account_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    tags: Optional[List[str]] = Query(None),
+    tags_match: Literal["any", "all"] = "any",
+) -> Any:
+    """Download the full transaction history as CSV, NDJSON or Parquet.
+
+    Rows are streamed from a server-side cursor in chunks, oldest first,
+    and accept the same filters as the list endpoint.
+    """
+    export_format = format.lower()
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported format. Use one of: {', '.join(EXPORT_FORMATS)}",
+        )
+    if export_format == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export requires the 'pyarrow' package",
+        )
+
+    statement = crud.transaction.export_statement(
+        user_id=current_user.id,
+        start_date=start_date,
+        end_date=end_date,
+        account_id=account_id,
+        category_id=category_id,
+        tags=tags,
+        tags_match=tags_match,
+    )
+    filename = f"transactions-{datetime.utcnow():%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        stream_export(SessionLocal, statement, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{transaction_id}", response_model=Transaction)
-def read_transaction(
+async def read_transaction(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     transaction_id: int,
 ) -> Any:
     """Get transaction by ID."""
-    transaction = crud.transaction.get_user_transaction(
+    transaction = await aio.transaction.get_user_transaction(
         db, transaction_id=transaction_id, user_id=current_user.id
     )
     if not transaction:
@@ -76,16 +422,16 @@ def read_transaction(
 
 
 @router.put("/{transaction_id}", response_model=Transaction)
-def update_transaction(
+async def update_transaction(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     transaction_id: int,
     transaction_in: TransactionUpdate,
 ) -> Any:
     """Update transaction."""
-    transaction = crud.transaction.get_user_transaction(
-        db, transaction_id=transaction_id, user_id=current_user.id
+    transaction = await aio.transaction.get_user_transaction(
+        db, transaction_id=transaction_id, user_id=current_user.id, restore_archived=True
     )
     if not transaction:
         raise HTTPException(
@@ -93,22 +439,33 @@ def update_transaction(
             detail="Transaction not found",
         )
 
-    transaction = crud.transaction.update(
-        db, db_obj=transaction, obj_in=transaction_in
-    )
+    previous_category_id = transaction.category_id
+    try:
+        transaction = await aio.transaction.update(
+            db, db_obj=transaction, obj_in=transaction_in
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    if transaction.category_id is not None and transaction.category_id != previous_category_id:
+        # A manual recategorization teaches the rule engine
+        await db.run_sync(CategorizationService.learn, transaction=transaction)
+    response_cache.bump_version(current_user.id)
     return transaction
 
 
 @router.delete("/{transaction_id}")
-def delete_transaction(
+async def delete_transaction(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
     transaction_id: int,
 ) -> Any:
     """Delete transaction."""
-    transaction = crud.transaction.get_user_transaction(
-        db, transaction_id=transaction_id, user_id=current_user.id
+    transaction = await aio.transaction.get_user_transaction(
+        db, transaction_id=transaction_id, user_id=current_user.id, restore_archived=True
     )
     if not transaction:
         raise HTTPException(
@@ -116,5 +473,8 @@ def delete_transaction(
             detail="Transaction not found",
         )
 
-    crud.transaction.delete(db, id=transaction_id)
+    await aio.transaction.delete(
+        db, id=transaction_id, transaction_date=transaction.transaction_date
+    )
+    response_cache.bump_version(current_user.id)
     return {"message": "Transaction deleted successfully"}
@@ -0,0 +1,119 @@
+"""Caches for the authentication fast path.
+
+Every authenticated request verifies its bearer token and loads the user.
+Both results are cached per worker:
+
+- tokens: raw token -> user id. An entry never outlives the token's own
+  expiry, so a cache hit is exactly as valid as re-verifying the signature.
+- users: user id -> detached User instance, re-attached to the request
+  session with Session.merge(load=False), which issues no query.
+
+CRUDUser.update and CRUDUser.delete, the only write paths for users,
+invalidate the user. Invalidation bumps a per-user
+version token in the shared cache backend (see app.core.cache), and a
+cached user is only served while its version is current, so every worker
+drops it on its next request. A hit therefore costs one backend lookup
+(a Redis GET in multi-worker deployments) instead of a database query.
+"""
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from app.core.cache import CacheBackend, LRUCacheBackend, build_backend
+from app.core.config import settings
+
+
+class AuthCache:
+    """Bounded TTL caches of verified tokens and users, with hit/miss accounting."""
+
+    def __init__(
+        self, max_entries: int = 10000, ttl: int = 60, versions: Optional[CacheBackend] = None
+    ):
+        self.ttl = ttl
+        self.tokens = LRUCacheBackend(max_entries=max_entries)
+        self.users = LRUCacheBackend(max_entries=max_entries)
+        self.versions = versions if versions is not None else LRUCacheBackend(max_entries=max_entries)
+        self.counters = {"token_hits": 0, "token_misses": 0, "user_hits": 0, "user_misses": 0}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f"auth_user_version:{user_id}"
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.counters[name] += 1
+
+    def get_user_id(self, token: str) -> Optional[int]:
+        """User id of a previously verified, unexpired token."""
+        user_id = self.tokens.get(token) if self.ttl else None
+        self._count("token_hits" if user_id is not None else "token_misses")
+        return user_id
+
+    def set_token(self, token: str, user_id: int, expires_at: Optional[float] = None) -> None:
+        """Remember a verified token until the earlier of the TTL and its expiry (epoch seconds)."""
+        ttl = self.ttl
+        if expires_at is not None:
+            ttl = min(ttl, int(expires_at - time.time()))
+        if ttl > 0:
+            self.tokens.set(token, user_id, ttl=ttl)
+
+    def user_version(self, user_id: int) -> Optional[str]:
+        """Current version token of a user; read it before loading the user to cache."""
+        return self.versions.get(self._version_key(user_id)) if self.ttl else None
+
+    def get_user(self, user_id: int) -> Optional[Any]:
+        """Detached User instance cached for an id, unless it was invalidated since."""
+        entry = self.users.get(user_id) if self.ttl else None
+        user = None
+        if entry is not None:
+            user, version = entry
+            if version != self.user_version(user_id):
+                self.users.delete(user_id)
+                user = None
+        self._count("user_hits" if user is not None else "user_misses")
+        return user
+
+    def set_user(self, user: Any, version: Optional[str]) -> None:
+        """Cache a fully loaded, detached User instance.
+
+        version is user_version() as read before the user was loaded, so
+        an invalidation racing with the load is never masked.
+        """
+        if self.ttl:
+            self.users.set(user.id, (user, version), ttl=self.ttl)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Make every worker reload the user from the database on its next request.
+
+        The version key only has to outlive the cached entries, so it
+        expires with the same TTL.
+        """
+        self.users.delete(user_id)
+        if self.ttl:
+            self.versions.set(self._version_key(user_id), uuid.uuid4().hex, ttl=self.ttl)
+
+    def clear(self) -> None:
+        self.tokens.clear()
+        self.users.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and sizes for monitoring."""
+        counters = dict(self.counters)
+        token_total = counters["token_hits"] + counters["token_misses"]
+        user_total = counters["user_hits"] + counters["user_misses"]
+        return {
+            **counters,
+            "token_hit_rate": counters["token_hits"] / token_total if token_total else 0.0,
+            "user_hit_rate": counters["user_hits"] / user_total if user_total else 0.0,
+            "cached_tokens": len(self.tokens),
+            "cached_users": len(self.users),
+        }
+
+
+auth_cache = AuthCache(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    versions=build_backend(),
+)
@@ -0,0 +1,194 @@
+"""Per-user cache for computed views (dashboard, portfolio, insights).
+
+Entries are keyed by view name, user id and the user's current data
+version. Every write path bumps the version, which makes all previously
+cached views for that user unreachable without having to enumerate them.
+
+Versions must be shared by every worker that can serve the user, since
+a write handled by one worker has to invalidate the views cached by the
+others. The memory backend is therefore limited to a single worker
+(WEB_CONCURRENCY=1); multi-worker deployments use CACHE_BACKEND=redis.
+"""
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+class CacheBackend:
+    """Minimal key/value interface used by ResponseCache."""
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class LRUCacheBackend(CacheBackend):
+    """Bounded in-process LRU store with optional per-entry TTL."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared store backed by Redis, for multi-worker deployments.
+
+    Values are pickled, so anyone able to write to the Redis instance can
+    run code in the API; it must only be reachable by the API (see
+    .env.example).
+    """
+
+    def __init__(self, url: str, prefix: str = "wealthflow:cache:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "CACHE_BACKEND=redis requires the 'redis' package"
+            ) from e
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=ttl or None)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+class ResponseCache:
+    """Versioned per-user cache with hit/miss accounting."""
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[int] = None):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f"version:{user_id}"
+
+    def get_version(self, user_id: int) -> str:
+        """Current data version token for a user (created on first use)."""
+        version = self.backend.get(self._version_key(user_id))
+        if version is None:
+            version = self.bump_version(user_id)
+        return version
+
+    def bump_version(self, user_id: int) -> str:
+        """Invalidate every cached view for a user.
+
+        Versions are random tokens rather than counters, so a version that
+        was evicted can never be re-issued and match a stale entry.
+        """
+        version = uuid.uuid4().hex
+        self.backend.set(self._version_key(user_id), version)
+        return version
+
+    def _lookup(self, view: str, user_id: int):
+        """(key, cached value or None) for a view, counting the hit or miss."""
+        key = f"view:{view}:{user_id}:{self.get_version(user_id)}"
+        value = self.backend.get(key)
+        with self._stats_lock:
+            if value is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return key, value
+
+    def get_or_compute(self, view: str, user_id: int, compute: Callable[[], Any]) -> Any:
+        """Return the cached view for the user's current version, computing it on a miss."""
+        key, value = self._lookup(view, user_id)
+        if value is None:
+            value = compute()
+            self.backend.set(key, value, ttl=self.ttl)
+        return value
+
+    async def get_or_compute_async(
+        self, view: str, user_id: int, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """get_or_compute for async handlers: compute is awaited on a miss."""
+        key, value = self._lookup(view, user_id)
+        if value is None:
+            value = await compute()
+            self.backend.set(key, value, ttl=self.ttl)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+def build_backend() -> CacheBackend:
+    """Create the backend selected by settings."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.CACHE_URL)
+    if settings.WEB_CONCURRENCY > 1:
+        raise RuntimeError(
+            "CACHE_BACKEND=memory keeps cache versions per worker, so writes would not "
+            "invalidate other workers' entries; use CACHE_BACKEND=redis with WEB_CONCURRENCY > 1"
+        )
+    return LRUCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(build_backend(), ttl=settings.CACHE_TTL_SECONDS)
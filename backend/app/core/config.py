@@ -43,6 +43,46 @@ class Settings(BaseSettings):
     # AI Integration
     OPENAI_API_KEY: str = ""
 
+    # Optional read replica for read-only endpoints. After a write, a user's
+    # reads stay on the primary for READ_YOUR_WRITES_SECONDS; a replica lagging
+    # more than REPLICA_MAX_LAG_SECONDS is bypassed.
+    DATABASE_REPLICA_URL: str = ""
+    READ_YOUR_WRITES_SECONDS: int = 10
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_SECONDS: float = 5.0
+
+    # Connection pools, per worker and engine (see app/core/db_pool.py)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_PGBOUNCER: bool = False
+
+    # Worker processes serving the API (uvicorn --workers reads the same
+    # variable). The memory cache backend only supports a single worker.
+    WEB_CONCURRENCY: int = 1
+
+    # Response cache for computed views ("memory" or "redis")
+    CACHE_BACKEND: str = "memory"
+    CACHE_URL: str = ""
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_TTL_SECONDS: int = 300
+
+    # Per-worker cache of verified tokens and users (0 disables it);
+    # invalidations are shared through the cache backend
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 60
+
+    # bcrypt cost and the process pool that runs it (0 workers uses the thread pool)
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+
+    # Transactions older than this many whole months move to the archive table
+    ARCHIVE_HORIZON_MONTHS: int = 13
+
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
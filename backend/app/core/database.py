@@ -1,17 +1,97 @@
+import asyncio
+from typing import AsyncGenerator, Callable, Generator, List, Optional, TypeVar
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.core.db_pool import engine_options, install_statement_timeout
 
-engine = create_engine(settings.DATABASE_URL)
+# Sync engine: the streaming import/export endpoints
+engine = create_engine(settings.DATABASE_URL, **engine_options())
+install_statement_timeout(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Maintenance jobs in scripts/ (backfills, reconciliation, archiving) run
+# long statements, so their engine has no statement timeout
+maintenance_engine = create_engine(
+    settings.DATABASE_URL, **engine_options(statement_timeout=False)
+)
+MaintenanceSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=maintenance_engine)
+
+# Async sessions (asyncpg) serve the API. Objects stay loaded after commit,
+# since lazy loads cannot run once a request handler has returned.
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+_async_engine: Optional[AsyncEngine] = None
+_async_replica_engine: Optional[AsyncEngine] = None
+
 Base = declarative_base()
 
+T = TypeVar("T")
+
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL with its driver switched to asyncpg."""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """The API's async engine, created on first use so sync-only tools never need asyncpg."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            async_database_url(settings.DATABASE_URL), **engine_options(is_async=True)
+        )
+        install_statement_timeout(_async_engine.sync_engine)
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+def get_async_replica_engine() -> Optional[AsyncEngine]:
+    """Async engine of the read replica (DATABASE_REPLICA_URL), or None when there is none."""
+    global _async_replica_engine
+    if _async_replica_engine is None and settings.DATABASE_REPLICA_URL:
+        _async_replica_engine = create_async_engine(
+            async_database_url(settings.DATABASE_REPLICA_URL), **engine_options(is_async=True)
+        )
+        install_statement_timeout(_async_replica_engine.sync_engine)
+    return _async_replica_engine
+
 
-def get_db():
+def get_db() -> Generator[Session, None, None]:
+    """Get database session dependency."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session dependency."""
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def fan_out(
+    *queries: Callable[[Session], T], bind: Optional[AsyncEngine] = None
+) -> List[T]:
+    """Run independent read-only queries at the same time and return their results in order.
+
+    Each query is a function of a Session that fully materializes its
+    result (.one(), .all(), a dict, ...). Every query gets its own
+    AsyncSession and so its own pooled connection, which lets the
+    statements execute in parallel: the total wait approaches the
+    slowest query rather than the sum of all of them. The queries do not
+    share a transaction snapshot, so only combine reads that tolerate that.
+    bind selects another engine (the read replica) instead of the primary.
+    """
+    get_async_engine()
+
+    async def run(query: Callable[[Session], T]) -> T:
+        async with AsyncSessionLocal(bind=bind) if bind is not None else AsyncSessionLocal() as db:
+            return await db.run_sync(query)
+
+    return list(await asyncio.gather(*(run(query) for query in queries)))
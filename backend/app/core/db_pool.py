@@ -0,0 +1,127 @@
+"""Connection pool configuration and metrics for the sync and async engines.
+
+Pool sizing, recycling, pre-ping and the per-statement timeout come from
+settings (DB_*). The timeout applies to the engines serving requests,
+not to the maintenance engine used by scripts/. Each uvicorn worker has its own pools, so a deployment
+opens at most workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections per
+engine; keep that below the server's max_connections.
+
+With DB_PGBOUNCER (transaction pooling) PgBouncer owns the pooling: the
+engines use NullPool, asyncpg's prepared statement cache is disabled and
+statements get unique names (a server connection may serve another
+client between transactions), and the statement timeout is applied per
+transaction with SET LOCAL since PgBouncer rejects startup options.
+"""
+import threading
+import time
+from typing import Any, Dict
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from app.core.config import settings
+
+
+class TimedPoolMixin:
+    """Records how long checkouts wait for a connection, and how many time out."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.configured_max_overflow = kwargs.get("max_overflow")
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+        self._wait_lock = threading.Lock()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._wait_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._wait_lock:
+                self.wait_count += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(is_async: bool = False, statement_timeout: bool = True) -> Dict[str, Any]:
+    """Keyword arguments for create_engine / create_async_engine.
+
+    statement_timeout=False leaves out DB_STATEMENT_TIMEOUT_MS, for the
+    maintenance engine whose backfills and archive moves run for longer.
+    """
+    if settings.DB_PGBOUNCER:
+        options: Dict[str, Any] = {"poolclass": NullPool}
+        if is_async:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        return options
+
+    options = {
+        "poolclass": TimedAsyncQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout and statement_timeout:
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def install_statement_timeout(engine: Engine) -> None:
+    """In PgBouncer mode, set the statement timeout at the start of every transaction."""
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if not (settings.DB_PGBOUNCER and timeout):
+        return
+
+    @event.listens_for(engine, "begin")
+    def set_statement_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """Checked-out, idle and overflow counts and checkout wait times of an engine's pool."""
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    if isinstance(pool, TimedPoolMixin):
+        stats.update({
+            "max_overflow": pool.configured_max_overflow,
+            "checkouts": pool.wait_count,
+            "wait_avg_ms": pool.wait_total / pool.wait_count * 1000 if pool.wait_count else 0.0,
+            "wait_max_ms": pool.wait_max * 1000,
+            "timeouts": pool.timeouts,
+        })
+    return stats
@@ -0,0 +1,96 @@
+"""Bounded process pool for bcrypt hashing and verification.
+
+bcrypt is deliberately slow (tens to hundreds of milliseconds per call).
+Run on the shared request threadpool, a burst of logins occupies every
+thread and stalls unrelated requests. Hashing therefore runs in a small
+dedicated process pool, awaited from the event loop without holding a
+thread, and admission is bounded: once PASSWORD_HASH_WORKERS jobs are
+running and PASSWORD_HASH_QUEUE_SIZE more are waiting, further calls fail
+immediately with PasswordHasherBusy (served as 503 with Retry-After).
+"""
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_and_update_password
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+class PasswordHasher:
+    """Admission-controlled front end of the hashing process pool."""
+
+    def __init__(self, workers: int = 2, queue_size: int = 32):
+        self.workers = workers
+        self.capacity = max(workers, 1) + queue_size
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Started lazily; spawn rather than fork, since the server process has threads
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise PasswordHasherBusy("Too many password operations in progress")
+            self.in_flight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        self._admit()
+        try:
+            loop = asyncio.get_running_loop()
+            # Without pool workers, hash on the default thread pool, never on the event loop
+            executor = self._get_pool() if self.workers > 0 else None
+            return await loop.run_in_executor(executor, fn, *args)
+        finally:
+            self._release()
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the current bcrypt cost."""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password; also returns a new hash when the stored one is outdated."""
+        return await self._run(verify_and_update_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue counters for monitoring."""
+        return {
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS, queue_size=settings.PASSWORD_HASH_QUEUE_SIZE
+)
@@ -0,0 +1,148 @@
+"""Routing of read-only requests to the read replica.
+
+Read-only endpoints take their session from deps.get_read_db, which picks
+the replica unless:
+
+- no replica is configured (DATABASE_REPLICA_URL),
+- the user committed a write within READ_YOUR_WRITES_SECONDS, so they
+  always see their own changes despite replication lag, or
+- the replica's measured lag exceeds REPLICA_MAX_LAG_SECONDS, or the
+  replica cannot be reached.
+
+Writes are detected with Session events: a session whose user is known
+(get_current_user records it in session.info) and that commits a flush
+or a non-SELECT statement starts the user's window. Windows live in the
+cache backend, so with CACHE_BACKEND=redis they hold across workers.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheBackend, build_backend
+from app.core.config import settings
+from app.core.database import get_async_replica_engine
+
+logger = logging.getLogger(__name__)
+
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class ReadRouter:
+    """Chooses between the primary and the replica for a user's reads."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        window: int = 10,
+        max_lag: float = 5.0,
+        lag_check_interval: float = 5.0,
+    ):
+        self.backend = backend
+        self.window = window
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.lag: Optional[float] = None
+        self._lag_checked_at = 0.0
+        self.counters = {"replica_reads": 0, "primary_reads": 0, "sticky_reads": 0, "lagging_reads": 0}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"primary_until:{user_id}"
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.counters[name] += 1
+
+    def mark_write(self, user_id: int) -> None:
+        """Start (or extend) the user's read-your-writes window."""
+        if self.window:
+            self.backend.set(self._key(user_id), True, ttl=self.window)
+
+    def recently_wrote(self, user_id: int) -> bool:
+        """Whether the user is inside their read-your-writes window."""
+        return self.backend.get(self._key(user_id)) is not None
+
+    async def replica_lag(self, replica: AsyncEngine) -> Optional[float]:
+        """Replication lag in seconds, re-measured at most every lag_check_interval.
+
+        None means the replica could not be queried.
+        """
+        now = time.monotonic()
+        if now - self._lag_checked_at >= self.lag_check_interval:
+            self._lag_checked_at = now  # concurrent requests keep the previous value
+            try:
+                async with replica.connect() as conn:
+                    lag = (await conn.execute(REPLICA_LAG_SQL)).scalar()
+                self.lag = float(lag or 0)
+            except Exception:
+                logger.warning("Read replica unavailable, reading from the primary", exc_info=True)
+                self.lag = None
+        return self.lag
+
+    async def read_engine(self, user_id: int) -> Optional[AsyncEngine]:
+        """Replica engine for the user's reads, or None to read from the primary."""
+        replica = get_async_replica_engine()
+        if replica is None:
+            self._count("primary_reads")
+            return None
+        if self.recently_wrote(user_id):
+            self._count("sticky_reads")
+            return None
+        lag = await self.replica_lag(replica)
+        if lag is None or lag > self.max_lag:
+            self._count("lagging_reads")
+            return None
+        self._count("replica_reads")
+        return replica
+
+    def stats(self) -> Dict[str, Any]:
+        """Routing counters and the last measured lag for monitoring."""
+        return {
+            "replica_configured": bool(settings.DATABASE_REPLICA_URL),
+            "replica_lag_seconds": self.lag,
+            **self.counters,
+        }
+
+
+read_router = ReadRouter(
+    build_backend(),
+    window=settings.READ_YOUR_WRITES_SECONDS,
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    lag_check_interval=settings.REPLICA_LAG_CHECK_SECONDS,
+)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _start_window(session) -> None:
+    user_id = session.info.get("user_id")
+    if session.info.pop("wrote", False) and user_id is not None:
+        read_router.mark_write(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_writes(session) -> None:
+    session.info.pop("wrote", None)
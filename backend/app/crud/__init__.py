@@ -2,9 +2,13 @@
 from app.crud.user import user
 from app.crud.account import account
 from app.crud.category import category
+from app.crud.category_rule import category_rule
 from app.crud.transaction import transaction
 from app.crud.budget import budget
 from app.crud.savings_goal import savings_goal
 from app.crud.investment import investment
+from app.crud.spending_rollup import spending_rollup
+from app.crud.balance_ledger import balance_ledger
+from app.crud.transaction_archive import transaction_archive
 
-__all__ = ["user", "account", "category", "transaction", "budget", "savings_goal", "investment"]
+__all__ = ["user", "account", "category", "category_rule", "transaction", "budget", "savings_goal", "investment", "spending_rollup", "balance_ledger", "transaction_archive"]
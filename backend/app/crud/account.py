@@ -1,7 +1,13 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
+from decimal import Decimal
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.account import Account
+from app.crud.balance_ledger import balance_ledger
+from app.crud.spending_rollup import spending_rollup
+from app.crud.transaction import transaction as crud_transaction
+from app.crud.transaction_archive import transaction_archive
+from app.crud.budget import budget as crud_budget
 from app.schemas.account import AccountCreate, AccountUpdate
 
 
@@ -39,9 +45,55 @@ class CRUDAccount(CRUDBase[Account, AccountCreate, AccountUpdate]):
             user_id=user_id,
         )
         db.add(db_obj)
+        db.flush()
+        balance_ledger.record_adjustment(db, account_id=db_obj.id, amount=db_obj.balance)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Account,
+        obj_in: Union[AccountUpdate, Dict[str, Any]]
+    ) -> Account:
+        """Update an account, recording a manual balance change in the ledger.
+
+        A balance change locks the account first and measures the adjustment
+        against the locked balance, so a transaction written concurrently is
+        not counted twice in the ledger.
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        if update_data.get("balance") is not None:
+            crud_transaction.lock_accounts(db, account_ids=[db_obj.id], user_id=db_obj.user_id)
+            db.refresh(db_obj, attribute_names=["balance"])
+            balance_ledger.record_adjustment(
+                db,
+                account_id=db_obj.id,
+                amount=Decimal(str(update_data["balance"])) - db_obj.balance,
+            )
+        return super().update(db, db_obj=db_obj, obj_in=update_data)
+
+    def delete(self, db: Session, *, id: int) -> Account:
+        """Delete an account, removing its transactions from rollups and budgets.
+
+        Archived transactions are deleted too; its ledger and snapshots go
+        with it (ON DELETE CASCADE). Everything commits together, with the
+        account locked first.
+        """
+        obj = db.get(Account, id)
+        crud_transaction.lock_accounts(db, account_ids=[id], user_id=obj.user_id)
+        spending_rollup.remove_account(db, account_id=id)
+        transaction_archive.remove_account(db, account_id=id)
+        db.delete(obj)
+        db.flush()
+        crud_budget.reconcile_spent(db, user_id=obj.user_id, commit=False)
+        db.commit()
+        return obj
 
 account = CRUDAccount(Account)
@@ -0,0 +1,27 @@
+# Async CRUD operations (AsyncSession), one per module in app.crud
+from app.crud.base import AsyncCRUDBase
+from app.crud.user import user as _user
+from app.crud.account import account as _account
+from app.crud.category import category as _category
+from app.crud.category_rule import category_rule as _category_rule
+from app.crud.transaction import transaction as _transaction
+from app.crud.budget import budget as _budget
+from app.crud.savings_goal import savings_goal as _savings_goal
+from app.crud.investment import investment as _investment
+from app.crud.spending_rollup import spending_rollup as _spending_rollup
+from app.crud.balance_ledger import balance_ledger as _balance_ledger
+from app.crud.transaction_archive import transaction_archive as _transaction_archive
+
+user = AsyncCRUDBase(_user)
+account = AsyncCRUDBase(_account)
+category = AsyncCRUDBase(_category)
+category_rule = AsyncCRUDBase(_category_rule)
+transaction = AsyncCRUDBase(_transaction)
+budget = AsyncCRUDBase(_budget)
+savings_goal = AsyncCRUDBase(_savings_goal)
+investment = AsyncCRUDBase(_investment)
+spending_rollup = AsyncCRUDBase(_spending_rollup)
+balance_ledger = AsyncCRUDBase(_balance_ledger)
+transaction_archive = AsyncCRUDBase(_transaction_archive)
+
+__all__ = ["user", "account", "category", "category_rule", "transaction", "budget", "savings_goal", "investment", "spending_rollup", "balance_ledger", "transaction_archive"]
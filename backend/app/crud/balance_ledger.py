@@ -0,0 +1,352 @@
+from typing import Dict, List, Optional, Tuple
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import Date, Integer, Numeric, and_, case, cast, column, delete, func, or_, select, true, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.account import Account
+from app.models.balance_ledger import AccountBalanceLedger, AccountBalanceSnapshot
+from app.models.transaction import Transaction
+from app.crud.transaction_archive import transaction_archive
+
+
+def balance_effect(transaction_type: str, amount: Decimal) -> Decimal:
+    """Signed effect of a transaction on its account balance."""
+    # CRITICAL: Server-side calculation using Decimal
+    amount = Decimal(str(amount))
+    if transaction_type == "income":
+        return amount
+    elif transaction_type == "expense":
+        return -amount
+    # Note: transfers handled separately
+    return Decimal("0.00")
+
+
+def balance_effect_expression(columns=Transaction.__table__.c):
+    """SQL version of balance_effect over transaction columns."""
+    return case(
+        (columns.transaction_type == "income", columns.amount),
+        (columns.transaction_type == "expense", -columns.amount),
+        else_=0,
+    )
+
+
+def series_days(start_day: date, end_day: date, resolution: str) -> List[date]:
+    """Point days of a balance series: every day, or each week/month end.
+
+    The end day is always the last point, even mid-week or mid-month.
+    """
+    if resolution == "daily":
+        step = timedelta(days=1)
+        first = start_day
+    elif resolution == "weekly":
+        step = timedelta(days=7)
+        first = start_day + timedelta(days=6 - start_day.weekday())  # Sunday
+    else:
+        step = None
+        first = start_day.replace(day=monthrange(start_day.year, start_day.month)[1])
+
+    days = []
+    day = first
+    while day < end_day:
+        days.append(day)
+        if step:
+            day += step
+        else:
+            next_month = day + timedelta(days=1)
+            day = next_month.replace(day=monthrange(next_month.year, next_month.month)[1])
+    days.append(end_day)
+    return days
+
+
+class CRUDBalanceLedger:
+    """Maintenance and queries for the account balance ledger and snapshots.
+
+    Writes never commit: they run inside the caller's transaction so the
+    ledger moves atomically with the balance it explains.
+    """
+
+    def __init__(self):
+        self.model = AccountBalanceLedger
+
+    def apply_deltas(
+        self, db: Session, *, deltas: Dict[Tuple[int, date], Tuple[Decimal, int]]
+    ) -> None:
+        """Add (net_change, transaction_count) per (account_id, day).
+
+        Snapshots on or after a changed day are shifted by the same amount,
+        which keeps them correct for back-dated transactions.
+        """
+        if not deltas:
+            return
+
+        stmt = pg_insert(AccountBalanceLedger).values([
+            {
+                "account_id": account_id,
+                "day": day,
+                "net_change": net_change,
+                "transaction_count": count,
+            }
+            for (account_id, day), (net_change, count) in deltas.items()
+        ])
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["account_id", "day"],
+                set_={
+                    "net_change": AccountBalanceLedger.net_change + stmt.excluded.net_change,
+                    "transaction_count": AccountBalanceLedger.transaction_count + stmt.excluded.transaction_count,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+        changes = [
+            (account_id, day, net_change)
+            for (account_id, day), (net_change, _) in deltas.items()
+            if net_change
+        ]
+        if not changes:
+            return
+
+        changed = values(
+            column("account_id", Integer),
+            column("day", Date),
+            column("net_change", Numeric(15, 2)),
+            name="ledger_changes",
+        ).data(changes)
+        shifts = (
+            select(
+                AccountBalanceSnapshot.id,
+                func.sum(changed.c.net_change).label("net_change"),
+            )
+            .join(
+                changed,
+                and_(
+                    AccountBalanceSnapshot.account_id == changed.c.account_id,
+                    AccountBalanceSnapshot.day >= changed.c.day,
+                ),
+            )
+            .group_by(AccountBalanceSnapshot.id)
+            .subquery()
+        )
+        db.execute(
+            update(AccountBalanceSnapshot)
+            .where(AccountBalanceSnapshot.id == shifts.c.id)
+            .values(balance=AccountBalanceSnapshot.balance + shifts.c.net_change)
+            .execution_options(synchronize_session=False)
+        )
+
+    def apply(self, db: Session, *, transaction: Transaction, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) a single transaction."""
+        self.apply_many(db, transactions=[transaction], sign=sign)
+
+    def apply_many(self, db: Session, *, transactions: List[Transaction], sign: int = 1) -> None:
+        """Add or remove several transactions with one upsert statement."""
+        deltas: Dict[Tuple[int, date], List] = {}
+        for t in transactions:
+            key = (t.account_id, t.transaction_date.date())
+            entry = deltas.setdefault(key, [Decimal("0.00"), 0])
+            entry[0] += balance_effect(t.transaction_type, t.amount) * sign
+            entry[1] += sign
+        self.apply_deltas(db, deltas={key: tuple(entry) for key, entry in deltas.items()})
+
+    def record_adjustment(
+        self, db: Session, *, account_id: int, amount: Decimal, day: Optional[date] = None
+    ) -> None:
+        """Record a balance change that is not a transaction (opening balance, manual edit)."""
+        amount = Decimal(str(amount))
+        if amount:
+            day = day or datetime.utcnow().date()
+            self.apply_deltas(db, deltas={(account_id, day): (amount, 0)})
+
+    def take_snapshots(
+        self, db: Session, *, day: date, account_id: Optional[int] = None
+    ) -> int:
+        """Store the end-of-day balance of every account (or one) for a day."""
+        filters = [AccountBalanceLedger.day <= day]
+        if account_id is not None:
+            filters.append(AccountBalanceLedger.account_id == account_id)
+
+        source = (
+            select(
+                AccountBalanceLedger.account_id,
+                cast(day, Date).label("day"),
+                func.sum(AccountBalanceLedger.net_change).label("balance"),
+            )
+            .where(*filters)
+            .group_by(AccountBalanceLedger.account_id)
+        )
+        stmt = pg_insert(AccountBalanceSnapshot).from_select(["account_id", "day", "balance"], source)
+        result = db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["account_id", "day"],
+                set_={"balance": stmt.excluded.balance},
+            )
+        )
+        db.commit()
+        return result.rowcount
+
+    def backfill(self, db: Session, *, account_id: Optional[int] = None) -> None:
+        """Rebuild the ledger and month-end snapshots (all accounts or one).
+
+        Transaction history, hot and archived, is replayed per day. Whatever
+        part of the current balance it does not explain becomes an opening
+        entry on the account's first day, so the ledger always sums to
+        Account.balance.
+        """
+        history = transaction_archive.history()
+        ledger_filters, snapshot_filters, transaction_filters, account_filters = [], [], [], []
+        if account_id is not None:
+            ledger_filters.append(AccountBalanceLedger.account_id == account_id)
+            snapshot_filters.append(AccountBalanceSnapshot.account_id == account_id)
+            transaction_filters.append(history.c.account_id == account_id)
+            account_filters.append(Account.id == account_id)
+
+        db.execute(delete(AccountBalanceSnapshot).where(*snapshot_filters))
+        db.execute(delete(AccountBalanceLedger).where(*ledger_filters))
+
+        day = cast(history.c.transaction_date, Date)
+        db.execute(
+            pg_insert(AccountBalanceLedger).from_select(
+                ["account_id", "day", "net_change", "transaction_count"],
+                select(
+                    history.c.account_id,
+                    day,
+                    func.sum(balance_effect_expression(history.c)),
+                    func.count(history.c.id),
+                )
+                .where(*transaction_filters)
+                .group_by(history.c.account_id, day),
+            )
+        )
+
+        history = (
+            select(
+                AccountBalanceLedger.account_id,
+                func.min(AccountBalanceLedger.day).label("first_day"),
+                func.sum(AccountBalanceLedger.net_change).label("total"),
+            )
+            .where(*ledger_filters)
+            .group_by(AccountBalanceLedger.account_id)
+            .subquery()
+        )
+        opening_day = func.least(history.c.first_day, cast(Account.created_at, Date))
+        opening = (
+            select(
+                Account.id,
+                func.coalesce(opening_day, func.current_date()),
+                Account.balance - func.coalesce(history.c.total, 0),
+                0,
+            )
+            .select_from(Account)
+            .outerjoin(history, history.c.account_id == Account.id)
+            .where(*account_filters)
+        )
+        stmt = pg_insert(AccountBalanceLedger).from_select(
+            ["account_id", "day", "net_change", "transaction_count"], opening
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["account_id", "day"],
+                set_={"net_change": AccountBalanceLedger.net_change + stmt.excluded.net_change},
+            )
+        )
+
+        # One snapshot per account and month, on the last day with activity
+        running = (
+            select(
+                AccountBalanceLedger.account_id,
+                AccountBalanceLedger.day,
+                func.sum(AccountBalanceLedger.net_change).over(
+                    partition_by=AccountBalanceLedger.account_id,
+                    order_by=AccountBalanceLedger.day,
+                ).label("balance"),
+                func.row_number().over(
+                    partition_by=(
+                        AccountBalanceLedger.account_id,
+                        func.date_trunc("month", AccountBalanceLedger.day),
+                    ),
+                    order_by=AccountBalanceLedger.day.desc(),
+                ).label("position"),
+            )
+            .where(*ledger_filters)
+            .subquery()
+        )
+        db.execute(
+            pg_insert(AccountBalanceSnapshot).from_select(
+                ["account_id", "day", "balance"],
+                select(running.c.account_id, running.c.day, running.c.balance)
+                .where(running.c.position == 1),
+            )
+        )
+        db.commit()
+
+    def check_drift(self, db: Session, *, account_id: Optional[int] = None) -> List[dict]:
+        """Accounts whose ledger does not sum to the stored balance."""
+        totals = (
+            select(
+                AccountBalanceLedger.account_id,
+                func.sum(AccountBalanceLedger.net_change).label("total"),
+            )
+            .group_by(AccountBalanceLedger.account_id)
+            .subquery()
+        )
+        ledger_total = func.coalesce(totals.c.total, 0)
+        query = (
+            select(
+                Account.id.label("account_id"),
+                Account.balance,
+                ledger_total.label("ledger_balance"),
+            )
+            .outerjoin(totals, totals.c.account_id == Account.id)
+            .where(Account.balance != ledger_total)
+        )
+        if account_id is not None:
+            query = query.where(Account.id == account_id)
+        return [dict(row._mapping) for row in db.execute(query)]
+
+    def get_series(
+        self, db: Session, *, account_id: int, days: List[date]
+    ) -> List[Tuple[date, Decimal]]:
+        """End-of-day balances of an account for the given days.
+
+        Each point seeks the nearest snapshot at or before the day and adds
+        the ledger entries since then, so its cost is bounded by the snapshot
+        interval rather than the length of the history.
+        """
+        if not days:
+            return []
+
+        points = values(column("day", Date), name="points").data([(day,) for day in days])
+        snapshot = (
+            select(AccountBalanceSnapshot.day, AccountBalanceSnapshot.balance)
+            .where(
+                AccountBalanceSnapshot.account_id == account_id,
+                AccountBalanceSnapshot.day <= points.c.day,
+            )
+            .order_by(AccountBalanceSnapshot.day.desc())
+            .limit(1)
+            .lateral("snapshot")
+        )
+        since_snapshot = (
+            select(func.coalesce(func.sum(AccountBalanceLedger.net_change), 0))
+            .where(
+                AccountBalanceLedger.account_id == account_id,
+                AccountBalanceLedger.day <= points.c.day,
+                or_(snapshot.c.day.is_(None), AccountBalanceLedger.day > snapshot.c.day),
+            )
+            .scalar_subquery()
+        )
+        rows = db.execute(
+            select(
+                points.c.day,
+                (func.coalesce(snapshot.c.balance, 0) + since_snapshot).label("balance"),
+            )
+            .select_from(points.outerjoin(snapshot, true()))
+            .order_by(points.c.day)
+        ).all()
+        return [(row.day, Decimal(row.balance)) for row in rows]
+
+
+balance_ledger = CRUDBalanceLedger()
@@ -1,5 +1,7 @@
+import inspect
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.core.database import Base
 
@@ -62,3 +64,60 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.delete(obj)
         db.commit()
         return obj
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Awaitable counterpart of a CRUD object, for AsyncSession callers.
+
+    Every method of the wrapped object that takes a session as `db` runs on
+    the AsyncSession's own Session through run_sync: the query logic stays
+    in one place while the driver I/O (asyncpg) is awaited on the event
+    loop instead of holding a threadpool thread. Methods without a session
+    (is_active, export_statement, ...) are passed through unchanged.
+    """
+
+    def __init__(self, crud: Any):
+        """Wrap a sync CRUD object."""
+        self.crud = crud
+        self.model = getattr(crud, "model", None)
+
+    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """Get a single record by ID."""
+        return await db.run_sync(self.crud.get, id)
+
+    async def get_multi(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> List[ModelType]:
+        """Get multiple records with pagination."""
+        return await db.run_sync(self.crud.get_multi, skip=skip, limit=limit)
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType, **kwargs: Any) -> ModelType:
+        """Create a new record."""
+        return await db.run_sync(self.crud.create, obj_in=obj_in, **kwargs)
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        """Update an existing record."""
+        return await db.run_sync(self.crud.update, db_obj=db_obj, obj_in=obj_in)
+
+    async def delete(self, db: AsyncSession, *, id: int) -> ModelType:
+        """Delete a record by ID."""
+        return await db.run_sync(self.crud.delete, id=id)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.crud, name)
+        if not callable(attr) or next(iter(inspect.signature(attr).parameters), None) != "db":
+            return attr
+
+        async def method(db: AsyncSession, *args: Any, **kwargs: Any) -> Any:
+            return await db.run_sync(attr, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        setattr(self, name, method)  # wrap once per name
+        return method
@@ -1,7 +1,12 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta
+from decimal import Decimal
 from sqlalchemy.orm import Session
+from sqlalchemy import Date, Integer, Numeric, and_, case, cast, column, func, select, update, values
 from app.crud.base import CRUDBase
 from app.models.budget import Budget
+from app.models.spending_rollup import DailySpendingRollup
+from app.models.transaction import Transaction
 from app.schemas.budget import BudgetCreate, BudgetUpdate
 
 
@@ -48,10 +53,221 @@ class CRUDBudget(CRUDBase[Budget, BudgetCreate, BudgetUpdate]):
             **obj_in.model_dump(),
             user_id=user_id,
         )
+        db_obj.spent = Decimal("0.00")
+        db.add(db_obj)
+        db.flush()
+
+        # Seed the materialized counter from existing history
+        db_obj.spent = self.get_spent_totals(db, budgets=[db_obj], user_id=user_id)[db_obj.id]
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Budget,
+        obj_in: Union[BudgetUpdate, Dict[str, Any]]
+    ) -> Budget:
+        """Update a budget and recompute its spent counter for the new window."""
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        for field in update_data:
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, update_data[field])
+
+        db_obj.spent = self.get_spent_totals(
+            db, budgets=[db_obj], user_id=db_obj.user_id
+        )[db_obj.id]
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def get_period_end(self, budget: Budget) -> datetime:
+        """End of the budget window that starts at budget.start_date."""
+        if budget.period == "monthly":
+            return budget.start_date + timedelta(days=30)
+        elif budget.period == "yearly":
+            return budget.start_date + timedelta(days=365)
+        return datetime.utcnow()
+
+    def get_period_end_expression(self):
+        """SQL equivalent of get_period_end, evaluated per budget row."""
+        return case(
+            (Budget.period == "monthly", Budget.start_date + timedelta(days=30)),
+            (Budget.period == "yearly", Budget.start_date + timedelta(days=365)),
+            else_=func.timezone("UTC", func.now()),
+        )
+
+    def apply_transactions(
+        self, db: Session, *, transactions: List[Transaction], sign: int = 1
+    ) -> None:
+        """Add (sign=1) or remove (sign=-1) expenses from matching spent counters.
+
+        Deltas are aggregated per (user, category, day) and applied to every
+        budget whose window covers the day in one UPDATE ... FROM statement,
+        inside the caller's database transaction.
+        """
+        deltas: Dict[tuple, Decimal] = {}
+        for t in transactions:
+            if t.transaction_type != "expense" or t.category_id is None:
+                continue
+            key = (t.user_id, t.category_id, t.transaction_date.date())
+            deltas[key] = deltas.get(key, Decimal("0.00")) + Decimal(str(t.amount)) * sign
+
+        if not deltas:
+            return
+
+        changes = values(
+            column("user_id", Integer),
+            column("category_id", Integer),
+            column("day", Date),
+            column("delta", Numeric(15, 2)),
+            name="spent_deltas",
+        ).data([(u, c, d, delta) for (u, c, d), delta in deltas.items()])
+
+        per_budget = (
+            select(
+                Budget.id.label("budget_id"),
+                func.sum(changes.c.delta).label("delta"),
+            )
+            .join_from(
+                Budget,
+                changes,
+                and_(
+                    Budget.user_id == changes.c.user_id,
+                    Budget.category_id == changes.c.category_id,
+                    cast(Budget.start_date, Date) <= changes.c.day,
+                    cast(self.get_period_end_expression(), Date) >= changes.c.day,
+                ),
+            )
+            .group_by(Budget.id)
+            .subquery()
+        )
+
+        db.execute(
+            update(Budget)
+            .where(Budget.id == per_budget.c.budget_id)
+            .values(spent=Budget.spent + per_budget.c.delta, updated_at=Budget.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    def reconcile_spent(
+        self,
+        db: Session,
+        *,
+        user_id: Optional[int] = None,
+        fix: bool = True,
+        commit: bool = True,
+    ) -> List[dict]:
+        """Recompute every spent counter in bulk and report mismatches.
+
+        Expected values come from the daily spending rollup (see
+        scripts/spending_rollups.py check to verify it first). When fix is True the mismatched counters are corrected in the same
+        pass and, unless commit is False, the change is committed.
+        """
+        expected = (
+            select(
+                Budget.id.label("budget_id"),
+                Budget.spent.label("actual"),
+                func.coalesce(func.sum(DailySpendingRollup.total_amount), 0).label("expected"),
+            )
+            .select_from(
+                Budget.__table__.outerjoin(
+                    DailySpendingRollup,
+                    and_(
+                        DailySpendingRollup.user_id == Budget.user_id,
+                        DailySpendingRollup.category_id == Budget.category_id,
+                        DailySpendingRollup.transaction_type == "expense",
+                        DailySpendingRollup.day >= cast(Budget.start_date, Date),
+                        DailySpendingRollup.day <= cast(self.get_period_end_expression(), Date),
+                    ),
+                )
+            )
+            .group_by(Budget.id, Budget.spent)
+        )
+        if user_id is not None:
+            expected = expected.where(Budget.user_id == user_id)
+        expected = expected.subquery()
+
+        mismatches = [
+            dict(row._mapping)
+            for row in db.execute(
+                select(expected).where(expected.c.expected != expected.c.actual)
+            ).all()
+        ]
+
+        if fix and mismatches:
+            db.execute(
+                update(Budget)
+                .where(
+                    Budget.id == expected.c.budget_id,
+                    expected.c.expected != expected.c.actual,
+                )
+                .values(spent=expected.c.expected, updated_at=Budget.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            if commit:
+                db.commit()
+
+        return mismatches
+
+    def get_spent_totals(
+        self, db: Session, *, budgets: List[Budget], user_id: int
+    ) -> Dict[int, Decimal]:
+        """Spent amount per budget id, computed for all windows in one query.
+
+        The budget windows are sent as a VALUES list and joined to the daily
+        spending rollup, so the cost is one grouped statement regardless of
+        how many budgets are passed in.
+        """
+        if not budgets:
+            return {}
+
+        windows = values(
+            column("budget_id", Integer),
+            column("category_id", Integer),
+            column("start_day", Date),
+            column("end_day", Date),
+            name="budget_windows",
+        ).data(
+            [
+                (
+                    b.id,
+                    b.category_id,
+                    b.start_date.date(),
+                    self.get_period_end(b).date(),
+                )
+                for b in budgets
+            ]
+        )
+
+        rows = db.execute(
+            select(
+                windows.c.budget_id,
+                func.coalesce(func.sum(DailySpendingRollup.total_amount), 0).label("spent"),
+            )
+            .select_from(
+                windows.outerjoin(
+                    DailySpendingRollup,
+                    and_(
+                        DailySpendingRollup.user_id == user_id,
+                        DailySpendingRollup.category_id == windows.c.category_id,
+                        DailySpendingRollup.transaction_type == "expense",
+                        DailySpendingRollup.day >= windows.c.start_day,
+                        DailySpendingRollup.day <= windows.c.end_day,
+                    ),
+                )
+            )
+            .group_by(windows.c.budget_id)
+        ).all()
+
+        return {row.budget_id: Decimal(row.spent) for row in rows}
+
 
 budget = CRUDBudget(Budget)
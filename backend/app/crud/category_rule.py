@@ -0,0 +1,247 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import ARRAY, String, case, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.crud.base import CRUDBase
+from app.models.category_rule import CategoryRule
+from app.models.transaction import Transaction
+from app.schemas.category import CategoryRuleCreate
+
+MAX_PATTERN_TOKENS = 4
+RULE_TYPES = ("income", "expense")
+# Later sources win when a user and a system rule share a pattern
+SOURCE_ORDER = ("system", "learned", "manual")
+
+_TOKEN_SEPARATOR = re.compile(r"[^a-z0-9]+")
+
+
+def text_tokens(value: Optional[str]) -> List[str]:
+    """Lowercase words of a merchant or description.
+
+    Tokens containing digits (store numbers, card and reference numbers)
+    are dropped so "STARBUCKS #1234" and "Starbucks 0981" normalize alike.
+    """
+    if not value:
+        return []
+    return [token for token in _TOKEN_SEPARATOR.split(value.lower()) if token.isalpha()]
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """text_tokens joined with single spaces, the stored form of a pattern."""
+    return " ".join(text_tokens(value))
+
+
+def normalize_expression(value):
+    """SQL version of normalize_text."""
+    tokens = func.regexp_replace(func.lower(value), "[^a-z0-9]+", " ", "g")
+    tokens = func.regexp_replace(tokens, "[a-z]*[0-9][a-z0-9]*", " ", "g")
+    return func.btrim(func.regexp_replace(tokens, " +", " ", "g"))
+
+
+def learning_key(merchant: Optional[str], description: Optional[str]) -> str:
+    """Pattern learned from a categorized transaction: its merchant, else its description."""
+    tokens = text_tokens(merchant) or text_tokens(description)
+    return " ".join(tokens[:MAX_PATTERN_TOKENS])
+
+
+def learning_key_expression(columns=Transaction.__table__.c):
+    """SQL version of learning_key over transaction columns."""
+    text = func.coalesce(
+        func.nullif(normalize_expression(columns.merchant), ""),
+        normalize_expression(columns.description),
+    )
+    tokens = func.string_to_array(text, " ", type_=ARRAY(String))
+    return func.array_to_string(tokens[1:MAX_PATTERN_TOKENS], " ")
+
+
+class CRUDCategoryRule(CRUDBase[CategoryRule, CategoryRuleCreate, CategoryRuleCreate]):
+    """CRUD operations for CategoryRule model."""
+
+    def get_by_user(
+        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+    ) -> List[CategoryRule]:
+        """Get all rules that apply to a user (system + user-specific)."""
+        return (
+            db.query(CategoryRule)
+            .filter(or_(CategoryRule.user_id == user_id, CategoryRule.user_id.is_(None)))
+            .order_by(CategoryRule.pattern, CategoryRule.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_user_rule(
+        self, db: Session, *, rule_id: int, user_id: int
+    ) -> Optional[CategoryRule]:
+        """Get one of the user's own rules (system rules are read-only)."""
+        return (
+            db.query(CategoryRule)
+            .filter(CategoryRule.id == rule_id, CategoryRule.user_id == user_id)
+            .first()
+        )
+
+    def get_active(self, db: Session, *, user_id: int) -> List[Tuple[str, str, int]]:
+        """(transaction_type, pattern, category_id) of every rule for a user, weakest first."""
+        precedence = case(
+            {source: position for position, source in enumerate(SOURCE_ORDER)},
+            value=CategoryRule.source,
+        )
+        return [
+            tuple(row)
+            for row in db.execute(
+                select(CategoryRule.transaction_type, CategoryRule.pattern, CategoryRule.category_id)
+                .where(or_(CategoryRule.user_id == user_id, CategoryRule.user_id.is_(None)))
+                .order_by(CategoryRule.user_id.is_not(None), precedence)
+            )
+        ]
+
+    def _upsert(self, rows: list, *, source: str):
+        """INSERT ... ON CONFLICT for rules of one source."""
+        stmt = pg_insert(CategoryRule).values(rows)
+        if source == "system":
+            return stmt.on_conflict_do_nothing(
+                index_elements=["transaction_type", "pattern"],
+                index_where=CategoryRule.user_id.is_(None),
+            )
+
+        set_ = {
+            "category_id": stmt.excluded.category_id,
+            "source": stmt.excluded.source,
+            "hit_count": stmt.excluded.hit_count,
+            "updated_at": func.now(),
+        }
+        where = None
+        if source == "learned":
+            # Learning never overrides a rule the user entered by hand
+            where = CategoryRule.source == "learned"
+            set_["hit_count"] = case(
+                (CategoryRule.category_id == stmt.excluded.category_id,
+                 CategoryRule.hit_count + stmt.excluded.hit_count),
+                else_=stmt.excluded.hit_count,
+            )
+        return stmt.on_conflict_do_update(
+            index_elements=["user_id", "transaction_type", "pattern"],
+            index_where=CategoryRule.user_id.is_not(None),
+            set_=set_,
+            where=where,
+        )
+
+    def create_with_user(
+        self, db: Session, *, pattern: str, category_id: int, transaction_type: str, user_id: int
+    ) -> CategoryRule:
+        """Create (or replace) a manual rule for a user; pattern must be normalized."""
+        rule_id = db.execute(
+            self._upsert([{
+                "user_id": user_id,
+                "category_id": category_id,
+                "transaction_type": transaction_type,
+                "pattern": pattern,
+                "source": "manual",
+                "hit_count": 0,
+            }], source="manual").returning(CategoryRule.id)
+        ).scalar_one()
+        db.commit()
+        return self.get(db, rule_id)
+
+    def create_system_rules(
+        self, db: Session, *, rules: List[Tuple[str, str, int]]
+    ) -> int:
+        """Add (transaction_type, pattern, category_id) system rules, keeping existing ones."""
+        if not rules:
+            return 0
+        result = db.execute(
+            self._upsert([
+                {
+                    "user_id": None,
+                    "category_id": category_id,
+                    "transaction_type": transaction_type,
+                    "pattern": pattern,
+                    "source": "system",
+                    "hit_count": 0,
+                }
+                for transaction_type, pattern, category_id in rules
+            ], source="system")
+        )
+        db.commit()
+        return result.rowcount
+
+    def learn(
+        self, db: Session, *, user_id: int, category_id: int, transaction_type: str, pattern: str
+    ) -> None:
+        """Record one manual categorization as a learned rule."""
+        db.execute(self._upsert([{
+            "user_id": user_id,
+            "category_id": category_id,
+            "transaction_type": transaction_type,
+            "pattern": pattern,
+            "source": "learned",
+            "hit_count": 1,
+        }], source="learned"))
+        db.commit()
+
+    def learn_from_history(self, db: Session, *, user_id: int) -> int:
+        """Derive learned rules from every categorized transaction of a user.
+
+        Each merchant (or description) key gets the category it was given
+        most often, in one INSERT ... SELECT. Only the hot table is read:
+        recent habits are what future imports should follow.
+        """
+        key = learning_key_expression().label("pattern")
+        counts = (
+            select(
+                Transaction.transaction_type,
+                key,
+                Transaction.category_id,
+                func.count().label("hit_count"),
+            )
+            .where(
+                Transaction.user_id == user_id,
+                Transaction.category_id.is_not(None),
+                Transaction.transaction_type.in_(RULE_TYPES),
+            )
+            .group_by(Transaction.transaction_type, key, Transaction.category_id)
+            .subquery()
+        )
+        best = (
+            select(
+                literal(user_id),
+                counts.c.category_id,
+                counts.c.transaction_type,
+                counts.c.pattern,
+                literal("learned"),
+                counts.c.hit_count,
+                func.now(),
+                func.now(),
+            )
+            .where(counts.c.pattern != "")
+            .distinct(counts.c.transaction_type, counts.c.pattern)
+            .order_by(
+                counts.c.transaction_type,
+                counts.c.pattern,
+                counts.c.hit_count.desc(),
+                counts.c.category_id,
+            )
+        )
+        stmt = pg_insert(CategoryRule).from_select(
+            ["user_id", "category_id", "transaction_type", "pattern", "source",
+             "hit_count", "created_at", "updated_at"],
+            best,
+        )
+        result = db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "transaction_type", "pattern"],
+                index_where=CategoryRule.user_id.is_not(None),
+                set_={
+                    "category_id": stmt.excluded.category_id,
+                    "hit_count": stmt.excluded.hit_count,
+                    "updated_at": func.now(),
+                },
+                where=CategoryRule.source == "learned",
+            )
+        )
+        db.commit()
+        return result.rowcount
+
+
+category_rule = CRUDCategoryRule(CategoryRule)
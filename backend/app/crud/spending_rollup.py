@@ -0,0 +1,216 @@
+from typing import Dict, List, Optional
+from datetime import date
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, cast, delete, func, or_, select, Date
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.spending_rollup import DailySpendingRollup
+from app.models.transaction import Transaction
+from app.crud.transaction_archive import transaction_archive
+
+KEY_COLUMNS = ["user_id", "category_id", "transaction_type", "day"]
+
+
+class CRUDSpendingRollup:
+    """Maintenance and queries for the daily spending rollup.
+
+    Writes never commit: they run inside the caller's transaction so the
+    rollup moves atomically with the transaction rows it summarizes.
+    """
+
+    def __init__(self):
+        self.model = DailySpendingRollup
+
+    def _upsert(self, db: Session, stmt) -> None:
+        """Add the inserted totals onto any existing rollup rows."""
+        stmt = stmt.on_conflict_do_update(
+            index_elements=KEY_COLUMNS,
+            set_={
+                "total_amount": DailySpendingRollup.total_amount + stmt.excluded.total_amount,
+                "transaction_count": DailySpendingRollup.transaction_count + stmt.excluded.transaction_count,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    def apply(
+        self, db: Session, *, transaction: Transaction, sign: int = 1
+    ) -> None:
+        """Add (sign=1) or remove (sign=-1) a single transaction."""
+        self.apply_many(db, transactions=[transaction], sign=sign)
+
+    def apply_many(
+        self, db: Session, *, transactions: List[Transaction], sign: int = 1
+    ) -> None:
+        """Add or remove several transactions with one upsert statement."""
+        deltas: Dict[tuple, List] = {}
+        for t in transactions:
+            key = (t.user_id, t.category_id, t.transaction_type, t.transaction_date.date())
+            entry = deltas.setdefault(key, [Decimal("0.00"), 0])
+            entry[0] += Decimal(str(t.amount)) * sign
+            entry[1] += sign
+
+        if not deltas:
+            return
+
+        rows = [
+            {
+                "user_id": user_id,
+                "category_id": category_id,
+                "transaction_type": transaction_type,
+                "day": day,
+                "total_amount": total,
+                "transaction_count": count,
+            }
+            for (user_id, category_id, transaction_type, day), (total, count) in deltas.items()
+        ]
+        self._upsert(db, pg_insert(DailySpendingRollup).values(rows))
+
+    def _aggregate_transactions(
+        self, *, user_id: Optional[int] = None, account_id: Optional[int] = None, source=None
+    ):
+        """Grouped daily totals computed from raw transactions.
+
+        `source` defaults to the hot and archived transactions together.
+        """
+        history = source if source is not None else transaction_archive.history()
+        filters = []
+        if user_id is not None:
+            filters.append(history.c.user_id == user_id)
+        if account_id is not None:
+            filters.append(history.c.account_id == account_id)
+
+        day = cast(history.c.transaction_date, Date)
+        return (
+            select(
+                history.c.user_id,
+                history.c.category_id,
+                history.c.transaction_type,
+                day.label("day"),
+                func.sum(history.c.amount).label("total_amount"),
+                func.count(history.c.id).label("transaction_count"),
+            )
+            .where(*filters)
+            .group_by(
+                history.c.user_id,
+                history.c.category_id,
+                history.c.transaction_type,
+                day,
+            )
+        )
+
+    def _subtract(self, db: Session, aggregate) -> None:
+        aggregate = aggregate.subquery()
+        source = select(
+            aggregate.c.user_id,
+            aggregate.c.category_id,
+            aggregate.c.transaction_type,
+            aggregate.c.day,
+            -aggregate.c.total_amount,
+            -aggregate.c.transaction_count,
+        )
+        self._upsert(
+            db,
+            pg_insert(DailySpendingRollup).from_select(
+                KEY_COLUMNS + ["total_amount", "transaction_count"], source
+            ),
+        )
+
+    def remove_account(self, db: Session, *, account_id: int) -> None:
+        """Subtract every transaction of an account (before it is deleted)."""
+        self._subtract(db, self._aggregate_transactions(account_id=account_id))
+
+    def remove_rows(self, db: Session, *, source) -> None:
+        """Subtract every transaction in `source` (before its rows are deleted in bulk).
+
+        `source` is a table with the transactions columns, e.g. a detached partition.
+        """
+        self._subtract(db, self._aggregate_transactions(source=source))
+
+    def backfill(self, db: Session, *, user_id: Optional[int] = None) -> None:
+        """Rebuild the rollup from raw transactions (all users or one)."""
+        clear = delete(DailySpendingRollup)
+        if user_id is not None:
+            clear = clear.where(DailySpendingRollup.user_id == user_id)
+
+        db.execute(clear)
+        db.execute(
+            pg_insert(DailySpendingRollup).from_select(
+                KEY_COLUMNS + ["total_amount", "transaction_count"],
+                self._aggregate_transactions(user_id=user_id),
+            )
+        )
+        db.commit()
+
+    def check_drift(self, db: Session, *, user_id: Optional[int] = None) -> List[dict]:
+        """Compare the rollup against raw (hot and archived) transactions and return mismatches."""
+        rollup_filters = [DailySpendingRollup.transaction_count != 0]
+        if user_id is not None:
+            rollup_filters.append(DailySpendingRollup.user_id == user_id)
+
+        expected = self._aggregate_transactions(user_id=user_id).cte("expected")
+        actual = (
+            select(
+                DailySpendingRollup.user_id,
+                DailySpendingRollup.category_id,
+                DailySpendingRollup.transaction_type,
+                DailySpendingRollup.day,
+                DailySpendingRollup.total_amount,
+                DailySpendingRollup.transaction_count,
+            )
+            .where(*rollup_filters)
+            .cte("actual")
+        )
+
+        on_key = and_(
+            expected.c.user_id == actual.c.user_id,
+            expected.c.category_id.is_not_distinct_from(actual.c.category_id),
+            expected.c.transaction_type == actual.c.transaction_type,
+            expected.c.day == actual.c.day,
+        )
+        rows = db.execute(
+            select(
+                func.coalesce(expected.c.user_id, actual.c.user_id).label("user_id"),
+                func.coalesce(expected.c.category_id, actual.c.category_id).label("category_id"),
+                func.coalesce(expected.c.transaction_type, actual.c.transaction_type).label("transaction_type"),
+                func.coalesce(expected.c.day, actual.c.day).label("day"),
+                func.coalesce(expected.c.total_amount, 0).label("expected_amount"),
+                func.coalesce(actual.c.total_amount, 0).label("actual_amount"),
+                func.coalesce(expected.c.transaction_count, 0).label("expected_count"),
+                func.coalesce(actual.c.transaction_count, 0).label("actual_count"),
+            )
+            .select_from(expected.outerjoin(actual, on_key, full=True))
+            .where(
+                or_(
+                    func.coalesce(expected.c.total_amount, 0) != func.coalesce(actual.c.total_amount, 0),
+                    func.coalesce(expected.c.transaction_count, 0) != func.coalesce(actual.c.transaction_count, 0),
+                )
+            )
+        ).all()
+        return [dict(row._mapping) for row in rows]
+
+    def get_total(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        transaction_type: str,
+        category_id: Optional[int] = None,
+        start_day: Optional[date] = None,
+        end_day: Optional[date] = None,
+    ) -> Decimal:
+        """Sum of amounts for a user over an inclusive day range."""
+        query = db.query(func.sum(DailySpendingRollup.total_amount)).filter(
+            DailySpendingRollup.user_id == user_id,
+            DailySpendingRollup.transaction_type == transaction_type,
+        )
+        if category_id is not None:
+            query = query.filter(DailySpendingRollup.category_id == category_id)
+        if start_day:
+            query = query.filter(DailySpendingRollup.day >= start_day)
+        if end_day:
+            query = query.filter(DailySpendingRollup.day <= end_day)
+        return query.scalar() or Decimal("0.00")
+
+
+spending_rollup = CRUDSpendingRollup()
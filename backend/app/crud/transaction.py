@@ -1,17 +1,94 @@
-from typing import List, Optional
-from datetime import datetime
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from types import SimpleNamespace
+from datetime import datetime, timedelta
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import DateTime, Float, Integer, Numeric, String, and_, cast, column, desc, func, literal, literal_column, or_, select, true, tuple_, union_all, update, values
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from app.crud.base import CRUDBase
-from app.models.transaction import Transaction
+from app.models.transaction import Transaction, fingerprint_sql
+from app.models.transaction_archive import TransactionArchive
 from app.models.account import Account
-from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.crud.balance_ledger import balance_effect, balance_ledger
+from app.crud.spending_rollup import spending_rollup
+from app.crud.transaction_archive import archive_cutoff, transaction_archive
+from app.crud.budget import budget as crud_budget
+from app.schemas.transaction import (
+    TransactionBatchItemResult,
+    TransactionBatchOperation,
+    TransactionCreate,
+    TransactionUpdate,
+)
+
+
+def snapshot(transaction: Transaction) -> SimpleNamespace:
+    """Copy the fields that feed rollups, budgets and balances."""
+    return SimpleNamespace(
+        user_id=transaction.user_id,
+        account_id=transaction.account_id,
+        category_id=transaction.category_id,
+        transaction_type=transaction.transaction_type,
+        transaction_date=transaction.transaction_date,
+        amount=transaction.amount,
+    )
 
 
 class CRUDTransaction(CRUDBase[Transaction, TransactionCreate, TransactionUpdate]):
     """CRUD operations for Transaction model."""
 
+    @staticmethod
+    def user_filters(
+        *,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: str = "any",
+        model=Transaction,
+    ) -> list:
+        """Filter clauses shared by the list and export queries.
+
+        `tags` matches transactions carrying any of the given tags, or all
+        of them when tags_match is "all". `model` selects the hot table
+        (Transaction) or the archive (TransactionArchive).
+        """
+        filters = [model.user_id == user_id]
+        if start_date:
+            filters.append(model.transaction_date >= start_date)
+        if end_date:
+            filters.append(model.transaction_date <= end_date)
+        if account_id:
+            filters.append(model.account_id == account_id)
+        if category_id:
+            filters.append(model.category_id == category_id)
+        if tags:
+            if tags_match == "all":
+                filters.append(model.tags.contains(tags))
+            else:
+                filters.append(model.tags.overlap(tags))
+        return filters
+
+    def _page(
+        self, db: Session, model, filters: list, *, skip: int, limit: int,
+        after: Optional[Tuple[datetime, int]],
+    ) -> list:
+        query = db.query(model).filter(*filters)
+        query = query.order_by(desc(model.transaction_date), desc(model.id))
+
+        if after:
+            query = query.filter(
+                # The plain date bound lets the planner prune later partitions
+                model.transaction_date <= after[0],
+                tuple_(model.transaction_date, model.id) < tuple_(*after),
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
     def get_by_user(
         self,
         db: Session,
@@ -23,49 +100,400 @@ class CRUDTransaction(CRUDBase[Transaction, TransactionCreate, TransactionUpdate
         end_date: Optional[datetime] = None,
         account_id: Optional[int] = None,
         category_id: Optional[int] = None,
-    ) -> List[Transaction]:
-        """Get all transactions for a user with optional filters."""
-        query = db.query(Transaction).filter(Transaction.user_id == user_id)
+        tags: Optional[List[str]] = None,
+        tags_match: str = "any",
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Union[Transaction, TransactionArchive]]:
+        """Get all transactions for a user with optional filters.
 
-        if start_date:
-            query = query.filter(Transaction.transaction_date >= start_date)
-        if end_date:
-            query = query.filter(Transaction.transaction_date <= end_date)
-        if account_id:
-            query = query.filter(Transaction.account_id == account_id)
-        if category_id:
-            query = query.filter(Transaction.category_id == category_id)
+        Rows are ordered newest first by (transaction_date, id). Passing the
+        key of the last row of a page as `after` continues from that row
+        (keyset pagination) and ignores `skip`.
+
+        Archived rows are read only when the date range reaches past the
+        archive cutoff and the hot table cannot fill the page on its own;
+        the page is then cut from a UNION ALL of both tables in SQL.
+        """
+        filter_args = dict(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            account_id=account_id,
+            category_id=category_id,
+            tags=tags,
+            tags_match=tags_match,
+        )
+        cutoff = archive_cutoff()
+        rows = self._page(
+            db, Transaction, self.user_filters(**filter_args), skip=skip, limit=limit, after=after
+        )
+        if start_date and start_date >= cutoff:
+            return rows
+        # Every archived row is older than the cutoff, so none can rank above this page
+        if rows and len(rows) == limit and rows[-1].transaction_date >= cutoff:
+            return rows
+        return self._history_page(db, filter_args, skip=skip, limit=limit, after=after)
+
+    def _history_page(
+        self, db: Session, filter_args: Dict[str, Any], *, skip: int, limit: int,
+        after: Optional[Tuple[datetime, int]],
+    ) -> List[Union[Transaction, TransactionArchive]]:
+        """Page of hot and archived transactions, ordered and cut in SQL.
+
+        The UNION ALL only carries (source, id, transaction_date) keys; the
+        page's rows are then loaded from their own table.
+        """
+        def keys(model, source: str):
+            query = select(
+                literal(source).label("source"), model.id, model.transaction_date
+            ).where(*self.user_filters(**filter_args, model=model))
+            if after:
+                query = query.where(
+                    model.transaction_date <= after[0],
+                    tuple_(model.transaction_date, model.id) < tuple_(*after),
+                )
+            return query
+
+        history = union_all(
+            keys(Transaction, "hot"), keys(TransactionArchive, "archive")
+        ).subquery()
+        page = db.execute(
+            select(history)
+            .order_by(desc(history.c.transaction_date), desc(history.c.id))
+            .offset(0 if after else skip)
+            .limit(limit)
+        ).all()
+
+        loaded = {}
+        for source, model in (("hot", Transaction), ("archive", TransactionArchive)):
+            wanted = [(key.id, key.transaction_date) for key in page if key.source == source]
+            if wanted:
+                for row in db.query(model).filter(
+                    tuple_(model.id, model.transaction_date).in_(wanted)
+                ):
+                    loaded[source, row.id] = row
+        return [loaded[key.source, key.id] for key in page]
+
+    def export_statement(
+        self,
+        *,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: str = "any",
+    ):
+        """Column-only select of a user's history in (transaction_date, id) order.
+
+        Rows are plain tuples rather than ORM objects, so they can be streamed
+        with yield_per without filling the identity map. Archived rows are
+        included (UNION ALL) when the date range reaches past the archive
+        cutoff.
+        """
+        filter_args = dict(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            account_id=account_id,
+            category_id=category_id,
+            tags=tags,
+            tags_match=tags_match,
+        )
+
+        def columns(model):
+            return select(
+                model.id,
+                model.account_id,
+                model.category_id,
+                model.amount,
+                model.description,
+                model.merchant,
+                model.transaction_type,
+                model.transaction_date,
+                model.tags,
+                model.notes,
+            ).where(*self.user_filters(**filter_args, model=model))
+
+        if start_date and start_date >= archive_cutoff():
+            return columns(Transaction).order_by(Transaction.transaction_date, Transaction.id)
+
+        history = union_all(columns(Transaction), columns(TransactionArchive)).subquery()
+        return select(history).order_by(history.c.transaction_date, history.c.id)
+
+    def search(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        query: str,
+        limit: int = 50,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        category_id: Optional[int] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[Transaction, float]]:
+        """Ranked search over description, merchant and notes.
+
+        A row matches on full-text terms, on a substring, or on a fuzzy
+        (trigram word similarity) match, each served by a GIN index that
+        leads with user_id. Results are (transaction, rank) pairs ordered by
+        (rank, id) descending; pass the pair of the last row as `after` for
+        the next page.
+        """
+        text = query.strip().lower()
+        ts_query = func.websearch_to_tsquery("simple", text)
+        # Both scores are normalized to [0, 1]
+        score = cast(
+            func.greatest(
+                func.ts_rank_cd(Transaction.search_vector, ts_query, 32),
+                func.word_similarity(text, Transaction.search_text),
+            ),
+            Float,
+        )
+
+        filters = self.user_filters(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            category_id=category_id,
+        )
+        if min_amount is not None:
+            filters.append(Transaction.amount >= min_amount)
+        if max_amount is not None:
+            filters.append(Transaction.amount <= max_amount)
+        filters.append(
+            or_(
+                Transaction.search_vector.op("@@")(ts_query),
+                Transaction.search_text.contains(text, autoescape=True),
+                literal(text).op("<%")(Transaction.search_text),
+            )
+        )
+        if after:
+            filters.append(tuple_(score, Transaction.id) < tuple_(*after))
 
         return (
-            query.order_by(desc(Transaction.transaction_date))
-            .offset(skip)
+            db.query(Transaction, score.label("rank"))
+            .filter(*filters)
+            .order_by(desc(score), desc(Transaction.id))
             .limit(limit)
             .all()
         )
 
+    def get_tag_totals(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        transaction_type: str = "expense",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Total amount and count per tag, largest first, in one grouped query.
+
+        A transaction with several tags counts toward each of them.
+        """
+        tag = func.unnest(Transaction.tags).table_valued("tag").lateral("tag_values")
+        filters = self.user_filters(user_id=user_id, start_date=start_date, end_date=end_date)
+        filters.append(Transaction.transaction_type == transaction_type)
+
+        total = func.sum(Transaction.amount)
+        rows = db.execute(
+            select(
+                tag.c.tag,
+                total.label("total"),
+                func.count(Transaction.id).label("transaction_count"),
+            )
+            .select_from(Transaction)
+            .join(tag, true())
+            .where(*filters)
+            .group_by(tag.c.tag)
+            .order_by(total.desc(), tag.c.tag)
+        ).all()
+        return [dict(row._mapping) for row in rows]
+
+    def find_duplicates(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        rows: Sequence[Any],
+        inserted: Optional[Counter] = None,
+    ) -> List[Tuple[str, Optional[int]]]:
+        """Fingerprint of each candidate row and the id of an existing row it duplicates.
+
+        One query per batch: candidates (anything with account_id,
+        transaction_date, amount and description) go in as a VALUES list,
+        are fingerprinted with the generated column's SQL and probe the
+        fingerprint hash indexes of the hot and archive tables. Matching is
+        one-to-one, so two identical candidates are both duplicates only if
+        two identical rows exist. `inserted` counts fingerprints written
+        earlier in the same database transaction (e.g. previous import
+        chunks); those rows are not treated as pre-existing.
+        """
+        if not rows:
+            return []
+
+        candidates = values(
+            column("position", Integer),
+            column("account_id", Integer),
+            column("transaction_date", DateTime),
+            column("amount", Numeric(15, 2)),
+            column("description", String),
+            name="candidates",
+        ).data([
+            (position, row.account_id, row.transaction_date, row.amount, row.description)
+            for position, row in enumerate(rows)
+        ])
+        fingerprint = literal_column(fingerprint_sql("candidates"), String)
+
+        # Date bounds let the planner prune partitions
+        first_day = min(row.transaction_date for row in rows).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        last_day = max(row.transaction_date for row in rows).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) + timedelta(days=1)
+        existing = union_all(*[
+            select(model.id, model.account_id, model.fingerprint).where(
+                model.user_id == user_id,
+                model.transaction_date >= first_day,
+                model.transaction_date < last_day,
+            )
+            for model in (Transaction, TransactionArchive)
+        ]).subquery("existing")
+
+        matches = db.execute(
+            select(
+                candidates.c.position,
+                fingerprint.label("fingerprint"),
+                func.array_agg(aggregate_order_by(existing.c.id, existing.c.id))
+                .filter(existing.c.id.is_not(None))
+                .label("ids"),
+            )
+            .select_from(candidates)
+            .outerjoin(
+                existing,
+                and_(
+                    existing.c.fingerprint == fingerprint,
+                    existing.c.account_id == candidates.c.account_id,
+                ),
+            )
+            .group_by(candidates.c.position, fingerprint)
+            .order_by(candidates.c.position)
+        ).all()
+
+        pools: Dict[str, List[int]] = {}
+        results = []
+        for match in matches:
+            if match.fingerprint not in pools:
+                ids = match.ids or []
+                # Rows written earlier in this transaction have the newest ids
+                own = (inserted or {}).get(match.fingerprint, 0)
+                pools[match.fingerprint] = ids[:max(len(ids) - own, 0)]
+            pool = pools[match.fingerprint]
+            results.append((match.fingerprint, pool.pop(0) if pool else None))
+        return results
+
+    def get_duplicate_groups(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        limit: int = 100,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Groups of existing transactions sharing a fingerprint, most recent first."""
+        filters = self.user_filters(user_id=user_id, start_date=start_date, end_date=end_date)
+        count = func.count(Transaction.id)
+        rows = db.execute(
+            select(
+                Transaction.fingerprint,
+                Transaction.account_id,
+                func.min(Transaction.transaction_date).label("transaction_date"),
+                func.min(Transaction.amount).label("amount"),
+                func.min(Transaction.description).label("description"),
+                count.label("count"),
+                func.array_agg(aggregate_order_by(Transaction.id, Transaction.id)).label("transaction_ids"),
+            )
+            .where(*filters)
+            .group_by(Transaction.fingerprint, Transaction.account_id)
+            .having(count > 1)
+            .order_by(func.max(Transaction.transaction_date).desc(), Transaction.fingerprint)
+            .limit(limit)
+        ).all()
+        return [dict(row._mapping) for row in rows]
+
     def get_user_transaction(
-        self, db: Session, *, transaction_id: int, user_id: int
-    ) -> Optional[Transaction]:
-        """Get a specific transaction for a user (with ownership check)."""
+        self, db: Session, *, transaction_id: int, user_id: int, restore_archived: bool = False
+    ) -> Optional[Union[Transaction, TransactionArchive]]:
+        """Get a specific transaction for a user (with ownership check).
+
+        Falls back to the archive, as the listings do. Archived rows are
+        read-only; with restore_archived=True (before changing the row) an
+        archived transaction is moved back to the hot table inside the
+        current database transaction and returned as a Transaction.
+        """
+        def hot() -> Optional[Transaction]:
+            return (
+                db.query(Transaction)
+                .filter(
+                    Transaction.id == transaction_id, Transaction.user_id == user_id
+                )
+                .first()
+            )
+
+        obj = hot()
+        if obj is not None:
+            return obj
+        if restore_archived:
+            restored = transaction_archive.restore(
+                db, transaction_ids=[transaction_id], user_id=user_id
+            )
+            return hot() if restored else None
         return (
-            db.query(Transaction)
+            db.query(TransactionArchive)
             .filter(
-                Transaction.id == transaction_id, Transaction.user_id == user_id
+                TransactionArchive.id == transaction_id, TransactionArchive.user_id == user_id
             )
             .first()
         )
 
+    def adjust_balance(
+        self, db: Session, *, account_id: int, user_id: int, delta: Decimal
+    ) -> Optional[Decimal]:
+        """Atomically add delta to an owned account's balance.
+
+        One UPDATE ... SET balance = balance + :delta ... RETURNING, so
+        concurrent writers serialize on the row lock instead of overwriting
+        each other's read-modify-write. Returns the new balance, or None
+        when the account does not exist or belongs to another user (which
+        doubles as the ownership check).
+        """
+        return db.execute(
+            update(Account)
+            .where(Account.id == account_id, Account.user_id == user_id)
+            .values(balance=Account.balance + delta)
+            .returning(Account.balance)
+            .execution_options(synchronize_session="fetch")
+        ).scalar_one_or_none()
+
     def create_with_user(
         self, db: Session, *, obj_in: TransactionCreate, user_id: int
     ) -> Transaction:
         """Create a transaction and update account balance."""
-        # CRITICAL: Verify account ownership
-        account = (
-            db.query(Account)
-            .filter(Account.id == obj_in.account_id, Account.user_id == user_id)
-            .first()
+        # CRITICAL: Ownership check and balance change in one statement
+        new_balance = self.adjust_balance(
+            db,
+            account_id=obj_in.account_id,
+            user_id=user_id,
+            delta=balance_effect(obj_in.transaction_type, obj_in.amount),
         )
-        if not account:
+        if new_balance is None:
             raise ValueError("Account not found or access denied")
 
         # Create transaction
@@ -74,21 +502,288 @@ class CRUDTransaction(CRUDBase[Transaction, TransactionCreate, TransactionUpdate
             user_id=user_id,
         )
         db.add(db_obj)
+        balance_ledger.apply(db, transaction=db_obj)
+        spending_rollup.apply(db, transaction=db_obj)
+        crud_budget.apply_transactions(db, transactions=[db_obj])
+
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Transaction,
+        obj_in: Union[TransactionUpdate, Dict[str, Any]]
+    ) -> Transaction:
+        """Update a transaction and move its balance, rollup and budget contributions.
+
+        The old effect is taken off the old account and the new effect put
+        on the new one, so amount, type and account changes are all covered.
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        old = snapshot(db_obj)
+        for field in update_data:
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, update_data[field])
 
-        # Update account balance
-        # CRITICAL: Server-side calculation using Decimal
-        amount = Decimal(str(obj_in.amount))
-        if obj_in.transaction_type == "income":
-            account.balance += amount
-        elif obj_in.transaction_type == "expense":
-            account.balance -= amount
-        # Note: transfers handled separately
+        deltas = {old.account_id: -balance_effect(old.transaction_type, old.amount)}
+        deltas[db_obj.account_id] = (
+            deltas.get(db_obj.account_id, Decimal("0.00"))
+            + balance_effect(db_obj.transaction_type, db_obj.amount)
+        )
+        # Lock accounts in id order, before any other row, so concurrent writers cannot deadlock
+        for account_id in sorted(deltas):
+            new_balance = self.adjust_balance(
+                db, account_id=account_id, user_id=old.user_id, delta=deltas[account_id]
+            )
+            if new_balance is None:
+                db.rollback()
+                raise ValueError("Account not found or access denied")
+
+        balance_ledger.apply(db, transaction=old, sign=-1)
+        balance_ledger.apply(db, transaction=db_obj)
+        spending_rollup.apply(db, transaction=old, sign=-1)
+        crud_budget.apply_transactions(db, transactions=[old], sign=-1)
+        spending_rollup.apply(db, transaction=db_obj)
+        crud_budget.apply_transactions(db, transactions=[db_obj])
 
-        db.add(account)
+        db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def delete(
+        self, db: Session, *, id: int, transaction_date: Optional[datetime] = None
+    ) -> Transaction:
+        """Delete a transaction and reverse its balance, rollup and budget effects.
+
+        With transaction_date (the rest of the key) a transaction already
+        loaded in the session is taken from its identity map, and otherwise
+        only its own partition is searched.
+        """
+        if transaction_date is not None:
+            obj = db.get(Transaction, (id, transaction_date))
+        else:
+            obj = db.query(Transaction).filter(Transaction.id == id).one()
+        # Also locks the account (even for a zero delta) before the rows behind it
+        self.adjust_balance(
+            db,
+            account_id=obj.account_id,
+            user_id=obj.user_id,
+            delta=-balance_effect(obj.transaction_type, obj.amount),
+        )
+        balance_ledger.apply(db, transaction=obj, sign=-1)
+        spending_rollup.apply(db, transaction=obj, sign=-1)
+        crud_budget.apply_transactions(db, transactions=[obj], sign=-1)
+        db.delete(obj)
+        db.commit()
+        return obj
+
+    def lock_accounts(
+        self, db: Session, *, account_ids: Iterable[int], user_id: int
+    ) -> Set[int]:
+        """Lock the user's accounts among account_ids, in id order; returns the ids found.
+
+        Every write path takes its account locks before touching the ledger,
+        rollup, budget or transaction rows (the single-row paths through
+        adjust_balance), so writers of the same account queue on the account
+        row instead of deadlocking on the rows behind it. Accounts that do
+        not exist or belong to another user are left out of the result,
+        which doubles as the ownership check.
+        """
+        if not account_ids:
+            return set()
+        return set(
+            db.execute(
+                select(Account.id)
+                .where(Account.id.in_(account_ids), Account.user_id == user_id)
+                .order_by(Account.id)
+                .with_for_update()
+            ).scalars()
+        )
+
+    def apply_balance_deltas(self, db: Session, *, deltas: Dict[int, Decimal]) -> None:
+        """Apply net balance changes to several accounts in one UPDATE ... FROM.
+
+        The accounts must already be locked with lock_accounts.
+        """
+        deltas = {account_id: delta for account_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        changes = values(
+            column("account_id", Integer),
+            column("delta", Numeric(15, 2)),
+            name="balance_deltas",
+        ).data(list(deltas.items()))
+
+        db.execute(
+            update(Account)
+            .where(Account.id == changes.c.account_id)
+            .values(balance=Account.balance + changes.c.delta)
+            .execution_options(synchronize_session=False)
+        )
+
+    def apply_batch(
+        self,
+        db: Session,
+        *,
+        operations: List[TransactionBatchOperation],
+        user_id: int,
+        atomic: bool = False,
+        duplicates: str = "allow",
+    ) -> List[TransactionBatchItemResult]:
+        """Apply create/update/delete operations in one database transaction.
+
+        Every account the batch can touch is locked first, in id order, with
+        one query that also checks ownership; the targeted transactions are
+        then loaded with one query, and balances, rollups and budget
+        counters receive one net adjustment each. Failed items are reported
+        and skipped; with atomic=True any failure rolls back the whole batch.
+
+        Creates are checked for duplicates of existing transactions with one
+        lookup. With duplicates="skip" they are skipped; otherwise they are
+        created and flagged in the item's detail.
+        """
+        account_ids = {
+            op.data.account_id
+            for op in operations
+            if op.op != "delete" and op.data.account_id is not None
+        }
+        transaction_ids = {op.id for op in operations if op.op != "create"}
+        if transaction_ids:
+            # Archived targets are read-only; bring them back to the hot table first
+            transaction_archive.restore(db, transaction_ids=transaction_ids, user_id=user_id)
+            account_ids.update(
+                db.execute(
+                    select(Transaction.account_id).where(
+                        Transaction.id.in_(transaction_ids), Transaction.user_id == user_id
+                    )
+                ).scalars()
+            )
+
+        # CRITICAL: Verify account ownership and lock the accounts before any other row
+        owned_accounts = self.lock_accounts(db, account_ids=account_ids, user_id=user_id)
+        existing = {
+            t.id: t
+            for t in db.query(Transaction).filter(
+                Transaction.id.in_(transaction_ids), Transaction.user_id == user_id
+            )
+        } if transaction_ids else {}
+        # A transaction moved to another account since the first read
+        moved_to = {t.account_id for t in existing.values()} - owned_accounts
+        owned_accounts |= self.lock_accounts(db, account_ids=moved_to, user_id=user_id)
+
+        creates = [
+            (index, op.data)
+            for index, op in enumerate(operations)
+            if op.op == "create" and op.data.account_id in owned_accounts
+        ]
+        matches = self.find_duplicates(db, user_id=user_id, rows=[data for _, data in creates])
+        duplicate_of = {
+            index: existing_id
+            for (index, _), (_, existing_id) in zip(creates, matches)
+            if existing_id is not None
+        }
+
+        results: List[TransactionBatchItemResult] = []
+        created: List[Tuple[int, Transaction]] = []
+        removed: List[Any] = []
+        added: List[Any] = []
+        balance_deltas: Dict[int, Decimal] = {}
+
+        def add_delta(account_id: int, delta: Decimal) -> None:
+            balance_deltas[account_id] = balance_deltas.get(account_id, Decimal("0.00")) + delta
+
+        for index, op in enumerate(operations):
+            if op.op == "create":
+                if op.data.account_id not in owned_accounts:
+                    results.append(TransactionBatchItemResult(
+                        index=index, op=op.op, status="error",
+                        detail="Account not found or access denied",
+                    ))
+                    continue
+                if index in duplicate_of and duplicates == "skip":
+                    results.append(TransactionBatchItemResult(
+                        index=index, op=op.op, status="skipped",
+                        detail=f"Duplicate of transaction {duplicate_of[index]}",
+                    ))
+                    continue
+                db_obj = Transaction(**op.data.model_dump(), user_id=user_id)
+                db.add(db_obj)
+                created.append((index, db_obj))
+                added.append(db_obj)
+                add_delta(db_obj.account_id, balance_effect(db_obj.transaction_type, db_obj.amount))
+                results.append(TransactionBatchItemResult(
+                    index=index, op=op.op, status="ok",
+                    detail=(
+                        f"Possible duplicate of transaction {duplicate_of[index]}"
+                        if index in duplicate_of else None
+                    ),
+                ))
+                continue
+
+            db_obj = existing.get(op.id)
+            if db_obj is None:
+                results.append(TransactionBatchItemResult(
+                    index=index, op=op.op, status="error", id=op.id,
+                    detail="Transaction not found",
+                ))
+                continue
+
+            if op.op == "update":
+                update_data = op.data.model_dump(exclude_unset=True)
+                if "account_id" in update_data and update_data["account_id"] not in owned_accounts:
+                    results.append(TransactionBatchItemResult(
+                        index=index, op=op.op, status="error", id=op.id,
+                        detail="Account not found or access denied",
+                    ))
+                    continue
+                old = snapshot(db_obj)
+                for field in update_data:
+                    if hasattr(db_obj, field):
+                        setattr(db_obj, field, update_data[field])
+                removed.append(old)
+                added.append(snapshot(db_obj))
+                add_delta(old.account_id, -balance_effect(old.transaction_type, old.amount))
+                add_delta(db_obj.account_id, balance_effect(db_obj.transaction_type, db_obj.amount))
+            else:
+                old = snapshot(db_obj)
+                removed.append(old)
+                add_delta(old.account_id, -balance_effect(old.transaction_type, old.amount))
+                db.delete(db_obj)
+                del existing[op.id]
+
+            results.append(TransactionBatchItemResult(index=index, op=op.op, status="ok", id=op.id))
+
+        failed = [r for r in results if r.status == "error"]
+        if atomic and failed:
+            db.rollback()
+            for r in results:
+                if r.status == "ok":
+                    r.status = "skipped"
+            return results
+
+        balance_ledger.apply_many(db, transactions=removed, sign=-1)
+        balance_ledger.apply_many(db, transactions=added)
+        spending_rollup.apply_many(db, transactions=removed, sign=-1)
+        spending_rollup.apply_many(db, transactions=added)
+        crud_budget.apply_transactions(db, transactions=removed, sign=-1)
+        crud_budget.apply_transactions(db, transactions=added)
+        self.apply_balance_deltas(db, deltas=balance_deltas)
+
+        db.flush()
+        for index, db_obj in created:
+            results[index].id = db_obj.id
+        db.commit()
+        return results
+
     def get_recent_transactions(
         self, db: Session, *, user_id: int, limit: int = 10
     ) -> List[Transaction]:
@@ -0,0 +1,128 @@
+from typing import Collection, Optional
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, insert, select, tuple_, union_all
+from app.core.config import settings
+from app.models.transaction import Transaction
+from app.models.transaction_archive import TransactionArchive
+
+ARCHIVED_COLUMNS = [
+    "id", "user_id", "account_id", "category_id", "amount", "description", "merchant",
+    "transaction_type", "transaction_date", "tags", "notes", "created_at", "updated_at",
+]
+BATCH_SIZE = 50000
+
+
+def archive_cutoff(now: Optional[datetime] = None) -> datetime:
+    """Start of the oldest month kept in the hot transactions table.
+
+    Everything in the archive is older than the cutoff in force when the
+    archive job last ran, and the cutoff only moves forward in time, so
+    reads starting at or after the current cutoff never need the archive.
+    """
+    month = (now or datetime.utcnow()) - relativedelta(months=settings.ARCHIVE_HORIZON_MONTHS)
+    return datetime(month.year, month.month, 1)
+
+
+class CRUDTransactionArchive:
+    """Moves transactions between the hot table and the archive table.
+
+    Archived rows are read-only: changing one restores it to the hot table
+    first (see restore). The spending rollup and balance ledger are maintained when transactions
+    are written, so archived rows are already aggregated; moving them does
+    not touch either.
+    """
+
+    def __init__(self):
+        self.model = TransactionArchive
+
+    def history(self):
+        """Hot and archived transactions as one selectable (UNION ALL)."""
+        return union_all(
+            select(*[getattr(Transaction, name) for name in ARCHIVED_COLUMNS]),
+            select(*[getattr(TransactionArchive, name) for name in ARCHIVED_COLUMNS]),
+        ).subquery("transaction_history")
+
+    def _move_batch(self, db: Session, *, source, target, condition, batch_size: int) -> int:
+        """Move up to batch_size rows matching condition from source to target (no commit)."""
+        batch = select(source.c.id, source.c.transaction_date).where(condition).limit(batch_size)
+        moved = (
+            delete(source)
+            .where(tuple_(source.c.id, source.c.transaction_date).in_(batch))
+            .returning(*[source.c[name] for name in ARCHIVED_COLUMNS])
+            .cte("moved")
+        )
+        return db.execute(
+            insert(target).from_select(
+                ARCHIVED_COLUMNS,
+                select(*[moved.c[name] for name in ARCHIVED_COLUMNS]),
+            )
+        ).rowcount
+
+    def _move(self, db: Session, *, source, target, condition, batch_size: int) -> int:
+        """Move rows matching condition from source to target in committed batches."""
+        moved_total = 0
+        while True:
+            moved = self._move_batch(
+                db, source=source, target=target, condition=condition, batch_size=batch_size
+            )
+            db.commit()
+            moved_total += moved
+            if moved < batch_size:
+                return moved_total
+
+    def archive_before(
+        self, db: Session, *, before: datetime, batch_size: int = BATCH_SIZE
+    ) -> int:
+        """Move transactions dated before `before` into the archive."""
+        hot = Transaction.__table__
+        return self._move(
+            db,
+            source=hot,
+            target=TransactionArchive.__table__,
+            condition=hot.c.transaction_date < before,
+            batch_size=batch_size,
+        )
+
+    def restore_since(
+        self, db: Session, *, since: datetime, batch_size: int = BATCH_SIZE
+    ) -> int:
+        """Move archived transactions dated at or after `since` back to the hot table.
+
+        Needed after the horizon is lengthened, to keep the archive strictly
+        older than the current cutoff.
+        """
+        cold = TransactionArchive.__table__
+        return self._move(
+            db,
+            source=cold,
+            target=Transaction.__table__,
+            condition=cold.c.transaction_date >= since,
+            batch_size=batch_size,
+        )
+
+    def restore(self, db: Session, *, transaction_ids: Collection[int], user_id: int) -> int:
+        """Move a user's archived transactions back to the hot table so they can be changed.
+
+        Runs in the caller's database transaction (no commit), so the move
+        commits or rolls back with the change that needed it. Ids that are
+        not archived are ignored; returns how many rows moved.
+        """
+        if not transaction_ids:
+            return 0
+        cold = TransactionArchive.__table__
+        return self._move_batch(
+            db,
+            source=cold,
+            target=Transaction.__table__,
+            condition=and_(cold.c.id.in_(transaction_ids), cold.c.user_id == user_id),
+            batch_size=len(transaction_ids),
+        )
+
+    def remove_account(self, db: Session, *, account_id: int) -> None:
+        """Delete the archived transactions of an account (before it is deleted)."""
+        db.execute(delete(TransactionArchive).where(TransactionArchive.account_id == account_id))
+
+
+transaction_archive = CRUDTransactionArchive()
@@ -1,9 +1,10 @@
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.auth_cache import auth_cache
+from app.core.security import get_password_hash, verify_and_update_password
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -13,11 +14,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """Get user by email."""
         return db.query(User).filter(User.email == email).first()
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
-        """Create a new user with hashed password."""
+    def create(
+        self, db: Session, *, obj_in: UserCreate, hashed_password: Optional[str] = None
+    ) -> User:
+        """Create a new user with hashed password.
+
+        Callers that hash off the request thread (see app.core.password_pool)
+        pass the finished hash; otherwise the password is hashed inline.
+        """
         db_obj = User(
             email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=hashed_password or get_password_hash(obj_in.password),
             full_name=obj_in.full_name,
             is_active=True,
             is_superuser=False,
@@ -33,10 +40,39 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         user = self.get_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            user = self.update_password_hash(db, db_obj=user, hashed_password=new_hash)
         return user
 
+    def update_password_hash(self, db: Session, *, db_obj: User, hashed_password: str) -> User:
+        """Store a re-computed hash of the user's unchanged password."""
+        return self.update(db, db_obj=db_obj, obj_in={"hashed_password": hashed_password})
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: User,
+        obj_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> User:
+        """Update a user and drop it from the authentication cache.
+
+        Every change to a user goes through here (or delete), including
+        is_active and subscription_tier, so no cached copy outlives it.
+        """
+        db_obj = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        auth_cache.invalidate_user(db_obj.id)
+        return db_obj
+
+    def delete(self, db: Session, *, id: int) -> User:
+        """Delete a user and drop it from the authentication cache."""
+        obj = super().delete(db, id=id)
+        auth_cache.invalidate_user(id)
+        return obj
+
     def is_active(self, user: User) -> bool:
         """Check if user is active."""
         return user.is_active
@@ -1,11 +1,29 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.auth_cache import auth_cache
+from app.core.cache import response_cache
+from app.core.database import engine, get_async_engine, get_async_replica_engine
+from app.core.db_pool import pool_stats
+from app.core.read_routing import read_router
+from app.core.password_pool import PasswordHasherBusy, password_hasher
+from app.api import deps
 from app.api.v1.api import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    password_hasher.shutdown()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS middleware - Allow specified origins
@@ -15,12 +33,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Seconds a client should wait before retrying a rejected login or registration
+PASSWORD_BUSY_RETRY_AFTER = 1
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many sign-in attempts in progress, please retry"},
+        headers={"Retry-After": str(PASSWORD_BUSY_RETRY_AFTER)},
+    )
+
+
 @app.get("/")
 async def root():
     return {
@@ -33,3 +64,33 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "WealthFlow"}
+
+
+# Internal metrics: pool state, cache and authentication counters, superusers only
+metrics_router = APIRouter(
+    prefix="/metrics", dependencies=[Depends(deps.get_current_active_superuser)]
+)
+
+
+@metrics_router.get("/cache")
+async def cache_metrics():
+    return response_cache.stats()
+
+
+@metrics_router.get("/auth")
+async def auth_metrics():
+    return {**auth_cache.stats(), "password_hasher": password_hasher.stats()}
+
+
+@metrics_router.get("/db")
+async def db_metrics():
+    replica = get_async_replica_engine()
+    return {
+        "sync": pool_stats(engine),
+        "async": pool_stats(get_async_engine().sync_engine),
+        "replica": pool_stats(replica.sync_engine) if replica is not None else None,
+        "routing": read_router.stats(),
+    }
+
+
+app.include_router(metrics_router)
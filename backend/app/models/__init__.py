@@ -2,17 +2,28 @@
 from app.models.user import User
 from app.models.account import Account
 from app.models.category import Category
+from app.models.category_rule import CategoryRule
 from app.models.transaction import Transaction
+from app.models.transaction_archive import TransactionArchive
 from app.models.budget import Budget
 from app.models.savings_goal import SavingsGoal
 from app.models.investment import Investment
+from app.models.spending_rollup import DailySpendingRollup
+from app.models.balance_ledger import AccountBalanceLedger, AccountBalanceSnapshot
+from app.models.recurring_series import RecurringSeries
 
 __all__ = [
     "User",
     "Account",
     "Category",
+    "CategoryRule",
     "Transaction",
+    "TransactionArchive",
     "Budget",
     "SavingsGoal",
     "Investment",
+    "DailySpendingRollup",
+    "AccountBalanceLedger",
+    "AccountBalanceSnapshot",
+    "RecurringSeries",
 ]
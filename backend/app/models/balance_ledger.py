@@ -0,0 +1,63 @@
+from sqlalchemy import Column, Integer, Numeric, ForeignKey, Date, DateTime, Index
+from datetime import datetime
+from app.core.database import Base
+
+
+class AccountBalanceLedger(Base):
+    """Net balance change of an account per day.
+
+    Every balance movement lands here: transaction effects, the opening
+    balance and manual balance corrections. The balance at the end of a day
+    is therefore the sum of all entries up to and including that day.
+    """
+
+    __tablename__ = "account_balance_ledger"
+
+    id = Column(Integer, primary_key=True, index=True)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    # CRITICAL: Use Numeric for currency precision
+    net_change = Column(Numeric(precision=15, scale=2), nullable=False, default=0.00)
+    transaction_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "uq_account_balance_ledger_account_day",
+            "account_id",
+            "day",
+            unique=True,
+            postgresql_include=["net_change"],
+        ),
+    )
+
+
+class AccountBalanceSnapshot(Base):
+    """End-of-day account balance, stored periodically.
+
+    A snapshot caches the ledger prefix sum up to its day, so a balance-as-of
+    lookup is one index seek plus the ledger entries since the snapshot.
+    """
+
+    __tablename__ = "account_balance_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    # CRITICAL: Use Numeric for currency precision
+    balance = Column(Numeric(precision=15, scale=2), nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "uq_account_balance_snapshots_account_day",
+            "account_id",
+            "day",
+            unique=True,
+            postgresql_include=["balance"],
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, Float
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -18,9 +18,16 @@ class Budget(Base):
     alert_threshold = Column(Float, default=0.80)  # 80% alert by default
     start_date = Column(DateTime, nullable=False)
 
+    # Materialized expense total for the budget window, maintained on transaction writes
+    spent = Column(Numeric(precision=15, scale=2), nullable=False, default=0.00, server_default="0")
+
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     user = relationship("User", back_populates="budgets")
     category = relationship("Category", back_populates="budgets")
+
+    __table_args__ = (
+        Index("ix_budgets_user_category", "user_id", "category_id"),
+    )
@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, text
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.core.database import Base
+
+
+class CategoryRule(Base):
+    """Maps a normalized merchant/description phrase to a category.
+
+    System rules (user_id NULL) apply to everyone; a user's own rules are
+    either entered by hand ("manual") or learned from how the user has
+    categorized past transactions ("learned"). For the same phrase, manual
+    rules beat learned ones, which beat system rules.
+    """
+
+    __tablename__ = "category_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)  # NULL for system rules
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
+
+    transaction_type = Column(String, nullable=False)  # income, expense (the category's type)
+    pattern = Column(String, nullable=False)  # normalized tokens, see normalize_text
+    source = Column(String, nullable=False, default="manual")  # manual, learned, system
+    hit_count = Column(Integer, nullable=False, default=0)  # categorized transactions behind a learned rule
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    category = relationship("Category")
+
+    __table_args__ = (
+        Index(
+            "uq_category_rules_user_type_pattern",
+            "user_id",
+            "transaction_type",
+            "pattern",
+            unique=True,
+            postgresql_where=text("user_id IS NOT NULL"),
+        ),
+        Index(
+            "uq_category_rules_system_type_pattern",
+            "transaction_type",
+            "pattern",
+            unique=True,
+            postgresql_where=text("user_id IS NULL"),
+        ),
+    )
@@ -0,0 +1,48 @@
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, ForeignKey, Date, DateTime, Index
+from datetime import datetime
+from app.core.database import Base
+
+
+class RecurringSeries(Base):
+    """A detected recurring charge or payment (subscription, bill, salary).
+
+    Rows are rebuilt from transaction history by RecurringDetectionService;
+    next_date is the predicted date of the next occurrence.
+    """
+
+    __tablename__ = "recurring_series"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=True)
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True)
+
+    merchant_key = Column(String, nullable=False)  # normalized merchant, see learning_key
+    name = Column(String, nullable=False)  # merchant (or description) of the latest occurrence
+    transaction_type = Column(String, nullable=False)  # income, expense
+    frequency = Column(String, nullable=False)  # weekly, biweekly, monthly, quarterly, annual
+    interval_days = Column(Integer, nullable=False)  # median days between occurrences
+
+    # CRITICAL: Use Numeric for currency precision
+    average_amount = Column(Numeric(precision=15, scale=2), nullable=False)
+    last_amount = Column(Numeric(precision=15, scale=2), nullable=False)
+    amount_variation = Column(Numeric(precision=8, scale=4), nullable=False)  # std / mean
+
+    occurrences = Column(Integer, nullable=False)
+    first_date = Column(Date, nullable=False)
+    last_date = Column(Date, nullable=False)
+    next_date = Column(Date, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)  # False once an occurrence is overdue
+
+    detected_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "uq_recurring_series_user_type_key",
+            "user_id",
+            "transaction_type",
+            "merchant_key",
+            unique=True,
+        ),
+        Index("ix_recurring_series_user_next_date", "user_id", "next_date"),
+    )
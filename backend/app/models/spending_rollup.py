@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, Date, DateTime, Index
+from datetime import datetime
+from app.core.database import Base
+
+
+class DailySpendingRollup(Base):
+    """Per-user daily totals of transactions by category and type.
+
+    Maintained incrementally by the transaction CRUD layer so analytics can
+    aggregate over days instead of raw transaction rows.
+    """
+
+    __tablename__ = "daily_spending_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)  # NULL for uncategorized
+    transaction_type = Column(String, nullable=False)  # income, expense, transfer
+    day = Column(Date, nullable=False)
+
+    # CRITICAL: Use Numeric for currency precision
+    total_amount = Column(Numeric(precision=15, scale=2), nullable=False, default=0.00)
+    transaction_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "uq_daily_spending_rollups_key",
+            "user_id",
+            "category_id",
+            "transaction_type",
+            "day",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index(
+            "ix_daily_spending_rollups_user_type_day",
+            "user_id",
+            "transaction_type",
+            "day",
+            postgresql_include=["category_id", "total_amount", "transaction_count"],
+        ),
+    )
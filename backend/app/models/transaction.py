@@ -1,13 +1,39 @@
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, ARRAY, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, Numeric, ForeignKey, DateTime, Text, Index
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from app.core.database import Base
 
 
+# Content fingerprint: account, calendar day, amount and description with
+# case and punctuation removed. A template over column names, so duplicate
+# lookups can fingerprint candidate rows with the exact same SQL.
+FINGERPRINT_SQL = (
+    "md5(({account_id})::text || '|' || "
+    "(({transaction_date})::date - DATE '2000-01-01')::text || '|' || "
+    "({amount})::numeric(15, 2)::text || '|' || "
+    "btrim(regexp_replace(lower({description}), '[^a-z0-9]+', ' ', 'g')))"
+)
+
+
+def fingerprint_sql(prefix: str = "") -> str:
+    """FINGERPRINT_SQL over the columns of a table or alias (unqualified by default)."""
+    qualifier = f"{prefix}." if prefix else ""
+    return FINGERPRINT_SQL.format(
+        account_id=f"{qualifier}account_id",
+        transaction_date=f"{qualifier}transaction_date",
+        amount=f"{qualifier}amount",
+        description=f"{qualifier}description",
+    )
+
+
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # The table is range-partitioned by month on transaction_date, so the
+    # key is (id, transaction_date). The ORM identifies rows by both, which
+    # keeps its UPDATEs and DELETEs on the row's own partition.
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True, index=True)
@@ -18,12 +44,34 @@ class Transaction(Base):
     description = Column(String, nullable=False)
     merchant = Column(String, nullable=True)
     transaction_type = Column(String, nullable=False)  # income, expense, transfer
-    transaction_date = Column(DateTime, nullable=False, index=True)
+    transaction_date = Column(DateTime, primary_key=True, nullable=False, index=True)
 
     # PostgreSQL ARRAY for tags
     tags = Column(ARRAY(String), nullable=True)
     notes = Column(Text, nullable=True)
 
+    # Search documents maintained by PostgreSQL, deferred so regular loads
+    # skip them (see CRUDTransaction.search)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(merchant, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(notes, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+    search_text = deferred(Column(
+        Text,
+        Computed(
+            "lower(coalesce(description, '') || ' ' || coalesce(merchant, '') || ' ' || coalesce(notes, ''))",
+            persisted=True,
+        ),
+    ))
+
+    # Duplicate detection (see CRUDTransaction.find_duplicates)
+    fingerprint = deferred(Column(String, Computed(fingerprint_sql(), persisted=True)))
+
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -31,3 +79,31 @@ class Transaction(Base):
     user = relationship("User", back_populates="transactions")
     account = relationship("Account", back_populates="transactions")
     category = relationship("Category", back_populates="transactions")
+
+    # Composite indexes matched to the per-user hot queries (newest-first
+    # listing, keyset paging, account/category filters)
+    __table_args__ = (
+        Index(
+            "ix_transactions_user_date_id",
+            "user_id",
+            "transaction_date",
+            "id",
+            postgresql_include=["amount", "transaction_type", "category_id", "account_id"],
+        ),
+        Index("ix_transactions_user_category_date_id", "user_id", "category_id", "transaction_date", "id"),
+        Index("ix_transactions_user_account_date_id", "user_id", "account_id", "transaction_date", "id"),
+        # Full-text and fuzzy search (btree_gin lets user_id share the GIN index)
+        Index("ix_transactions_user_search_vector", "user_id", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_transactions_user_search_text_trgm",
+            "user_id",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        # Tag filters (overlap / containment) and tag aggregation
+        Index("ix_transactions_user_tags", "user_id", "tags", postgresql_using="gin"),
+        # Equality-only duplicate lookups
+        Index("ix_transactions_fingerprint", "fingerprint", postgresql_using="hash"),
+        {"postgresql_partition_by": "RANGE (transaction_date)"},
+    )
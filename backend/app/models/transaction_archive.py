@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Computed, Integer, String, Numeric, DateTime, Text, Index
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import deferred
+from app.core.database import Base
+from app.models.transaction import fingerprint_sql
+
+
+class TransactionArchive(Base):
+    """Cold storage for transactions older than the archive horizon.
+
+    Same columns as Transaction minus the search documents, indexed for
+    the per-user date-ordered reads the list and export endpoints make and
+    for duplicate lookups. Rows are written in bulk by the archive job and never
+    updated in place; changing one moves it back to the hot table first.
+    Their amounts stay in the spending rollup and balance ledger, which
+    were maintained when the rows were written.
+    """
+
+    __tablename__ = "transactions_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False)
+    account_id = Column(Integer, nullable=False)
+    category_id = Column(Integer, nullable=True)
+
+    # CRITICAL: Use Numeric for currency precision
+    amount = Column(Numeric(precision=15, scale=2), nullable=False)
+
+    description = Column(String, nullable=False)
+    merchant = Column(String, nullable=True)
+    transaction_type = Column(String, nullable=False)
+    transaction_date = Column(DateTime, nullable=False)
+    tags = Column(ARRAY(String), nullable=True)
+    notes = Column(Text, nullable=True)
+    fingerprint = deferred(Column(String, Computed(fingerprint_sql(), persisted=True)))
+
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("ix_transactions_archive_user_date_id", "user_id", "transaction_date", "id"),
+        Index("ix_transactions_archive_fingerprint", "fingerprint", postgresql_using="hash"),
+    )
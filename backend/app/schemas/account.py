@@ -1,5 +1,5 @@
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -38,3 +38,9 @@ class AccountInDBBase(AccountBase):
 # Additional properties to return via API
 class Account(AccountInDBBase):
     pass
+
+
+# Balance history
+class BalancePoint(BaseModel):
+    day: date
+    balance: Decimal
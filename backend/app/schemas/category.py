@@ -38,3 +38,23 @@ class CategoryInDBBase(CategoryBase):
 # Additional properties to return via API
 class Category(CategoryInDBBase):
     pass
+
+
+# Categorization rules
+class CategoryRuleCreate(BaseModel):
+    pattern: str  # merchant/description words, e.g. "whole foods"
+    category_id: int
+
+
+class CategoryRule(BaseModel):
+    id: int
+    user_id: Optional[int] = None
+    category_id: int
+    transaction_type: str
+    pattern: str
+    source: str  # manual, learned, system
+    hit_count: int
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,39 @@
+from typing import Optional
+from datetime import date, datetime
+from decimal import Decimal
+from pydantic import BaseModel, ConfigDict
+
+
+# Detected recurring series
+class RecurringSeries(BaseModel):
+    id: int
+    account_id: Optional[int] = None
+    category_id: Optional[int] = None
+    name: str
+    transaction_type: str
+    frequency: str  # weekly, biweekly, monthly, quarterly, annual
+    interval_days: int
+    average_amount: Decimal
+    last_amount: Decimal
+    amount_variation: Decimal
+    occurrences: int
+    first_date: date
+    last_date: date
+    next_date: date
+    is_active: bool
+    detected_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Predicted occurrence of a recurring series
+class UpcomingCharge(BaseModel):
+    series_id: int
+    name: str
+    transaction_type: str
+    frequency: str
+    account_id: Optional[int] = None
+    category_id: Optional[int] = None
+    expected_date: date
+    expected_amount: Decimal
+    overdue: bool
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Annotated, List, Literal, Optional, Union
 from datetime import datetime
 from decimal import Decimal
 from pydantic import BaseModel, Field, ConfigDict
@@ -48,3 +48,64 @@ class TransactionInDBBase(TransactionBase):
 # Additional properties to return via API
 class Transaction(TransactionInDBBase):
     pass
+
+
+# Batch mutation operations
+class TransactionBatchCreate(BaseModel):
+    op: Literal["create"]
+    data: TransactionCreate
+
+
+class TransactionBatchUpdate(BaseModel):
+    op: Literal["update"]
+    id: int
+    data: TransactionUpdate
+
+
+class TransactionBatchDelete(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+TransactionBatchOperation = Annotated[
+    Union[TransactionBatchCreate, TransactionBatchUpdate, TransactionBatchDelete],
+    Field(discriminator="op"),
+]
+
+
+class TransactionBatchRequest(BaseModel):
+    operations: List[TransactionBatchOperation] = Field(min_length=1, max_length=1000)
+    atomic: bool = False  # when True, any failed item aborts the whole batch
+    duplicates: Literal["allow", "skip"] = "allow"  # creates matching an existing transaction
+
+
+class TransactionBatchItemResult(BaseModel):
+    index: int
+    op: str
+    status: str  # ok, error, skipped (atomic rollback or duplicate)
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class TransactionBatchResponse(BaseModel):
+    results: List[TransactionBatchItemResult]
+    succeeded: int
+    failed: int
+
+
+# Tag analytics
+class TagTotal(BaseModel):
+    tag: str
+    total: Decimal
+    transaction_count: int
+
+
+# Suspected duplicates in existing data
+class DuplicateGroup(BaseModel):
+    fingerprint: str
+    account_id: int
+    transaction_date: datetime
+    amount: Decimal
+    description: str
+    count: int
+    transaction_ids: List[int]
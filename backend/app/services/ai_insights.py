@@ -1,84 +1,73 @@
 """AI-powered financial insights using OpenAI."""
-from typing import List
-from decimal import Decimal
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from app.models.transaction import Transaction
 from app.models.category import Category
 from app.models.budget import Budget
+from app.models.spending_rollup import DailySpendingRollup
+from app import crud
 from app.core.config import settings
+from app.core.database import fan_out
 
 
 class AIInsightsService:
     """Generate AI-powered financial insights."""
 
     @staticmethod
-    def analyze_spending_patterns(db: Session, user_id: int) -> dict:
-        """Analyze user's spending patterns and generate insights."""
-
-        # Get spending by category (last 30 days)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-
-        category_spending = (
+    def top_spending_categories(db: Session, user_id: int, since: date) -> list:
+        """Five categories with the highest expenses since a day."""
+        return (
             db.query(
                 Category.name,
-                func.sum(Transaction.amount).label("total")
+                func.sum(DailySpendingRollup.total_amount).label("total")
             )
-            .join(Transaction, Transaction.category_id == Category.id)
+            .join(DailySpendingRollup, DailySpendingRollup.category_id == Category.id)
             .filter(
-                Transaction.user_id == user_id,
-                Transaction.transaction_type == "expense",
-                Transaction.transaction_date >= thirty_days_ago
+                DailySpendingRollup.user_id == user_id,
+                DailySpendingRollup.transaction_type == "expense",
+                DailySpendingRollup.day >= since
             )
             .group_by(Category.name)
-            .order_by(func.sum(Transaction.amount).desc())
+            .having(func.sum(DailySpendingRollup.total_amount) != 0)
+            .order_by(func.sum(DailySpendingRollup.total_amount).desc())
             .limit(5)
             .all()
         )
 
-        # Get total income and expenses
-        income = db.query(func.sum(Transaction.amount)).filter(
-            Transaction.user_id == user_id,
-            Transaction.transaction_type == "income",
-            Transaction.transaction_date >= thirty_days_ago
-        ).scalar() or Decimal("0.00")
-
-        expenses = db.query(func.sum(Transaction.amount)).filter(
-            Transaction.user_id == user_id,
-            Transaction.transaction_type == "expense",
-            Transaction.transaction_date >= thirty_days_ago
-        ).scalar() or Decimal("0.00")
-
-        # Get budget adherence
+    @staticmethod
+    def budget_alerts(db: Session, user_id: int) -> List[dict]:
+        """Budgets past their alert threshold, from the materialized spent counters."""
         budgets = db.query(Budget).filter(Budget.user_id == user_id).all()
         budget_alerts = []
+        flagged = []
 
         for budget in budgets:
-            if budget.period == "monthly":
-                end_date = budget.start_date + timedelta(days=30)
-            else:
-                end_date = budget.start_date + timedelta(days=365)
-
-            spent = db.query(func.sum(Transaction.amount)).filter(
-                Transaction.user_id == user_id,
-                Transaction.category_id == budget.category_id,
-                Transaction.transaction_type == "expense",
-                Transaction.transaction_date >= budget.start_date,
-                Transaction.transaction_date <= end_date,
-            ).scalar() or Decimal("0.00")
-
+            spent = budget.spent
             percentage = float((spent / budget.amount) * 100) if budget.amount > 0 else 0
             if percentage >= budget.alert_threshold * 100:
-                category = db.query(Category).filter(Category.id == budget.category_id).first()
-                budget_alerts.append({
-                    "category": category.name if category else "Unknown",
-                    "percentage": percentage,
-                    "spent": float(spent),
-                    "limit": float(budget.amount)
-                })
+                flagged.append((budget, spent, percentage))
 
+        category_names = dict(
+            db.query(Category.id, Category.name)
+            .filter(Category.id.in_([budget.category_id for budget, _, _ in flagged]))
+            .all()
+        ) if flagged else {}
+
+        for budget, spent, percentage in flagged:
+            budget_alerts.append({
+                "category": category_names.get(budget.category_id, "Unknown"),
+                "percentage": percentage,
+                "spent": float(spent),
+                "limit": float(budget.amount)
+            })
+        return budget_alerts
+
+    @staticmethod
+    def build_patterns(category_spending, income, expenses, budget_alerts) -> dict:
+        """Assemble the spending analysis from its parts."""
         return {
             "top_spending_categories": [
                 {"category": row.name, "amount": float(row.total)}
@@ -90,6 +79,41 @@ class AIInsightsService:
             "budget_alerts": budget_alerts,
         }
 
+    @staticmethod
+    def analyze_spending_patterns(db: Session, user_id: int) -> dict:
+        """Analyze user's spending patterns and generate insights."""
+        # Last 30 days
+        since = (datetime.utcnow() - timedelta(days=30)).date()
+        return AIInsightsService.build_patterns(
+            AIInsightsService.top_spending_categories(db, user_id, since),
+            crud.spending_rollup.get_total(
+                db, user_id=user_id, transaction_type="income", start_day=since
+            ),
+            crud.spending_rollup.get_total(
+                db, user_id=user_id, transaction_type="expense", start_day=since
+            ),
+            AIInsightsService.budget_alerts(db, user_id),
+        )
+
+    @staticmethod
+    async def analyze_spending_patterns_async(
+        user_id: int, bind: Optional[AsyncEngine] = None
+    ) -> dict:
+        """analyze_spending_patterns with its independent queries run concurrently (see fan_out)."""
+        since = (datetime.utcnow() - timedelta(days=30)).date()
+        parts = await fan_out(
+            lambda db: AIInsightsService.top_spending_categories(db, user_id, since),
+            lambda db: crud.spending_rollup.get_total(
+                db, user_id=user_id, transaction_type="income", start_day=since
+            ),
+            lambda db: crud.spending_rollup.get_total(
+                db, user_id=user_id, transaction_type="expense", start_day=since
+            ),
+            lambda db: AIInsightsService.budget_alerts(db, user_id),
+            bind=bind,
+        )
+        return AIInsightsService.build_patterns(*parts)
+
     @staticmethod
     def generate_insights(financial_data: dict) -> List[dict]:
         """Generate AI insights based on financial data."""
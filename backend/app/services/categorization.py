@@ -0,0 +1,228 @@
+"""Automatic transaction categorization from merchant and description rules."""
+from types import SimpleNamespace
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Integer, String, column, func, select, update, values
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.cache import LRUCacheBackend
+from app.core.config import settings
+from app.crud.category_rule import RULE_TYPES, learning_key, text_tokens
+from app.models.account import Account
+from app.models.transaction import Transaction
+from app.models.transaction_archive import TransactionArchive
+
+# Compiled per-user rule sets. Rule changes made through the API invalidate
+# their user's entry; the TTL bounds staleness across worker processes.
+_matchers = LRUCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+class RuleMatcher:
+    """A compiled rule set: a hash index from (transaction type, word n-gram) to category.
+
+    Text is normalized to words and every n-gram up to the longest pattern
+    is looked up, longest first, so matching costs a handful of dict
+    lookups per row however many rules there are. Rules are given weakest
+    first; a later rule with the same pattern replaces an earlier one.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, str, int]]):
+        self._index: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self._longest = 0
+        for transaction_type, pattern, category_id in rules:
+            tokens = tuple(pattern.split())
+            if tokens:
+                self._index[(transaction_type, tokens)] = category_id
+                self._longest = max(self._longest, len(tokens))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _match_text(
+        self, transaction_type: str, text: Optional[str], memo: Optional[dict]
+    ) -> Optional[int]:
+        if memo is not None:
+            key = (transaction_type, text)
+            if key in memo:
+                return memo[key]
+            category_id = memo[key] = self._match_text(transaction_type, text, None)
+            return category_id
+
+        tokens = text_tokens(text)
+        for size in range(min(self._longest, len(tokens)), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                category_id = self._index.get((transaction_type, tuple(tokens[start:start + size])))
+                if category_id is not None:
+                    return category_id
+        return None
+
+    def match(
+        self,
+        transaction_type: str,
+        merchant: Optional[str],
+        description: Optional[str],
+        memo: Optional[dict] = None,
+    ) -> Optional[int]:
+        """Category for a transaction, matching the merchant before the description.
+
+        Bulk callers pass a dict as memo to match each distinct merchant or
+        description text only once.
+        """
+        if transaction_type not in RULE_TYPES or not self._index:
+            return None
+        category_id = self._match_text(transaction_type, merchant, memo)
+        if category_id is None:
+            category_id = self._match_text(transaction_type, description, memo)
+        return category_id
+
+
+class CategorizationService:
+    """Apply, learn and cache categorization rules."""
+
+    @staticmethod
+    def get_matcher(db: Session, user_id: int) -> RuleMatcher:
+        """The user's compiled rules (system, learned and manual), cached per user."""
+        key = f"category_rules:{user_id}"
+        matcher = _matchers.get(key)
+        if matcher is None:
+            matcher = RuleMatcher(crud.category_rule.get_active(db, user_id=user_id))
+            _matchers.set(key, matcher, ttl=settings.CACHE_TTL_SECONDS)
+        return matcher
+
+    @staticmethod
+    def invalidate(user_id: Optional[int] = None) -> None:
+        """Drop a user's compiled rules, or everyone's after a system rule change."""
+        if user_id is None:
+            _matchers.clear()
+        else:
+            _matchers.delete(f"category_rules:{user_id}")
+
+    @staticmethod
+    def categorize(
+        db: Session,
+        *,
+        user_id: int,
+        transaction_type: str,
+        merchant: Optional[str],
+        description: Optional[str],
+    ) -> Optional[int]:
+        """Category the user's rules assign to a transaction, if any."""
+        matcher = CategorizationService.get_matcher(db, user_id)
+        return matcher.match(transaction_type, merchant, description)
+
+    @staticmethod
+    def learn(db: Session, *, transaction: Transaction) -> None:
+        """Remember a manual categorization for the transaction's merchant."""
+        pattern = learning_key(transaction.merchant, transaction.description)
+        if (
+            not pattern
+            or transaction.category_id is None
+            or transaction.transaction_type not in RULE_TYPES
+        ):
+            return
+        crud.category_rule.learn(
+            db,
+            user_id=transaction.user_id,
+            category_id=transaction.category_id,
+            transaction_type=transaction.transaction_type,
+            pattern=pattern,
+        )
+        CategorizationService.invalidate(transaction.user_id)
+
+    @staticmethod
+    def learn_from_history(db: Session, *, user_id: int) -> int:
+        """Learn rules from all of a user's categorized transactions; returns rules written."""
+        learned = crud.category_rule.learn_from_history(db, user_id=user_id)
+        CategorizationService.invalidate(user_id)
+        return learned
+
+    @staticmethod
+    def recategorize(db: Session, *, user_id: int, only_uncategorized: bool = True) -> int:
+        """Re-apply the user's rules to their whole history; returns rows changed.
+
+        Rules are matched once per distinct (type, merchant, description)
+        rather than once per row, and the results are written with a single
+        UPDATE ... FROM (VALUES ...) per table (hot and archive). The
+        UPDATE joins the table to itself to return each row's previous
+        category, which moves the spending rollup and budget counters.
+        The user's accounts are locked first, the order every transaction
+        write path follows (see CRUDTransaction.lock_accounts).
+        """
+        matcher = CategorizationService.get_matcher(db, user_id)
+        history = crud.transaction_archive.history()
+        scope = [history.c.user_id == user_id, history.c.transaction_type.in_(RULE_TYPES)]
+        if only_uncategorized:
+            scope.append(history.c.category_id.is_(None))
+
+        matches, memo = [], {}
+        for transaction_type, merchant, description in db.execute(
+            select(history.c.transaction_type, history.c.merchant, history.c.description)
+            .where(*scope)
+            .distinct()
+        ):
+            category_id = matcher.match(transaction_type, merchant, description, memo)
+            if category_id is not None:
+                matches.append((transaction_type, merchant or "", description, category_id))
+        if not matches:
+            return 0
+
+        matched = values(
+            column("transaction_type", String),
+            column("merchant", String),
+            column("description", String),
+            column("category_id", Integer),
+            name="rule_matches",
+        ).data(matches)
+
+        crud.transaction.lock_accounts(
+            db,
+            account_ids=db.scalars(select(Account.id).where(Account.user_id == user_id)).all(),
+            user_id=user_id,
+        )
+
+        changed = []
+        for model in (Transaction, TransactionArchive):
+            table = model.__table__
+            previous = table.alias("previous")
+            filters = [
+                table.c.user_id == user_id,
+                table.c.transaction_type == matched.c.transaction_type,
+                func.coalesce(table.c.merchant, "") == matched.c.merchant,
+                table.c.description == matched.c.description,
+                table.c.category_id.is_distinct_from(matched.c.category_id),
+                previous.c.id == table.c.id,
+                previous.c.transaction_date == table.c.transaction_date,
+            ]
+            if only_uncategorized:
+                filters.append(table.c.category_id.is_(None))
+            changed.extend(db.execute(
+                update(table)
+                .where(*filters)
+                .values(category_id=matched.c.category_id)
+                .returning(
+                    table.c.user_id,
+                    previous.c.category_id.label("previous_category_id"),
+                    table.c.category_id,
+                    table.c.transaction_type,
+                    table.c.transaction_date,
+                    table.c.amount,
+                )
+            ).all())
+
+        removed = [
+            SimpleNamespace(
+                user_id=row.user_id,
+                category_id=row.previous_category_id,
+                transaction_type=row.transaction_type,
+                transaction_date=row.transaction_date,
+                amount=row.amount,
+            )
+            for row in changed
+        ]
+        crud.spending_rollup.apply_many(db, transactions=removed, sign=-1)
+        crud.spending_rollup.apply_many(db, transactions=changed)
+        crud.budget.apply_transactions(db, transactions=removed, sign=-1)
+        crud.budget.apply_transactions(db, transactions=changed)
+        db.commit()
+        return len(changed)
@@ -0,0 +1,177 @@
+"""Dashboard aggregation engine."""
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import desc, func, select, true
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.core.database import fan_out
+from app.models.account import Account
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.spending_rollup import DailySpendingRollup
+from app.models.transaction import Transaction
+
+
+class DashboardService:
+    """Build the dashboard summary in a fixed number of statements.
+
+    The summary is produced by three statements regardless of how many
+    accounts, budgets or transactions a user has:
+
+    1. A single row of totals built from CTEs (account totals, the
+       transaction count and budget totals from the materialized
+       Budget.spent counters).
+    2. The most recent transactions.
+    3. The expense breakdown by category.
+
+    Aggregates read the daily spending rollup, so their cost depends on the
+    number of days with activity rather than the number of transactions.
+    The rollup is populated by its migration and kept exact by every write
+    path, archive drops included, so total_transactions counts the user's
+    hot and archived rows.
+    The statements are independent; get_summary_async runs them at once.
+    """
+
+    RECENT_TRANSACTIONS_LIMIT = 10
+    EXPENSE_CATEGORIES_LIMIT = 10
+
+    @staticmethod
+    def totals_statement(user_id: int):
+        """Single-row totals query built from per-table CTEs."""
+        account_totals = (
+            select(
+                func.coalesce(func.sum(Account.balance), 0).label("total_balance"),
+                func.count(Account.id).label("total_accounts"),
+            )
+            .where(Account.user_id == user_id)
+            .cte("account_totals")
+        )
+
+        transaction_totals = (
+            select(
+                func.coalesce(
+                    func.sum(DailySpendingRollup.transaction_count), 0
+                ).label("total_transactions")
+            )
+            .where(DailySpendingRollup.user_id == user_id)
+            .cte("transaction_totals")
+        )
+
+        budget_totals = (
+            select(
+                func.coalesce(func.sum(Budget.amount), 0).label("total_budget"),
+                func.coalesce(func.sum(Budget.spent), 0).label("total_spent"),
+            )
+            .where(Budget.user_id == user_id)
+            .cte("budget_totals")
+        )
+
+        return select(
+            account_totals.c.total_balance,
+            account_totals.c.total_accounts,
+            transaction_totals.c.total_transactions,
+            budget_totals.c.total_budget,
+            budget_totals.c.total_spent,
+        ).select_from(
+            account_totals.join(transaction_totals, true())
+            .join(budget_totals, true())
+        )
+
+    @staticmethod
+    def recent_transactions_statement(user_id: int, limit: int):
+        """Most recent transactions, projected to the dashboard columns."""
+        return (
+            select(
+                Transaction.id,
+                Transaction.amount,
+                Transaction.description,
+                Transaction.transaction_type,
+                Transaction.transaction_date,
+                Transaction.merchant,
+            )
+            .where(Transaction.user_id == user_id)
+            .order_by(desc(Transaction.transaction_date))
+            .limit(limit)
+        )
+
+    @staticmethod
+    def expense_breakdown_statement(user_id: int, limit: int):
+        """Top expense categories by total spent."""
+        total = func.sum(DailySpendingRollup.total_amount).label("total")
+        return (
+            select(Category.name, Category.icon, Category.color, total)
+            .join(DailySpendingRollup, DailySpendingRollup.category_id == Category.id)
+            .where(
+                DailySpendingRollup.user_id == user_id,
+                DailySpendingRollup.transaction_type == "expense",
+            )
+            .group_by(Category.id, Category.name, Category.icon, Category.color)
+            .having(func.sum(DailySpendingRollup.total_amount) != 0)
+            .order_by(total.desc())
+            .limit(limit)
+        )
+
+    @staticmethod
+    def build_summary(totals, recent_rows, expense_rows) -> dict:
+        """Assemble the summary from the rows of the three statements."""
+        total_budget = Decimal(totals.total_budget)
+        total_spent = Decimal(totals.total_spent)
+
+        return {
+            "total_balance": Decimal(totals.total_balance),
+            "total_accounts": totals.total_accounts,
+            "total_transactions": totals.total_transactions,
+            "total_budget": total_budget,
+            "total_spent": total_spent,
+            "budget_remaining": total_budget - total_spent,
+            "recent_transactions": [dict(row._mapping) for row in recent_rows],
+            "expense_by_category": [
+                {
+                    "category_name": row.name,
+                    "category_icon": row.icon or "📊",
+                    "category_color": row.color or "#C4C4C4",
+                    "total": row.total or Decimal("0.00"),
+                }
+                for row in expense_rows
+            ],
+        }
+
+    @staticmethod
+    def get_summary(db: Session, user_id: int) -> dict:
+        """Compute the full dashboard summary for a user."""
+        totals = db.execute(DashboardService.totals_statement(user_id)).one()
+
+        recent_rows = db.execute(
+            DashboardService.recent_transactions_statement(
+                user_id, DashboardService.RECENT_TRANSACTIONS_LIMIT
+            )
+        ).all()
+
+        expense_rows = db.execute(
+            DashboardService.expense_breakdown_statement(
+                user_id, DashboardService.EXPENSE_CATEGORIES_LIMIT
+            )
+        ).all()
+
+        return DashboardService.build_summary(totals, recent_rows, expense_rows)
+
+    @staticmethod
+    async def get_summary_async(user_id: int, bind: Optional[AsyncEngine] = None) -> dict:
+        """get_summary with the three statements run concurrently (see fan_out)."""
+        totals, recent_rows, expense_rows = await fan_out(
+            lambda db: db.execute(DashboardService.totals_statement(user_id)).one(),
+            lambda db: db.execute(
+                DashboardService.recent_transactions_statement(
+                    user_id, DashboardService.RECENT_TRANSACTIONS_LIMIT
+                )
+            ).all(),
+            lambda db: db.execute(
+                DashboardService.expense_breakdown_statement(
+                    user_id, DashboardService.EXPENSE_CATEGORIES_LIMIT
+                )
+            ).all(),
+            bind=bind,
+        )
+        return DashboardService.build_summary(totals, recent_rows, expense_rows)
@@ -0,0 +1,299 @@
+"""Detection of recurring transactions (subscriptions, bills, salary)."""
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.crud.category_rule import RULE_TYPES, learning_key
+from app.models.recurring_series import RecurringSeries
+from app.models.user import User
+
+# Share of gaps that must fall within the period's tolerance
+MIN_REGULARITY = 0.75
+# Largest accepted amount standard deviation relative to the mean
+MAX_AMOUNT_VARIATION = 0.5
+
+
+class Period(NamedTuple):
+    name: str
+    days: int  # nominal gap between occurrences
+    tolerance: int  # accepted deviation of a gap, in days
+    min_occurrences: int
+    months: int  # calendar step for month-based periods, 0 for day-based
+
+
+PERIODS = (
+    Period("weekly", 7, 1, 4, 0),
+    Period("biweekly", 14, 2, 4, 0),
+    Period("monthly", 30, 4, 3, 1),
+    Period("quarterly", 91, 8, 3, 3),
+    Period("annual", 365, 15, 2, 12),
+)
+PERIODS_BY_NAME = {period.name: period for period in PERIODS}
+
+
+def next_occurrence(last: date, period: Period, step: int = 1) -> date:
+    """Date of the step-th occurrence after last, on the same day of the month when month-based."""
+    if period.months:
+        return last + relativedelta(months=period.months * step)
+    return last + timedelta(days=period.days * step)
+
+
+class RecurringDetectionService:
+    """Find recurring series in a user's history and predict upcoming charges.
+
+    History (hot and archived) is loaded once as columns and analysed with
+    vectorized pandas/NumPy passes: group by normalized merchant, take the
+    gaps between consecutive days, classify each group's median gap as a
+    period and keep the groups whose gaps and amounts are regular enough.
+
+    Detection runs on explicit refreshes only: POST /insights/recurring/refresh,
+    the end of a bulk import and the nightly scripts/recurring_series.py job.
+    Reads return the stored series and never write.
+    """
+
+    @staticmethod
+    def load_history(db: Session, user_id: int) -> pd.DataFrame:
+        """A user's income and expense transactions as a DataFrame, oldest first."""
+        history = crud.transaction_archive.history()
+        rows = db.execute(
+            select(
+                history.c.transaction_type,
+                history.c.merchant,
+                history.c.description,
+                history.c.amount,
+                history.c.transaction_date,
+                history.c.account_id,
+                history.c.category_id,
+            )
+            .where(history.c.user_id == user_id, history.c.transaction_type.in_(RULE_TYPES))
+            .order_by(history.c.transaction_date)
+        ).all()
+        return pd.DataFrame.from_records(
+            rows,
+            columns=[
+                "transaction_type", "merchant", "description", "amount",
+                "transaction_date", "account_id", "category_id",
+            ],
+        )
+
+    @staticmethod
+    def detect(frame: pd.DataFrame, today: Optional[date] = None) -> List[dict]:
+        """Recurring series found in a history frame (see load_history)."""
+        if frame.empty:
+            return []
+        today = today or datetime.utcnow().date()
+
+        # Normalize each distinct merchant once; descriptions only where that is empty
+        codes, uniques = pd.factorize(frame["merchant"].fillna(""))
+        keys = np.array([learning_key(merchant, None) for merchant in uniques], dtype=object)[codes]
+        missing = keys == ""
+        if missing.any():
+            codes, uniques = pd.factorize(frame["description"].fillna("")[missing])
+            keys[missing] = np.array(
+                [learning_key(None, description) for description in uniques], dtype=object
+            )[codes]
+
+        frame = pd.DataFrame({
+            "transaction_type": frame["transaction_type"].to_numpy(),
+            "key": keys,
+            "day": pd.to_datetime(frame["transaction_date"]).dt.normalize(),
+            "amount": frame["amount"].astype(float).to_numpy(),
+            "account_id": frame["account_id"].to_numpy(),
+            "category_id": frame["category_id"].to_numpy(),
+            "name": frame["merchant"].fillna(frame["description"]).to_numpy(),
+        })
+        frame = frame[frame["key"] != ""]
+
+        # One occurrence per series and day
+        daily = (
+            frame.groupby(["transaction_type", "key", "day"], sort=True)
+            .agg(
+                amount=("amount", "sum"),
+                account_id=("account_id", "last"),
+                category_id=("category_id", "last"),
+                name=("name", "last"),
+            )
+            .reset_index()
+        )
+        series_id = daily.groupby(["transaction_type", "key"], sort=False).ngroup().to_numpy()
+        same_series = np.r_[False, series_id[1:] == series_id[:-1]]
+        gap = np.where(same_series, daily["day"].diff().dt.days.to_numpy(), np.nan)
+        daily["gap"] = gap
+
+        stats = daily.groupby(series_id).agg(
+            transaction_type=("transaction_type", "first"),
+            key=("key", "first"),
+            name=("name", "last"),
+            account_id=("account_id", "last"),
+            category_id=("category_id", "last"),
+            occurrences=("day", "size"),
+            first_date=("day", "first"),
+            last_date=("day", "last"),
+            median_gap=("gap", "median"),
+            average_amount=("amount", "mean"),
+            amount_std=("amount", "std"),
+            last_amount=("amount", "last"),
+        )
+
+        # Classify every series' median gap against all periods at once
+        nominal = np.array([period.days for period in PERIODS])
+        tolerance = np.array([period.tolerance for period in PERIODS])
+        minimum = np.array([period.min_occurrences for period in PERIODS])
+        fits = np.abs(stats["median_gap"].to_numpy()[:, None] - nominal) <= tolerance
+        period_index = np.where(fits.any(axis=1), fits.argmax(axis=1), -1)
+        has_period = period_index >= 0
+        safe_index = np.maximum(period_index, 0)
+
+        # Share of each series' gaps within the period tolerance
+        row_period = safe_index[series_id]
+        on_time = np.abs(gap - nominal[row_period]) <= tolerance[row_period]
+        gap_count = np.bincount(series_id, weights=~np.isnan(gap), minlength=len(stats))
+        on_time_count = np.bincount(series_id, weights=on_time, minlength=len(stats))
+        regularity = np.divide(
+            on_time_count, gap_count, out=np.zeros(len(stats)), where=gap_count > 0
+        )
+
+        average = stats["average_amount"].to_numpy()
+        variation = np.divide(
+            np.nan_to_num(stats["amount_std"].to_numpy()),
+            average,
+            out=np.full(len(stats), np.inf),
+            where=average > 0,
+        )
+
+        keep = (
+            has_period
+            & (stats["occurrences"].to_numpy() >= minimum[safe_index])
+            & (regularity >= MIN_REGULARITY)
+            & (variation <= MAX_AMOUNT_VARIATION)
+        )
+
+        found = []
+        for row, index, amount_variation in zip(
+            stats[keep].itertuples(), period_index[keep], variation[keep]
+        ):
+            period = PERIODS[index]
+            last_date = row.last_date.date()
+            next_date = next_occurrence(last_date, period)
+            found.append({
+                "transaction_type": row.transaction_type,
+                "merchant_key": row.key,
+                "name": row.name,
+                "account_id": None if pd.isna(row.account_id) else int(row.account_id),
+                "category_id": None if pd.isna(row.category_id) else int(row.category_id),
+                "frequency": period.name,
+                "interval_days": int(round(row.median_gap)),
+                "average_amount": round(Decimal(str(row.average_amount)), 2),
+                "last_amount": round(Decimal(str(row.last_amount)), 2),
+                "amount_variation": round(Decimal(str(amount_variation)), 4),
+                "occurrences": int(row.occurrences),
+                "first_date": row.first_date.date(),
+                "last_date": last_date,
+                "next_date": next_date,
+                "is_active": next_date + timedelta(days=period.tolerance) >= today,
+            })
+        return found
+
+    @staticmethod
+    def store(db: Session, user_id: int, found: List[dict]) -> List[RecurringSeries]:
+        """Replace a user's stored series with freshly detected ones.
+
+        Concurrent refreshes of the same user queue on the user row, so
+        one replacement finishes before the next one deletes.
+        """
+        db.execute(select(User.id).where(User.id == user_id).with_for_update())
+        db.execute(delete(RecurringSeries).where(RecurringSeries.user_id == user_id))
+        if found:
+            now = datetime.utcnow()
+            db.execute(
+                insert(RecurringSeries),
+                [dict(series, user_id=user_id, detected_at=now) for series in found],
+            )
+        db.commit()
+        return RecurringDetectionService.get_series(db, user_id)
+
+    @staticmethod
+    def refresh(db: Session, user_id: int) -> List[RecurringSeries]:
+        """Re-detect and store a user's recurring series."""
+        found = RecurringDetectionService.detect(
+            RecurringDetectionService.load_history(db, user_id)
+        )
+        return RecurringDetectionService.store(db, user_id, found)
+
+    @staticmethod
+    def get_series(db: Session, user_id: int) -> List[RecurringSeries]:
+        """Stored series for a user, soonest next occurrence first."""
+        return (
+            db.query(RecurringSeries)
+            .filter(RecurringSeries.user_id == user_id)
+            .order_by(RecurringSeries.next_date, RecurringSeries.id)
+            .all()
+        )
+
+    @staticmethod
+    def upcoming(series_list: List[RecurringSeries], days: int = 30) -> List[dict]:
+        """Predicted occurrences of active series from today through `days` ahead."""
+        today = datetime.utcnow().date()
+        horizon = today + timedelta(days=days)
+
+        upcoming = []
+        for series in series_list:
+            if not series.is_active:
+                continue
+            period = PERIODS_BY_NAME[series.frequency]
+            step = 1
+            expected = series.next_date
+            while expected <= horizon:
+                upcoming.append({
+                    "series_id": series.id,
+                    "name": series.name,
+                    "transaction_type": series.transaction_type,
+                    "frequency": series.frequency,
+                    "account_id": series.account_id,
+                    "category_id": series.category_id,
+                    "expected_date": expected,
+                    "expected_amount": series.last_amount,
+                    "overdue": expected < today,
+                })
+                step += 1
+                expected = next_occurrence(series.last_date, period, step)
+
+        upcoming.sort(key=lambda charge: (charge["expected_date"], charge["series_id"]))
+        return upcoming
+
+    @staticmethod
+    def get_upcoming(db: Session, user_id: int, days: int = 30) -> List[dict]:
+        """Predicted occurrences of the user's active series over the next `days` days."""
+        return RecurringDetectionService.upcoming(
+            RecurringDetectionService.get_series(db, user_id), days
+        )
+
+    # AsyncSession variants: queries run through run_sync, while the pandas
+    # detection pass runs on the threadpool so it never blocks the event loop.
+
+    @staticmethod
+    async def refresh_async(db: AsyncSession, user_id: int) -> List[RecurringSeries]:
+        """refresh() for async callers."""
+        frame = await db.run_sync(RecurringDetectionService.load_history, user_id)
+        found = await run_in_threadpool(RecurringDetectionService.detect, frame)
+        return await db.run_sync(RecurringDetectionService.store, user_id, found)
+
+    @staticmethod
+    async def get_series_async(db: AsyncSession, user_id: int) -> List[RecurringSeries]:
+        """get_series() for async callers."""
+        return await db.run_sync(RecurringDetectionService.get_series, user_id)
+
+    @staticmethod
+    async def get_upcoming_async(db: AsyncSession, user_id: int, days: int = 30) -> List[dict]:
+        """get_upcoming() for async callers."""
+        series_list = await RecurringDetectionService.get_series_async(db, user_id)
+        return RecurringDetectionService.upcoming(series_list, days)
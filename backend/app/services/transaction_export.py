@@ -0,0 +1,148 @@
+"""Streaming export of transaction history (CSV, NDJSON, Parquet)."""
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Iterator
+
+from sqlalchemy.orm import Session
+
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+EXPORT_CHUNK_SIZE = 5000
+
+EXPORT_COLUMNS = (
+    "id", "account_id", "category_id", "amount", "description", "merchant",
+    "transaction_type", "transaction_date", "tags", "notes",
+)
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only sink that hands back what was written since the last drain.
+
+    tell() reports the absolute position so Parquet footer offsets stay
+    correct while earlier bytes have already been streamed out.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _csv_chunks(partitions) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in partitions:
+        for row in rows:
+            writer.writerow(
+                ";".join(value) if name == "tags" and value else value
+                for name, value in zip(EXPORT_COLUMNS, row)
+            )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _ndjson_chunks(partitions) -> Iterator[bytes]:
+    for rows in partitions:
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=_json_default) + "\n"
+            for row in rows
+        ).encode()
+
+
+def _parquet_chunks(partitions) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("account_id", pa.int64()),
+        ("category_id", pa.int64()),
+        ("amount", pa.decimal128(15, 2)),
+        ("description", pa.string()),
+        ("merchant", pa.string()),
+        ("transaction_type", pa.string()),
+        ("transaction_date", pa.timestamp("us")),
+        ("tags", pa.list_(pa.string())),
+        ("notes", pa.string()),
+    ])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    try:
+        for rows in partitions:
+            columns = list(zip(*rows)) if rows else [[] for _ in EXPORT_COLUMNS]
+            # One row group per database chunk
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def parquet_available() -> bool:
+    """Whether the optional pyarrow dependency is installed."""
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def stream_export(
+    session_factory: Callable[[], Session],
+    statement,
+    export_format: str,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Stream rows of `statement` in the requested format.
+
+    Rows are fetched through a server-side cursor in chunks of chunk_size
+    (yield_per), so memory stays flat regardless of history size. The
+    session is owned by the generator because the request-scoped session
+    is closed before a streaming response body runs.
+    """
+    db = session_factory()
+    try:
+        result = db.execute(statement.execution_options(yield_per=chunk_size))
+        partitions = (list(rows) for rows in result.partitions())
+        encoders = {"csv": _csv_chunks, "ndjson": _ndjson_chunks, "parquet": _parquet_chunks}
+        yield from encoders[export_format](partitions)
+    finally:
+        db.close()
@@ -0,0 +1,340 @@
+"""Streaming bulk import of bank statements (CSV and OFX)."""
+import csv
+import io
+import re
+from collections import Counter
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.services.categorization import CategorizationService
+
+SUPPORTED_FORMATS = ("csv", "ofx")
+DUPLICATE_MODES = ("skip", "allow")
+CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+MAX_MATCH_CACHE = 200000  # memoized merchant/description texts per import
+TRANSACTION_TYPES = ("income", "expense", "transfer")
+MAX_AMOUNT = Decimal("9999999999999.99")  # transactions.amount is Numeric(15, 2)
+
+COPY_COLUMNS = (
+    "user_id", "account_id", "category_id", "amount", "description", "merchant",
+    "transaction_type", "transaction_date", "notes", "created_at", "updated_at",
+)
+COPY_SQL = f"COPY transactions ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+
+# Column aliases accepted in CSV headers
+CSV_ALIASES = {
+    "transaction_date": "date",
+    "posted": "date",
+    "type": "transaction_type",
+    "payee": "merchant",
+    "memo": "notes",
+    "category": "category_id",
+}
+
+OFX_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+
+
+class ImportedRow(NamedTuple):
+    """A validated row, attribute-compatible with Transaction for rollup and budget maintenance."""
+
+    user_id: int
+    account_id: int
+    category_id: Optional[int]
+    amount: Decimal
+    description: str
+    merchant: Optional[str]
+    transaction_type: str
+    transaction_date: datetime
+    notes: Optional[str]
+
+
+def parse_csv(stream: BinaryIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Yield (line number, record) pairs from a CSV statement."""
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    if reader.fieldnames:
+        reader.fieldnames = [
+            CSV_ALIASES.get(name.strip().lower(), name.strip().lower())
+            for name in reader.fieldnames
+        ]
+    for record in reader:
+        yield reader.line_num, record
+
+
+def parse_ofx(stream: BinaryIO, read_size: int = 65536) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Yield (transaction number, record) pairs from an OFX statement.
+
+    Handles both SGML (unclosed leaf tags) and XML OFX, reading the file in
+    fixed-size chunks so memory use does not grow with the statement size.
+    """
+    reader = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+    buffer = ""
+    current: Optional[Dict[str, str]] = None
+    index = 0
+
+    while True:
+        chunk = reader.read(read_size)
+        text = buffer + chunk
+        # Only scan up to the last '<' so a value is never cut mid-chunk
+        end = len(text) if not chunk else max(text.rfind("<"), 0)
+
+        for match in OFX_TAG.finditer(text, 0, end):
+            closing, tag, value = match.group(1), match.group(2).upper(), match.group(3).strip()
+            if tag == "STMTTRN":
+                if closing and current is not None:
+                    index += 1
+                    yield index, {
+                        "date": current.get("DTPOSTED", ""),
+                        "amount": current.get("TRNAMT", ""),
+                        "description": current.get("NAME") or current.get("MEMO", ""),
+                        "merchant": current.get("NAME", ""),
+                        "notes": current.get("MEMO", ""),
+                    }
+                    current = None
+                elif not closing:
+                    current = {}
+            elif current is not None and not closing and value:
+                current[tag] = value
+
+        buffer = text[end:]
+        if not chunk:
+            break
+
+
+def parse_date(value: str, cache: Dict[str, datetime]) -> datetime:
+    """Parse ISO, US (MM/DD/YYYY) and OFX (YYYYMMDD[HHMMSS]) dates."""
+    parsed = cache.get(value)
+    if parsed is not None:
+        return parsed
+
+    text = value.strip()
+    if text[:8].isdigit():
+        # OFX: YYYYMMDD[HHMMSS[.XXX]][[gmt offset:tz name]]
+        if text[:14].isdigit() and len(text) >= 14:
+            parsed = datetime.strptime(text[:14], "%Y%m%d%H%M%S")
+        else:
+            parsed = datetime.strptime(text[:8], "%Y%m%d")
+    elif "/" in text:
+        parsed = datetime.strptime(text, "%m/%d/%Y")
+    else:
+        parsed = datetime.fromisoformat(text)
+
+    cache[value] = parsed
+    return parsed
+
+
+class TransactionImporter:
+    """Validate, insert and account for imported rows in chunks.
+
+    Each chunk is written with COPY (or a multi-row INSERT when the driver
+    has no COPY support) and folded into the balance ledger, spending rollup
+    and budget counters with one statement each. The account row is locked
+    before the first chunk, like every other write path locks its accounts
+    first, and its balance is adjusted once, with the aggregated delta, at
+    the end. The whole import is one database transaction: a failure
+    leaves no partial import behind, and other writes to the account wait
+    for the import to finish.
+
+    Rows already present (an overlapping statement imported before) are
+    found with one fingerprint lookup per chunk and skipped, or imported
+    and counted as duplicates with duplicates="allow".
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        account_id: int,
+        chunk_size: int = CHUNK_SIZE,
+        duplicates: str = "skip",
+    ):
+        self.db = db
+        self.user_id = user_id
+        self.account_id = account_id
+        self.chunk_size = chunk_size
+        self.duplicates = duplicates
+        self.processed = 0
+        self.imported = 0
+        self.duplicate_count = 0
+        self._inserted: Counter = Counter()
+        self.errors: List[dict] = []
+        self.error_count = 0
+        self.balance_delta = Decimal("0.00")
+        self._date_cache: Dict[str, datetime] = {}
+        self._matcher = CategorizationService.get_matcher(db, user_id)
+        self._match_cache: Dict[Tuple[str, Optional[str]], Optional[int]] = {}
+        self._category_ids = {
+            row.id
+            for row in db.query(Category.id).filter(
+                or_(Category.user_id == user_id, Category.is_system == True)
+            )
+        }
+
+    def validate(self, record: Dict[str, str]) -> ImportedRow:
+        """Convert a raw record into an ImportedRow or raise ValueError."""
+        raw_amount = (record.get("amount") or "").replace(",", "").replace("$", "").strip()
+        try:
+            amount = Decimal(raw_amount).quantize(Decimal("0.01"))
+        except InvalidOperation:
+            raise ValueError(f"invalid amount {raw_amount!r}")
+        if not amount.is_finite():
+            raise ValueError(f"invalid amount {raw_amount!r}")
+        if abs(amount) > MAX_AMOUNT:
+            raise ValueError(f"amount {raw_amount!r} is out of range")
+
+        transaction_type = (record.get("transaction_type") or "").strip().lower()
+        if not transaction_type:
+            # Signed statements: debits are negative
+            transaction_type = "expense" if amount < 0 else "income"
+        elif transaction_type not in TRANSACTION_TYPES:
+            raise ValueError(f"invalid transaction type {transaction_type!r}")
+
+        try:
+            transaction_date = parse_date(record.get("date") or "", self._date_cache)
+        except ValueError:
+            raise ValueError(f"invalid date {record.get('date')!r}")
+
+        description = (record.get("description") or "").strip()
+        if not description:
+            raise ValueError("description is required")
+
+        category_id = None
+        raw_category = (record.get("category_id") or "").strip()
+        if raw_category:
+            if not raw_category.isdigit() or int(raw_category) not in self._category_ids:
+                raise ValueError(f"unknown category {raw_category!r}")
+            category_id = int(raw_category)
+
+        merchant = (record.get("merchant") or "").strip() or None
+        if category_id is None:
+            category_id = self._matcher.match(
+                transaction_type, merchant, description, self._match_cache
+            )
+
+        return ImportedRow(
+            user_id=self.user_id,
+            account_id=self.account_id,
+            category_id=category_id,
+            amount=abs(amount),
+            description=description,
+            merchant=merchant,
+            transaction_type=transaction_type,
+            transaction_date=transaction_date,
+            notes=(record.get("notes") or "").strip() or None,
+        )
+
+    def _write_rows(self, rows: List[ImportedRow]) -> None:
+        """Insert a chunk with COPY, falling back to a multi-row INSERT."""
+        now = datetime.utcnow()
+        dbapi_connection = self.db.connection().connection
+        cursor = dbapi_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for row in rows:
+                    writer.writerow((*row, now, now))
+                buffer.seek(0)
+                cursor.copy_expert(COPY_SQL, buffer)
+                return
+        finally:
+            cursor.close()
+
+        self.db.execute(
+            insert(Transaction),
+            [dict(row._asdict(), created_at=now, updated_at=now) for row in rows],
+        )
+
+    def _flush(self, rows: List[ImportedRow]) -> None:
+        matches = crud.transaction.find_duplicates(
+            self.db, user_id=self.user_id, rows=rows, inserted=self._inserted
+        )
+        self.duplicate_count += sum(1 for _, existing_id in matches if existing_id is not None)
+        if self.duplicates == "skip":
+            kept = [
+                (row, fingerprint)
+                for row, (fingerprint, existing_id) in zip(rows, matches)
+                if existing_id is None
+            ]
+            rows = [row for row, _ in kept]
+            self._inserted.update(fingerprint for _, fingerprint in kept)
+        else:
+            self._inserted.update(fingerprint for fingerprint, _ in matches)
+        if not rows:
+            return
+
+        self._write_rows(rows)
+        if len(self._match_cache) > MAX_MATCH_CACHE:
+            self._match_cache.clear()
+        crud.balance_ledger.apply_many(self.db, transactions=rows)
+        crud.spending_rollup.apply_many(self.db, transactions=rows)
+        crud.budget.apply_transactions(self.db, transactions=rows)
+
+        for row in rows:
+            if row.transaction_type == "income":
+                self.balance_delta += row.amount
+            elif row.transaction_type == "expense":
+                self.balance_delta -= row.amount
+        self.imported += len(rows)
+
+    def progress(self, status: str) -> dict:
+        return {
+            "status": status,
+            "processed": self.processed,
+            "imported": self.imported,
+            "skipped": self.error_count,
+            "duplicates": self.duplicate_count,
+        }
+
+    def run(self, records: Iterable[Tuple[int, Dict[str, str]]]) -> Iterator[dict]:
+        """Import records, yielding a progress event after every chunk."""
+        try:
+            # Lock the account before the ledger, rollup and budget rows
+            if not crud.transaction.lock_accounts(
+                self.db, account_ids=[self.account_id], user_id=self.user_id
+            ):
+                raise ValueError("Account not found or access denied")
+
+            chunk: List[ImportedRow] = []
+            for line, record in records:
+                self.processed += 1
+                try:
+                    chunk.append(self.validate(record))
+                except ValueError as e:
+                    self.error_count += 1
+                    if len(self.errors) < MAX_REPORTED_ERRORS:
+                        self.errors.append({"line": line, "error": str(e)})
+                    continue
+
+                if len(chunk) >= self.chunk_size:
+                    self._flush(chunk)
+                    chunk = []
+                    yield self.progress("running")
+
+            if chunk:
+                self._flush(chunk)
+
+            # CRITICAL: One aggregated, server-side balance adjustment
+            crud.transaction.apply_balance_deltas(
+                self.db, deltas={self.account_id: self.balance_delta}
+            )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            event = self.progress("failed")
+            event["imported"] = 0
+            event["detail"] = str(e)
+            yield event
+            return
+
+        event = self.progress("completed")
+        event["errors"] = self.errors
+        yield event
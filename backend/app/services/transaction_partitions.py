@@ -0,0 +1,121 @@
+"""Maintenance of the monthly transactions partitions."""
+from datetime import date
+from typing import List, Optional
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import column, table, text
+from sqlalchemy.orm import Session
+
+from app.crud.budget import budget as crud_budget
+from app.crud.spending_rollup import spending_rollup
+from app.crud.transaction_archive import ARCHIVED_COLUMNS, archive_cutoff
+
+PARENT_TABLE = "transactions"
+DEFAULT_PARTITION = "transactions_default"
+MONTHS_AHEAD = 3
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding a month, e.g. transactions_y2026m02."""
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+class TransactionPartitionService:
+    """Create, list and archive monthly partitions of transactions.
+
+    Partitions are created ahead of time by create_transaction_partitions()
+    (installed by the partitioning migration). Archiving a month detaches
+    its partition and moves the rows into transactions_archive, the same
+    cold table the nightly archive job fills (see
+    app.crud.transaction_archive), so they stay visible through the
+    archive-aware reads. Detaching avoids deleting the month row by row
+    from the hot table.
+
+    Dropping a month deletes its rows for good and, like archiving, is
+    limited to months before the archive cutoff. The dropped rows are
+    subtracted from the spending rollup and budget counters so those stay
+    consistent with the remaining rows. Account balances and the balance
+    ledger keep them: the money did move, and balance charts keep their
+    history.
+    """
+
+    @staticmethod
+    def ensure_future(db: Session, months_ahead: int = MONTHS_AHEAD) -> int:
+        """Create any missing partitions from this month to months_ahead; returns how many."""
+        created = db.execute(
+            text("SELECT create_transaction_partitions(CURRENT_DATE, :months_ahead)"),
+            {"months_ahead": months_ahead},
+        ).scalar()
+        db.commit()
+        return created
+
+    @staticmethod
+    def list_partitions(db: Session) -> List[dict]:
+        """Attached partitions with their bounds and estimated row counts."""
+        rows = db.execute(
+            text(
+                """
+                SELECT child.relname AS name,
+                       pg_get_expr(child.relpartbound, child.oid) AS bounds,
+                       child.reltuples::bigint AS estimated_rows,
+                       pg_total_relation_size(child.oid) AS total_bytes
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = :parent
+                ORDER BY child.relname
+                """
+            ),
+            {"parent": PARENT_TABLE},
+        ).all()
+        return [dict(row._mapping) for row in rows]
+
+    @staticmethod
+    def _require_month_partition(db: Session, month: date) -> str:
+        name = partition_name(month)
+        attached = db.execute(
+            text(
+                """
+                SELECT 1 FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:parent AS regclass)
+                  AND child.relname = :name
+                """
+            ),
+            {"parent": PARENT_TABLE, "name": name},
+        ).first()
+        if not attached:
+            raise ValueError(f"Partition {name} is not attached to {PARENT_TABLE}")
+        return name
+
+    @staticmethod
+    def archive(db: Session, month: date, *, drop: bool = False) -> Optional[int]:
+        """Detach a month's partition and move its rows to transactions_archive (or drop it).
+
+        Only months before the archive cutoff can be archived or dropped,
+        since reads starting at or after the cutoff skip the archive table
+        and recent months are still being written. Everything commits
+        together. Returns the number of archived rows, or None when the
+        partition was dropped.
+        """
+        name = TransactionPartitionService._require_month_partition(db, month)
+        cutoff = archive_cutoff()
+        if month.replace(day=1) + relativedelta(months=1) > cutoff.date():
+            raise ValueError(
+                f"{month:%Y-%m} is not before the archive cutoff {cutoff:%Y-%m-%d}"
+            )
+
+        db.execute(text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{name}"'))
+        archived = None
+        if drop:
+            partition = table(name, *[column(c) for c in ARCHIVED_COLUMNS])
+            spending_rollup.remove_rows(db, source=partition)
+            crud_budget.reconcile_spent(db, commit=False)
+        else:
+            columns = ", ".join(ARCHIVED_COLUMNS)
+            archived = db.execute(
+                text(f'INSERT INTO transactions_archive ({columns}) SELECT {columns} FROM "{name}"')
+            ).rowcount
+        db.execute(text(f'DROP TABLE "{name}"'))
+        db.commit()
+        return archived
@@ -0,0 +1,48 @@
+"""Script to move transactions older than the archive horizon to cold storage.
+
+Run nightly (e.g. from cron). Rows dated before the start of the month
+ARCHIVE_HORIZON_MONTHS months ago move to transactions_archive; if the
+horizon was lengthened, archived rows newer than the cutoff move back first.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.database import MaintenanceSessionLocal
+from app.crud.transaction_archive import BATCH_SIZE, archive_cutoff, transaction_archive
+
+
+def archive(batch_size=BATCH_SIZE, dry_run=False):
+    """Restore rows newer than the cutoff, then archive rows older than it."""
+    cutoff = archive_cutoff()
+    if dry_run:
+        print(f"[INFO] Would archive transactions dated before {cutoff:%Y-%m-%d}.")
+        return 0
+
+    db = MaintenanceSessionLocal()
+    try:
+        restored = transaction_archive.restore_since(db, since=cutoff, batch_size=batch_size)
+        archived = transaction_archive.archive_before(db, before=cutoff, batch_size=batch_size)
+        print(
+            f"[SUCCESS] Archived {archived} transactions dated before {cutoff:%Y-%m-%d}"
+            f" (restored {restored})."
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    sys.exit(archive(args.batch_size, args.dry_run))
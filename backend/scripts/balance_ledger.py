@@ -0,0 +1,87 @@
+"""Script to backfill, snapshot or drift-check the account balance ledger.
+
+Run 'snapshot' periodically (e.g. nightly from cron) so balance-history
+points never have to add up more than one snapshot interval of entries.
+"""
+import argparse
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.database import MaintenanceSessionLocal
+from app.crud.balance_ledger import balance_ledger
+
+
+def backfill(account_id=None):
+    """Rebuild ledger entries and month-end snapshots from transactions."""
+    db = MaintenanceSessionLocal()
+    try:
+        balance_ledger.backfill(db, account_id=account_id)
+        scope = f"account {account_id}" if account_id is not None else "all accounts"
+        print(f"[SUCCESS] Rebuilt balance ledger for {scope}.")
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+def snapshot(day, account_id=None):
+    """Store end-of-day balances for a day."""
+    db = MaintenanceSessionLocal()
+    try:
+        count = balance_ledger.take_snapshots(db, day=day, account_id=account_id)
+        print(f"[SUCCESS] Stored {count} balance snapshots for {day}.")
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+def check(account_id=None):
+    """Report accounts whose ledger does not sum to the stored balance."""
+    db = MaintenanceSessionLocal()
+    try:
+        mismatches = balance_ledger.check_drift(db, account_id=account_id)
+    finally:
+        db.close()
+
+    for row in mismatches:
+        print(
+            f"[DRIFT] account={row['account_id']} "
+            f"balance {row['balance']} != ledger {row['ledger_balance']}"
+        )
+
+    if mismatches:
+        print(f"\n[ERROR] Found {len(mismatches)} drifted accounts. Run 'backfill' to repair.")
+        return 1
+
+    print("[OK] Balance ledger matches account balances.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=["backfill", "snapshot", "check"])
+    parser.add_argument("--account-id", type=int, default=None)
+    parser.add_argument(
+        "--day",
+        type=date.fromisoformat,
+        default=None,
+        help="Snapshot day (YYYY-MM-DD), defaults to yesterday (UTC)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "backfill":
+        sys.exit(backfill(args.account_id))
+    if args.command == "snapshot":
+        sys.exit(snapshot(args.day or datetime.utcnow().date() - timedelta(days=1), args.account_id))
+    sys.exit(check(args.account_id))
@@ -0,0 +1,71 @@
+"""Script to measure the per-request cost of resolving a bearer token to a user.
+
+Compares the uncached path (JWT verification plus a users query) with the
+cached fast path used by deps.get_current_user, each in a fresh session
+as in a real request.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.api.deps import get_user_from_token
+from app.core.auth_cache import auth_cache
+from app.core.database import SessionLocal
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+def measure(token, iterations, use_cache):
+    """Median and mean microseconds per token resolution."""
+    timings = []
+    for _ in range(iterations):
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            user = get_user_from_token(db, token, use_cache=use_cache)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+            if user is None:
+                raise RuntimeError("token did not resolve to a user")
+        finally:
+            db.close()
+    return statistics.median(timings), statistics.fmean(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, help="User to authenticate as (default: first user)")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        query = db.query(User.id)
+        if args.user_id is not None:
+            query = query.filter(User.id == args.user_id)
+        row = query.order_by(User.id).first()
+    finally:
+        db.close()
+    if row is None:
+        print("[ERROR] No user found; register one first.")
+        return 1
+
+    token = create_access_token(data={"sub": str(row.id)})
+    auth_cache.clear()
+
+    uncached_median, uncached_mean = measure(token, args.iterations, use_cache=False)
+    measure(token, 1, use_cache=True)  # warm the cache
+    cached_median, cached_mean = measure(token, args.iterations, use_cache=True)
+
+    print(f"[OK] Uncached: median {uncached_median:,.1f} us, mean {uncached_mean:,.1f} us per request")
+    print(f"[OK] Cached:   median {cached_median:,.1f} us, mean {cached_mean:,.1f} us per request")
+    print(f"[SUCCESS] Speedup x{uncached_median / cached_median:,.1f} (median), cache stats: {auth_cache.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
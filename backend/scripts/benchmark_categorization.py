@@ -0,0 +1,101 @@
+"""Script to measure categorization throughput against the 100k rows/s target.
+
+Two measurements for one user:
+
+- matching: the user's compiled rules applied to their own history texts,
+  repeated up to --rows, with a fresh memo as in an import;
+- recategorize: CategorizationService.recategorize over the whole history,
+  run inside a transaction that is rolled back, so nothing changes.
+"""
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal, engine
+from app.crud.category_rule import RULE_TYPES
+from app.crud.transaction_archive import transaction_archive
+from app.services.categorization import CategorizationService
+
+TARGET_ROWS_PER_SECOND = 100000
+
+
+def history_texts(db, user_id, limit):
+    """Up to `limit` (type, merchant, description) tuples from the user's history."""
+    history = transaction_archive.history()
+    return db.execute(
+        select(history.c.transaction_type, history.c.merchant, history.c.description)
+        .where(history.c.user_id == user_id, history.c.transaction_type.in_(RULE_TYPES))
+        .limit(limit)
+    ).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="User whose rules and history to use (default: most transactions)")
+    parser.add_argument("--rows", type=int, default=100000, help="Rows to match")
+    parser.add_argument("--skip-recategorize", action="store_true")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        history = transaction_archive.history()
+        query = select(history.c.user_id, func.count().label("rows"))
+        if args.user_id is not None:
+            query = query.where(history.c.user_id == args.user_id)
+        row = db.execute(query.group_by(history.c.user_id).order_by(desc("rows")).limit(1)).first()
+        if row is None:
+            print("[ERROR] No transactions found; seed some first.")
+            return 1
+
+        matcher = CategorizationService.get_matcher(db, row.user_id)
+        texts = history_texts(db, row.user_id, args.rows)
+    finally:
+        db.close()
+    print(f"[OK] User {row.user_id}: {row.rows} transactions, {len(matcher)} rules")
+
+    rows = list(itertools.islice(itertools.cycle(texts), args.rows))
+    memo = {}
+    started = time.perf_counter()
+    matched = sum(
+        1 for transaction_type, merchant, description in rows
+        if matcher.match(transaction_type, merchant, description, memo) is not None
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"[OK] Matching: {len(rows)} rows in {elapsed * 1000:.1f} ms, {len(rows) / elapsed:,.0f} rows/s,"
+        f" {matched} matched ({len(memo)} distinct texts)"
+    )
+
+    if not args.skip_recategorize:
+        # The session commits into a savepoint; the outer transaction is rolled back
+        with engine.connect() as connection:
+            outer = connection.begin()
+            db = Session(bind=connection, join_transaction_mode="create_savepoint")
+            try:
+                started = time.perf_counter()
+                changed = CategorizationService.recategorize(
+                    db, user_id=row.user_id, only_uncategorized=False
+                )
+                elapsed = time.perf_counter() - started
+            finally:
+                db.close()
+                outer.rollback()
+        print(
+            f"[OK] Recategorize: {row.rows} rows scanned, {changed} changed in {elapsed * 1000:.1f} ms,"
+            f" {row.rows / elapsed:,.0f} rows/s (rolled back)"
+        )
+
+    print(f"[SUCCESS] Benchmark finished (target {TARGET_ROWS_PER_SECOND:,} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
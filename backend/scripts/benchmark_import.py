@@ -0,0 +1,92 @@
+"""Script to measure bulk import throughput against the 50k rows/s target.
+
+Generates a CSV statement of --rows rows in memory and runs it through
+TransactionImporter for one account, the same path as
+POST /transactions/import. The import runs inside a transaction that is
+rolled back, so nothing is kept.
+"""
+import argparse
+import io
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.models.account import Account
+from app.services.transaction_import import TransactionImporter, parse_csv
+
+TARGET_ROWS_PER_SECOND = 50000
+MERCHANTS = ["Blue Bottle", "Whole Foods", "Shell", "Netflix", "Amazon", "Uber", "Target", "Landlord LLC"]
+
+
+def build_statement(rows, seed=0):
+    """CSV bytes of `rows` signed transactions, oldest first over about five years."""
+    rng = random.Random(seed)
+    start = datetime.utcnow() - timedelta(days=5 * 365)
+    step = timedelta(days=5 * 365) / max(rows, 1)
+    buffer = io.StringIO()
+    buffer.write("date,amount,description,merchant\n")
+    for index in range(rows):
+        merchant = rng.choice(MERCHANTS)
+        amount = rng.randint(100, 20000) / 100
+        sign = "" if merchant == "Landlord LLC" and index % 2 else "-"
+        buffer.write(
+            f"{(start + step * index):%Y-%m-%d},{sign}{amount:.2f},{merchant} #{index % 97},{merchant}\n"
+        )
+    return buffer.getvalue().encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--account-id", type=int, help="Account to import into (default: first account)")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--duplicates", choices=["skip", "allow"], default="skip")
+    args = parser.parse_args()
+
+    statement = build_statement(args.rows)
+    print(f"[OK] Generated {args.rows} rows ({len(statement) / (1024 * 1024):.1f} MB)")
+
+    # The importer commits into a savepoint; the outer transaction is rolled back
+    with engine.connect() as connection:
+        outer = connection.begin()
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            query = db.query(Account)
+            if args.account_id is not None:
+                query = query.filter(Account.id == args.account_id)
+            account = query.order_by(Account.id).first()
+            if account is None:
+                print("[ERROR] No account found; create one first.")
+                return 1
+
+            importer = TransactionImporter(
+                db, user_id=account.user_id, account_id=account.id, duplicates=args.duplicates
+            )
+            started = time.perf_counter()
+            for event in importer.run(parse_csv(io.BytesIO(statement))):
+                pass
+            elapsed = time.perf_counter() - started
+        finally:
+            db.close()
+            outer.rollback()
+
+    if event["status"] != "completed":
+        print(f"[ERROR] Import failed: {event.get('detail')}")
+        return 1
+    print(
+        f"[OK] Imported {event['imported']} of {event['processed']} rows in {elapsed:.2f} s,"
+        f" {event['processed'] / elapsed:,.0f} rows/s (rolled back)"
+    )
+    print(f"[SUCCESS] Benchmark finished (target {TARGET_ROWS_PER_SECOND:,} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Script to compare OFFSET and keyset (cursor) pagination of the transactions list.
+
+For each depth, fetches the page starting that many rows into a user's
+history both ways through crud.transaction.get_by_user and prints the
+median latency. OFFSET pages get slower with depth, keyset pages should
+not. Only the hot table is read (start_date is the archive cutoff).
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import desc, func
+
+from app.core.database import SessionLocal
+from app.crud.transaction import transaction as crud_transaction
+from app.crud.transaction_archive import archive_cutoff
+from app.models.transaction import Transaction
+
+
+def median_ms(fetch, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fetch()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def key_before(db, user_id, since, depth):
+    """(transaction_date, id) of the row just before `depth` in newest-first order."""
+    return (
+        db.query(Transaction.transaction_date, Transaction.id)
+        .filter(Transaction.user_id == user_id, Transaction.transaction_date >= since)
+        .order_by(desc(Transaction.transaction_date), desc(Transaction.id))
+        .offset(depth - 1)
+        .first()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, help="User to page through (default: most transactions)")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1000, 10000, 100000])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    since = archive_cutoff()
+    db = SessionLocal()
+    try:
+        query = db.query(Transaction.user_id, func.count().label("rows")).filter(
+            Transaction.transaction_date >= since
+        )
+        if args.user_id is not None:
+            query = query.filter(Transaction.user_id == args.user_id)
+        row = query.group_by(Transaction.user_id).order_by(desc("rows")).first()
+        if row is None:
+            print("[ERROR] No transactions found; seed some first.")
+            return 1
+        print(f"[OK] User {row.user_id}: {row.rows} transactions since {since:%Y-%m-%d}, page size {args.limit}")
+
+        for depth in args.depths:
+            if depth >= row.rows:
+                print(f"[INFO] Skipping depth {depth}: the user has only {row.rows} rows")
+                continue
+            after = tuple(key_before(db, row.user_id, since, depth)) if depth else None
+
+            def offset_page():
+                crud_transaction.get_by_user(
+                    db, user_id=row.user_id, start_date=since, skip=depth, limit=args.limit
+                )
+                db.expunge_all()
+
+            def keyset_page():
+                crud_transaction.get_by_user(
+                    db, user_id=row.user_id, start_date=since, after=after, limit=args.limit
+                )
+                db.expunge_all()
+
+            offset_ms = median_ms(offset_page, args.iterations)
+            keyset_ms = median_ms(keyset_page, args.iterations)
+            print(
+                f"[OK] Depth {depth:>8}: OFFSET {offset_ms:8.2f} ms, keyset {keyset_ms:8.2f} ms"
+                f" (x{offset_ms / keyset_ms:.1f})"
+            )
+    finally:
+        db.close()
+
+    print("[SUCCESS] Benchmark finished")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Script to time recurring-transaction detection on a 10-year history.
+
+Builds a synthetic history (monthly bills, weekly and biweekly charges,
+annual renewals, salary and random purchases) and times
+RecurringDetectionService.detect on it. With --user-id, a real user's
+history is loaded from the database and timed as well.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from app.services.recurring import RecurringDetectionService
+
+COLUMNS = [
+    "transaction_type", "merchant", "description", "amount",
+    "transaction_date", "account_id", "category_id",
+]
+
+
+def label(prefix, index):
+    """Merchant name with an alphabetic suffix (digits are dropped by normalization)."""
+    suffix = ""
+    while True:
+        index, remainder = divmod(index, 26)
+        suffix = chr(ord("a") + remainder) + suffix
+        if not index:
+            return f"{prefix} {suffix}"
+        index -= 1
+
+
+def synthetic_history(years, purchases_per_day, seed=0):
+    """History frame shaped like load_history's, oldest first."""
+    rng = random.Random(seed)
+    end = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    start = end - relativedelta(years=years)
+    rows = []
+
+    def add(transaction_type, merchant, amount, when):
+        rows.append((transaction_type, merchant, merchant, Decimal(f"{amount:.2f}"), when, 1, None))
+
+    for index in range(30):
+        merchant, amount = label("Subscription", index), rng.uniform(5, 80)
+        months = 12 if index % 10 == 0 else 1
+        when = start + timedelta(days=rng.randint(0, 27))
+        while when < end:
+            add("expense", merchant, amount, when)
+            when += relativedelta(months=months)
+    for index, days in enumerate((7, 14)):
+        when = start
+        while when < end:
+            add("expense", label("Cleaner", index), 60, when + timedelta(days=rng.choice((-1, 0, 0, 1))))
+            when += timedelta(days=days)
+    when = start
+    while when < end:
+        add("income", "Employer Payroll", 4200, when)
+        when += relativedelta(months=1)
+
+    merchants = [label("Shop", index) for index in range(500)]
+    day = start
+    while day < end:
+        for _ in range(purchases_per_day):
+            add("expense", rng.choice(merchants), rng.uniform(2, 200), day + timedelta(minutes=rng.randint(0, 600)))
+        day += timedelta(days=1)
+
+    rows.sort(key=lambda row: row[4])
+    return pd.DataFrame.from_records(rows, columns=COLUMNS)
+
+
+def median_ms(frame, iterations):
+    timings, found = [], []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        found = RecurringDetectionService.detect(frame)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), len(found)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--purchases-per-day", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--user-id", type=int, help="Also time this user's stored history")
+    args = parser.parse_args()
+
+    frame = synthetic_history(args.years, args.purchases_per_day)
+    elapsed, found = median_ms(frame, args.iterations)
+    print(f"[OK] Synthetic {args.years}-year history: {len(frame)} rows, {found} series, detect {elapsed:.1f} ms")
+
+    if args.user_id is not None:
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            frame = RecurringDetectionService.load_history(db, args.user_id)
+            load_ms = (time.perf_counter() - started) * 1000
+        finally:
+            db.close()
+        elapsed, found = median_ms(frame, args.iterations)
+        print(
+            f"[OK] User {args.user_id}: {len(frame)} rows, {found} series,"
+            f" load {load_ms:.1f} ms, detect {elapsed:.1f} ms"
+        )
+
+    print("[SUCCESS] Benchmark finished")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
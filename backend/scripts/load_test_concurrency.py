@@ -0,0 +1,77 @@
+"""Script to measure how many concurrent requests one API worker sustains.
+
+Ramps up the number of concurrent clients against an authenticated
+endpoint and prints throughput and p50/p99 latency per level. Run it
+against a single uvicorn worker before and after a change to compare:
+
+    uvicorn app.main:app --workers 1
+    python scripts/load_test_concurrency.py --levels 10 50 100 200 400
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+
+import httpx
+
+from load_test_login_storm import API_PREFIX, get_token, percentile
+
+
+async def run_level(client, path, headers, clients, duration):
+    """Latencies (ms) and status counts of `clients` concurrent request loops."""
+    deadline = time.perf_counter() + duration
+    latencies = []
+    statuses = Counter()
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[response.status_code] += 1
+
+    await asyncio.gather(*[worker() for _ in range(clients)])
+    return latencies, statuses
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=max(args.levels) + 1)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=120, limits=limits) as client:
+        token = await get_token(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+        path = f"{API_PREFIX}{args.path}"
+
+        print(f"[OK] GET {path}, {args.duration:.0f}s per level")
+        for clients in args.levels:
+            latencies, statuses = await run_level(client, path, headers, clients, args.duration)
+            errors = sum(count for status, count in statuses.items() if status >= 400)
+            print(
+                f"[OK] {clients:>4} clients: {len(latencies) / args.duration:8.1f} req/s,"
+                f" p50 {statistics.median(latencies):7.1f} ms,"
+                f" p99 {percentile(latencies, 0.99):7.1f} ms, {errors} errors"
+            )
+    print("[SUCCESS] Load test finished")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", default="loadtest@example.com")
+    parser.add_argument("--password", default="loadtest-password")
+    parser.add_argument("--path", default="/transactions/?limit=50", help="Endpoint under /api/v1")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per level")
+    parser.add_argument("--levels", type=int, nargs="+", default=[10, 50, 100, 200, 400])
+    args = parser.parse_args()
+
+    try:
+        return asyncio.run(run(args))
+    except httpx.HTTPError as e:
+        print(f"[ERROR] Error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Script to check that a login storm does not slow down other API calls.
+
+Against a running server, measures dashboard latency alone, then again
+while many clients log in concurrently, and prints p50/p99 for both phases
+with the login outcomes (accepted, rejected with 503, failed).
+
+    python scripts/load_test_login_storm.py --base-url http://localhost:8000 \\
+        --email loadtest@example.com --password secret123
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+
+import httpx
+
+API_PREFIX = "/api/v1"
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def get_token(client, email, password):
+    """Log in, registering the user first when it does not exist."""
+    form = {"username": email, "password": password}
+    response = await client.post(f"{API_PREFIX}/auth/login", data=form)
+    if response.status_code == 401:
+        await client.post(
+            f"{API_PREFIX}/auth/register", json={"email": email, "password": password}
+        )
+        response = await client.post(f"{API_PREFIX}/auth/login", data=form)
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def dashboard_load(client, token, concurrency, duration):
+    """Latencies (ms) of dashboard requests issued back to back by `concurrency` clients."""
+    headers = {"Authorization": f"Bearer {token}"}
+    deadline = time.perf_counter() + duration
+    latencies = []
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get(f"{API_PREFIX}/dashboard/summary", headers=headers)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return latencies
+
+
+async def login_storm(client, email, password, concurrency, duration):
+    """Outcome counts of logins issued back to back by `concurrency` clients."""
+    deadline = time.perf_counter() + duration
+    outcomes = Counter()
+    form = {"username": email, "password": password}
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            response = await client.post(f"{API_PREFIX}/auth/login", data=form)
+            outcomes[response.status_code] += 1
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return outcomes
+
+
+def report(label, latencies):
+    print(
+        f"[OK] {label}: {len(latencies)} requests, p50 {statistics.median(latencies):.1f} ms,"
+        f" p99 {percentile(latencies, 0.99):.1f} ms"
+    )
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.dashboard_clients + args.login_clients + 1)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits) as client:
+        token = await get_token(client, args.email, args.password)
+
+        baseline = await dashboard_load(client, token, args.dashboard_clients, args.duration)
+        storm, outcomes = await asyncio.gather(
+            dashboard_load(client, token, args.dashboard_clients, args.duration),
+            login_storm(client, args.email, args.password, args.login_clients, args.duration),
+        )
+
+    report("Dashboard, baseline", baseline)
+    report("Dashboard, during login storm", storm)
+    print(
+        f"[OK] Logins: {outcomes.get(200, 0)} accepted, {outcomes.get(503, 0)} rejected (503),"
+        f" {sum(outcomes.values()) - outcomes.get(200, 0) - outcomes.get(503, 0)} other"
+    )
+    ratio = percentile(storm, 0.99) / percentile(baseline, 0.99)
+    print(f"[SUCCESS] Dashboard p99 during the storm is x{ratio:.2f} of baseline")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", default="loadtest@example.com")
+    parser.add_argument("--password", default="loadtest-password")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per phase")
+    parser.add_argument("--dashboard-clients", type=int, default=10)
+    parser.add_argument("--login-clients", type=int, default=200)
+    args = parser.parse_args()
+
+    try:
+        return asyncio.run(run(args))
+    except httpx.HTTPError as e:
+        print(f"[ERROR] Error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
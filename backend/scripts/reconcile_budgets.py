@@ -0,0 +1,45 @@
+"""Script to reconcile materialized budget spent counters."""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.database import MaintenanceSessionLocal
+from app.crud.budget import budget
+
+
+def reconcile_budgets(user_id=None, fix=True):
+    """Recompute spent counters in bulk and report mismatches."""
+    db = MaintenanceSessionLocal()
+    try:
+        mismatches = budget.reconcile_spent(db, user_id=user_id, fix=fix)
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+
+    for row in mismatches:
+        print(f"[DRIFT] budget={row['budget_id']} spent {row['actual']} != {row['expected']}")
+
+    if mismatches and not fix:
+        print(f"\n[ERROR] Found {len(mismatches)} drifted budgets. Re-run without --dry-run to repair.")
+        return 1
+
+    if mismatches:
+        print(f"\n[SUCCESS] Repaired {len(mismatches)} budget counters.")
+    else:
+        print("[OK] Budget spent counters match the spending rollup.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="report mismatches without fixing them")
+    args = parser.parse_args()
+
+    sys.exit(reconcile_budgets(args.user_id, fix=not args.dry_run))
@@ -0,0 +1,51 @@
+"""Script to re-detect recurring transactions (subscriptions, bills) for every user.
+
+Run nightly so upcoming-charge predictions stay current; the API only
+re-detects on an explicit refresh or after a bulk import.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.database import MaintenanceSessionLocal
+from app.models.user import User
+from app.services.recurring import RecurringDetectionService
+
+
+def refresh(user_id=None):
+    """Re-detect recurring series for one user, or all active users."""
+    db = MaintenanceSessionLocal()
+    try:
+        if user_id is not None:
+            user_ids = [user_id]
+        else:
+            user_ids = [row.id for row in db.query(User.id).filter(User.is_active == True)]
+
+        started = time.perf_counter()
+        total = 0
+        for uid in user_ids:
+            total += len(RecurringDetectionService.refresh(db, uid))
+        elapsed = time.perf_counter() - started
+        print(
+            f"[SUCCESS] Detected {total} recurring series for {len(user_ids)} users"
+            f" in {elapsed:.1f}s."
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, help="Only this user")
+    args = parser.parse_args()
+
+    sys.exit(refresh(args.user_id))
@@ -5,14 +5,14 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from app.core.database import SessionLocal
+from app.core.database import MaintenanceSessionLocal
 from app.crud.category import category
 from app.schemas.category import CategoryCreate
 
 
 def seed_categories():
     """Create default system categories."""
-    db = SessionLocal()
+    db = MaintenanceSessionLocal()
 
     # Default expense categories
     expense_categories = [
@@ -0,0 +1,80 @@
+"""Script to seed system categorization rules for the default categories.
+
+Run after seed_categories.py. Existing system rules are kept.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.database import MaintenanceSessionLocal
+from app.crud.category import category
+from app.crud.category_rule import category_rule, normalize_text
+
+# Merchant and description words per default category
+SYSTEM_RULES = {
+    "Food & Dining": [
+        "starbucks", "mcdonalds", "chipotle", "subway", "dunkin", "domino s", "pizza hut",
+        "doordash", "uber eats", "grubhub", "whole foods", "trader joe s", "safeway",
+        "kroger", "restaurant", "cafe", "coffee", "bakery", "grocery",
+    ],
+    "Transportation": [
+        "uber", "lyft", "shell", "chevron", "exxon", "bp", "parking", "toll", "metro",
+        "transit", "fuel", "gas station",
+    ],
+    "Shopping": [
+        "amazon", "amzn mktp", "target", "walmart", "costco", "best buy", "ikea", "etsy",
+        "ebay", "home depot",
+    ],
+    "Entertainment": [
+        "netflix", "spotify", "hulu", "disney plus", "hbo max", "steam", "playstation",
+        "xbox", "cinema", "theatre", "ticketmaster",
+    ],
+    "Bills & Utilities": [
+        "comcast", "verizon", "at t", "t mobile", "electric", "water bill", "internet",
+        "utility", "insurance",
+    ],
+    "Healthcare": ["pharmacy", "cvs", "walgreens", "dental", "clinic", "hospital"],
+    "Education": ["tuition", "coursera", "udemy", "bookstore"],
+    "Travel": ["airbnb", "expedia", "booking com", "hotel", "airlines", "delta air", "united air"],
+    "Housing": ["rent", "mortgage", "hoa"],
+    "Salary": ["payroll", "salary", "direct deposit"],
+    "Investments": ["dividend", "interest payment"],
+}
+
+
+def seed_category_rules():
+    """Create default system categorization rules."""
+    db = MaintenanceSessionLocal()
+
+    try:
+        rules = []
+        for name, patterns in SYSTEM_RULES.items():
+            system_category = db.query(category.model).filter(
+                category.model.name == name,
+                category.model.is_system == True
+            ).first()
+
+            if not system_category:
+                print(f"[SKIP] Skipped: {name} (category missing, run seed_categories.py)")
+                continue
+
+            rules.extend(
+                (system_category.category_type, normalize_text(pattern), system_category.id)
+                for pattern in patterns
+            )
+            print(f"[OK] {name}: {len(patterns)} rules")
+
+        created = category_rule.create_system_rules(db, rules=rules)
+        print(f"\n[SUCCESS] Seeding complete! Created {created} system rules.")
+
+    except Exception as e:
+        print(f"[ERROR] Error: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    seed_category_rules()
@@ -0,0 +1,61 @@
+"""Script to backfill or drift-check the daily spending rollup."""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.database import MaintenanceSessionLocal
+from app.crud.spending_rollup import spending_rollup
+
+
+def backfill(user_id=None):
+    """Rebuild rollup rows from raw transactions."""
+    db = MaintenanceSessionLocal()
+    try:
+        spending_rollup.backfill(db, user_id=user_id)
+        scope = f"user {user_id}" if user_id is not None else "all users"
+        print(f"[SUCCESS] Rebuilt daily spending rollup for {scope}.")
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+def check(user_id=None):
+    """Report rollup rows that disagree with raw transactions."""
+    db = MaintenanceSessionLocal()
+    try:
+        mismatches = spending_rollup.check_drift(db, user_id=user_id)
+    finally:
+        db.close()
+
+    for row in mismatches:
+        print(
+            f"[DRIFT] user={row['user_id']} category={row['category_id']} "
+            f"type={row['transaction_type']} day={row['day']} "
+            f"amount {row['actual_amount']} != {row['expected_amount']}, "
+            f"count {row['actual_count']} != {row['expected_count']}"
+        )
+
+    if mismatches:
+        print(f"\n[ERROR] Found {len(mismatches)} drifted rollup rows. Run 'backfill' to repair.")
+        return 1
+
+    print("[OK] Daily spending rollup matches transactions.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=["backfill", "check"])
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.command == "backfill":
+        sys.exit(backfill(args.user_id))
+    sys.exit(check(args.user_id))
@@ -0,0 +1,89 @@
+"""Script to maintain the monthly partitions of the transactions table.
+
+Run 'ensure' regularly (e.g. daily from cron) so partitions exist before
+their month starts; rows for months without a partition land in the
+default partition and are moved out when the partition is created.
+'archive' moves a whole month older than the archive cutoff into
+transactions_archive by detaching its partition; with --drop its rows
+are deleted instead and subtracted from the spending rollup and budgets.
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.database import MaintenanceSessionLocal
+from app.services.transaction_partitions import MONTHS_AHEAD, TransactionPartitionService
+
+
+def parse_month(value):
+    """Parse YYYY-MM into the first day of that month."""
+    return datetime.strptime(value, "%Y-%m").date()
+
+
+def ensure(months_ahead):
+    """Create missing partitions up to months_ahead months from now."""
+    db = MaintenanceSessionLocal()
+    try:
+        created = TransactionPartitionService.ensure_future(db, months_ahead=months_ahead)
+        print(f"[SUCCESS] Created {created} partitions ({months_ahead} months ahead covered).")
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+def list_partitions():
+    """Print attached partitions with bounds and sizes."""
+    db = MaintenanceSessionLocal()
+    try:
+        partitions = TransactionPartitionService.list_partitions(db)
+    finally:
+        db.close()
+
+    for p in partitions:
+        size_mb = p["total_bytes"] / (1024 * 1024)
+        print(f"{p['name']:<28} ~{p['estimated_rows']:>10} rows {size_mb:>10.1f} MB  {p['bounds']}")
+    print(f"\n[OK] {len(partitions)} partitions attached.")
+    return 0
+
+
+def archive(month, drop=False):
+    """Move a month's partition into transactions_archive, or drop it."""
+    db = MaintenanceSessionLocal()
+    try:
+        archived = TransactionPartitionService.archive(db, month, drop=drop)
+        if archived is None:
+            print(f"[SUCCESS] Detached and dropped partition for {month:%Y-%m}.")
+        else:
+            print(f"[SUCCESS] Moved {archived} transactions from {month:%Y-%m} to transactions_archive.")
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=["ensure", "list", "archive"])
+    parser.add_argument("--months-ahead", type=int, default=MONTHS_AHEAD)
+    parser.add_argument("--month", type=parse_month, help="Partition month (YYYY-MM)")
+    parser.add_argument("--drop", action="store_true", help="With 'archive': delete the month's rows instead")
+    args = parser.parse_args()
+
+    if args.command == "ensure":
+        sys.exit(ensure(args.months_ahead))
+    if args.command == "list":
+        sys.exit(list_partitions())
+    if args.month is None:
+        parser.error("--month is required for archive")
+    sys.exit(archive(args.month, drop=args.drop))
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app import crud
+from app.models.balance_ledger import AccountBalanceLedger
+from app.models.category import Category
+from app.models.spending_rollup import DailySpendingRollup
+from app.schemas.account import AccountUpdate
+from app.schemas.budget import BudgetCreate
+from app.schemas.transaction import TransactionCreate
+
+pytestmark = pytest.mark.postgres
+
+
+def add_expense(db, user, account, amount, category_id=None):
+    return crud.transaction.create_with_user(
+        db,
+        obj_in=TransactionCreate(
+            account_id=account.id,
+            category_id=category_id,
+            amount=amount,
+            description="Groceries",
+            transaction_type="expense",
+            transaction_date=datetime.utcnow().replace(microsecond=0),
+        ),
+        user_id=user.id,
+    )
+
+
+def test_balance_correction_uses_the_locked_balance(db, user, account):
+    add_expense(db, user, account, Decimal("5.00"))
+    # As loaded before the expense was written
+    set_committed_value(account, "balance", Decimal("0.00"))
+
+    crud.account.update(db, db_obj=account, obj_in=AccountUpdate(balance=Decimal("100.00")))
+
+    ledger_total = db.scalar(
+        select(func.sum(AccountBalanceLedger.net_change))
+        .where(AccountBalanceLedger.account_id == account.id)
+    )
+    assert account.balance == ledger_total == Decimal("100.00")
+
+
+def test_delete_removes_the_account_from_rollups_and_budgets(db, user, account):
+    category = Category(user_id=user.id, name="Food", category_type="expense")
+    db.add(category)
+    db.flush()
+    budget = crud.budget.create_with_user(
+        db,
+        obj_in=BudgetCreate(
+            category_id=category.id,
+            amount=Decimal("200.00"),
+            period="monthly",
+            start_date=datetime.utcnow() - timedelta(days=1),
+        ),
+        user_id=user.id,
+    )
+    add_expense(db, user, account, Decimal("25.00"), category_id=category.id)
+    db.refresh(budget)
+    assert budget.spent == Decimal("25.00")
+
+    crud.account.delete(db, id=account.id)
+
+    db.refresh(budget)
+    assert budget.spent == Decimal("0.00")
+    assert not db.scalar(
+        select(func.sum(DailySpendingRollup.transaction_count))
+        .where(DailySpendingRollup.user_id == user.id)
+    )
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from app.core.auth_cache import AuthCache
+from app.core.cache import LRUCacheBackend
+
+
+def test_invalidation_reaches_other_workers():
+    shared = LRUCacheBackend()  # stands in for Redis
+    worker_a = AuthCache(ttl=60, versions=shared)
+    worker_b = AuthCache(ttl=60, versions=shared)
+    user = SimpleNamespace(id=7, is_active=True)
+
+    worker_b.set_user(user, worker_b.user_version(user.id))
+    assert worker_b.get_user(user.id) is user
+
+    worker_a.invalidate_user(user.id)
+    assert worker_b.get_user(user.id) is None
+
+
+def test_invalidation_during_load_is_not_masked():
+    cache = AuthCache(ttl=60)
+    user = SimpleNamespace(id=7, is_active=True)
+
+    version = cache.user_version(user.id)  # read before the database load
+    cache.invalidate_user(user.id)  # user deactivated meanwhile
+    cache.set_user(user, version)
+
+    assert cache.get_user(user.id) is None
@@ -0,0 +1,168 @@
+"""Concurrent single-row writes, batches and imports against the same accounts.
+
+Every write path locks its accounts first, in id order, so the mix must
+finish without deadlocks and leave balances equal to the transactions
+behind them. Runs with committed data on separate connections, cleaned
+up afterwards.
+"""
+import io
+import random
+import threading
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import case, delete, func, select
+
+from app import crud
+from app.core.database import SessionLocal
+from app.models.account import Account
+from app.models.balance_ledger import AccountBalanceLedger, AccountBalanceSnapshot
+from app.models.spending_rollup import DailySpendingRollup
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.transaction import (
+    TransactionBatchCreate,
+    TransactionBatchDelete,
+    TransactionCreate,
+    TransactionUpdate,
+)
+from app.services.transaction_import import TransactionImporter, parse_csv
+
+pytestmark = pytest.mark.postgres
+
+THREADS = 8
+ITERATIONS = 15
+
+
+@pytest.fixture
+def accounts(pg_engine):
+    db = SessionLocal()
+    user = User(email=f"stress-{uuid.uuid4().hex}@example.com", hashed_password="not-a-hash")
+    db.add(user)
+    db.flush()
+    created = [
+        Account(user_id=user.id, account_name=f"Account {index}", account_type="checking", balance=0)
+        for index in range(2)
+    ]
+    db.add_all(created)
+    db.commit()
+    user_id, account_ids = user.id, [a.id for a in created]
+    db.close()
+
+    yield user_id, account_ids
+
+    db = SessionLocal()
+    db.execute(delete(Transaction).where(Transaction.user_id == user_id))
+    db.execute(delete(AccountBalanceSnapshot).where(AccountBalanceSnapshot.account_id.in_(account_ids)))
+    db.execute(delete(AccountBalanceLedger).where(AccountBalanceLedger.account_id.in_(account_ids)))
+    db.execute(delete(DailySpendingRollup).where(DailySpendingRollup.user_id == user_id))
+    db.execute(delete(Account).where(Account.user_id == user_id))
+    db.execute(delete(User).where(User.id == user_id))
+    db.commit()
+    db.close()
+
+
+def new_transaction(rng, account_ids):
+    return TransactionCreate(
+        account_id=rng.choice(account_ids),
+        amount=Decimal(rng.randint(100, 10000)) / 100,
+        description=f"Stress {uuid.uuid4().hex[:8]}",
+        transaction_type=rng.choice(["income", "expense", "expense"]),
+        transaction_date=datetime.utcnow() - timedelta(days=rng.randint(0, 20)),
+    )
+
+
+def statement(rng, rows):
+    lines = ["date,description,amount"]
+    for _ in range(rows):
+        day = datetime.utcnow() - timedelta(days=rng.randint(0, 20))
+        lines.append(f"{day:%Y-%m-%d},Imported {uuid.uuid4().hex[:8]},{rng.randint(-5000, 5000) / 100:.2f}")
+    return io.BytesIO("\n".join(lines).encode())
+
+
+def writer(seed, user_id, account_ids, errors):
+    rng = random.Random(seed)
+    own_ids = []
+    db = SessionLocal()
+    try:
+        for _ in range(ITERATIONS):
+            action = rng.choice(["create", "update", "delete", "batch", "import"])
+            if action == "create" or not own_ids and action in ("update", "delete"):
+                created = crud.transaction.create_with_user(
+                    db, obj_in=new_transaction(rng, account_ids), user_id=user_id
+                )
+                own_ids.append(created.id)
+            elif action == "update":
+                db_obj = crud.transaction.get_user_transaction(
+                    db, transaction_id=rng.choice(own_ids), user_id=user_id
+                )
+                crud.transaction.update(
+                    db,
+                    db_obj=db_obj,
+                    obj_in=TransactionUpdate(
+                        account_id=rng.choice(account_ids), amount=Decimal(rng.randint(100, 9000)) / 100
+                    ),
+                )
+            elif action == "delete":
+                crud.transaction.delete(db, id=own_ids.pop(rng.randrange(len(own_ids))))
+            elif action == "batch":
+                operations = [
+                    TransactionBatchCreate(op="create", data=new_transaction(rng, account_ids))
+                    for _ in range(3)
+                ]
+                if own_ids:
+                    operations.append(TransactionBatchDelete(op="delete", id=own_ids.pop()))
+                results = crud.transaction.apply_batch(
+                    db, operations=operations, user_id=user_id, atomic=True
+                )
+                assert all(r.status == "ok" for r in results), results
+                own_ids.extend(r.id for r in results if r.op == "create")
+            else:
+                importer = TransactionImporter(
+                    db, user_id=user_id, account_id=rng.choice(account_ids), duplicates="allow"
+                )
+                events = list(importer.run(parse_csv(statement(rng, 5))))
+                assert events[-1]["status"] == "completed", events[-1]
+    except Exception as e:
+        errors.append(e)
+    finally:
+        db.close()
+
+
+def test_concurrent_writers_do_not_deadlock_and_keep_balances(accounts):
+    user_id, account_ids = accounts
+    errors = []
+    threads = [
+        threading.Thread(target=writer, args=(seed, user_id, account_ids, errors))
+        for seed in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=300)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert errors == []
+
+    effect = case(
+        (Transaction.transaction_type == "income", Transaction.amount),
+        (Transaction.transaction_type == "expense", -Transaction.amount),
+        else_=0,
+    )
+    db = SessionLocal()
+    try:
+        for account_id in account_ids:
+            balance = db.execute(select(Account.balance).where(Account.id == account_id)).scalar_one()
+            expected = db.execute(
+                select(func.coalesce(func.sum(effect), 0)).where(Transaction.account_id == account_id)
+            ).scalar_one()
+            ledger = db.execute(
+                select(func.coalesce(func.sum(AccountBalanceLedger.net_change), 0)).where(
+                    AccountBalanceLedger.account_id == account_id
+                )
+            ).scalar_one()
+            assert balance == expected == ledger
+    finally:
+        db.close()
@@ -0,0 +1,28 @@
+import pytest
+
+from app.core import cache
+from app.core.cache import LRUCacheBackend, ResponseCache
+
+
+def test_bump_version_invalidates_cached_views():
+    response_cache = ResponseCache(LRUCacheBackend())
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"total": len(calls)}
+
+    assert response_cache.get_or_compute("dashboard_summary", 1, compute) == {"total": 1}
+    assert response_cache.get_or_compute("dashboard_summary", 1, compute) == {"total": 1}
+    response_cache.bump_version(1)
+    assert response_cache.get_or_compute("dashboard_summary", 1, compute) == {"total": 2}
+
+
+def test_memory_backend_is_refused_with_several_workers(monkeypatch):
+    monkeypatch.setattr(cache.settings, "CACHE_BACKEND", "memory")
+    monkeypatch.setattr(cache.settings, "WEB_CONCURRENCY", 4)
+    with pytest.raises(RuntimeError):
+        cache.build_backend()
+
+    monkeypatch.setattr(cache.settings, "WEB_CONCURRENCY", 1)
+    assert isinstance(cache.build_backend(), LRUCacheBackend)
@@ -0,0 +1,40 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app import crud
+from app.models.category import Category
+from app.schemas.transaction import TransactionCreate
+from app.services.categorization import CategorizationService
+
+pytestmark = pytest.mark.postgres
+
+
+def test_recategorize_locks_accounts_before_writing(db, user, account, count_queries):
+    category = Category(user_id=user.id, name="Coffee", category_type="expense")
+    db.add(category)
+    db.flush()
+    crud.category_rule.learn(
+        db, user_id=user.id, category_id=category.id, transaction_type="expense", pattern="blue bottle"
+    )
+    crud.transaction.create_with_user(
+        db,
+        obj_in=TransactionCreate(
+            account_id=account.id,
+            amount=Decimal("4.50"),
+            description="Blue Bottle Coffee",
+            merchant="Blue Bottle",
+            transaction_type="expense",
+            transaction_date=datetime.utcnow().replace(microsecond=0),
+        ),
+        user_id=user.id,
+    )
+    CategorizationService.invalidate(user.id)
+
+    with count_queries() as statements:
+        assert CategorizationService.recategorize(db, user_id=user.id) == 1
+
+    lock = next(i for i, s in enumerate(statements) if "FROM accounts" in s and "FOR UPDATE" in s)
+    first_write = next(i for i, s in enumerate(statements) if s.lstrip().upper().startswith("UPDATE"))
+    assert lock < first_write
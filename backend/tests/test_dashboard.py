@@ -0,0 +1,80 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from app import crud
+from app.crud.transaction_archive import archive_cutoff
+from app.models.budget import Budget
+from app.models.category import Category
+from app.schemas.transaction import TransactionCreate
+from app.services.dashboard import DashboardService
+
+pytestmark = pytest.mark.postgres
+
+
+@pytest.mark.parametrize("budget_count", [1, 25])
+def test_summary_query_count_does_not_grow_with_budgets(db, user, account, count_queries, budget_count):
+    today = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    user_id, account_id = user.id, account.id
+    for index in range(budget_count):
+        category = Category(user_id=user_id, name=f"Category {index}", category_type="expense")
+        db.add(category)
+        db.flush()
+        db.add(Budget(
+            user_id=user_id,
+            category_id=category.id,
+            amount=Decimal("100.00"),
+            period="monthly",
+            start_date=today.replace(day=1, hour=0),
+        ))
+        db.flush()
+        crud.transaction.create_with_user(
+            db,
+            obj_in=TransactionCreate(
+                account_id=account_id,
+                category_id=category.id,
+                amount=Decimal("12.50"),
+                description=f"Purchase {index}",
+                transaction_type="expense",
+                transaction_date=today,
+            ),
+            user_id=user_id,
+        )
+
+    with count_queries() as statements:
+        summary = DashboardService.get_summary(db, user_id)
+
+    assert len(statements) == 3
+    assert summary["total_accounts"] == 1
+    assert summary["total_transactions"] == budget_count
+    assert summary["total_budget"] == Decimal("100.00") * budget_count
+    assert summary["total_spent"] == Decimal("12.50") * budget_count
+    assert len(summary["recent_transactions"]) == min(budget_count, DashboardService.RECENT_TRANSACTIONS_LIMIT)
+
+
+def test_total_transactions_counts_hot_and_archived_rows(db, user, account):
+    old_date = archive_cutoff() - relativedelta(months=1)
+    created = [
+        crud.transaction.create_with_user(
+            db,
+            obj_in=TransactionCreate(
+                account_id=account.id,
+                amount=Decimal("3.00"),
+                description=f"Purchase {index}",
+                transaction_type="expense",
+                transaction_date=old_date if index < 2 else datetime.utcnow().replace(microsecond=0),
+            ),
+            user_id=user.id,
+        )
+        for index in range(5)
+    ]
+    removed = created[-1]
+    crud.transaction.delete(db, id=removed.id, transaction_date=removed.transaction_date)
+    crud.transaction_archive.archive_before(db, before=archive_cutoff())
+
+    summary = DashboardService.get_summary(db, user.id)
+
+    assert summary["total_transactions"] == 4
+    assert crud.spending_rollup.check_drift(db, user_id=user.id) == []
@@ -0,0 +1,23 @@
+from sqlalchemy import create_engine
+
+from app.core import db_pool
+
+
+def test_statement_timeout_only_on_request_engines(monkeypatch):
+    monkeypatch.setattr(db_pool.settings, "DB_PGBOUNCER", False)
+    monkeypatch.setattr(db_pool.settings, "DB_STATEMENT_TIMEOUT_MS", 30000)
+
+    assert db_pool.engine_options()["connect_args"] == {"options": "-c statement_timeout=30000"}
+    assert "statement_timeout" in db_pool.engine_options(is_async=True)["connect_args"]["server_settings"]
+    assert "connect_args" not in db_pool.engine_options(statement_timeout=False)
+
+
+def test_pool_stats_reports_the_configured_overflow():
+    engine = create_engine("sqlite://", poolclass=db_pool.TimedQueuePool, pool_size=2, max_overflow=3)
+    with engine.connect():
+        stats = db_pool.pool_stats(engine)
+
+    assert stats["size"] == 2
+    assert stats["max_overflow"] == 3
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 1
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.main import app
+
+
+@pytest.fixture
+def client_as():
+    def login(**user):
+        app.dependency_overrides[deps.get_current_user] = lambda: SimpleNamespace(
+            id=1, is_active=True, **user
+        )
+        return TestClient(app)
+
+    yield login
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path", ["/metrics/cache", "/metrics/auth", "/metrics/db"])
+def test_metrics_require_authentication(path):
+    pytest.importorskip("asyncpg")  # the session dependency resolves before the token check
+    assert TestClient(app).get(path).status_code == 401
+
+
+@pytest.mark.parametrize("path", ["/metrics/cache", "/metrics/auth", "/metrics/db"])
+def test_metrics_are_refused_to_regular_users(client_as, path):
+    assert client_as(is_superuser=False).get(path).status_code == 403
+
+
+def test_metrics_are_served_to_superusers(client_as):
+    response = client_as(is_superuser=True).get("/metrics/cache")
+    assert response.status_code == 200
+    assert "hit_rate" in response.json()
@@ -0,0 +1,32 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.password_pool import PasswordHasher, PasswordHasherBusy
+
+
+def test_without_workers_hashing_stays_off_the_event_loop():
+    hasher = PasswordHasher(workers=0, queue_size=4)
+
+    async def run():
+        return threading.get_ident(), await hasher._run(threading.get_ident)
+
+    loop_thread, hashing_thread = asyncio.run(run())
+    assert hashing_thread != loop_thread
+
+
+def test_full_queue_is_rejected_immediately():
+    hasher = PasswordHasher(workers=0, queue_size=0)
+    release = threading.Event()
+
+    async def run():
+        blocked = asyncio.ensure_future(hasher._run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher._run(threading.get_ident)
+        release.set()
+        await blocked
+
+    asyncio.run(run())
+    assert hasher.rejected == 1
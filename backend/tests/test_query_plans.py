@@ -0,0 +1,115 @@
+"""EXPLAIN checks that the hot queries can use the indexes built for them.
+
+Sequential scans are disabled so the checks do not depend on table size;
+each test asserts that the planner picks the intended index rather than
+another one.
+"""
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, insert, select, text
+
+from app.models.transaction import Transaction
+
+pytestmark = pytest.mark.postgres
+
+
+@pytest.fixture
+def history(db, user, account):
+    """A few thousand transactions, a handful of them matching the probes below."""
+    now = datetime.utcnow().replace(microsecond=0)
+    rows = [
+        {
+            "user_id": user.id,
+            "account_id": account.id,
+            "amount": Decimal("10.00") + index % 90,
+            "description": f"Grocery store {index}",
+            "merchant": f"Shop {index % 50}",
+            "transaction_type": "expense",
+            "transaction_date": now - timedelta(minutes=index),
+            "tags": [f"tag{index % 100}"],
+        }
+        for index in range(3000)
+    ]
+    rows[17].update(description="Blue Bottle Coffee", tags=["travel", "coffee"])
+    db.execute(insert(Transaction), rows)
+    db.execute(text("ANALYZE transactions"))
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    return user.id
+
+
+def plan_indexes(db, statement) -> set:
+    """Indexes used by a statement's plan, with the parents of partition indexes."""
+    compiled = statement.compile(dialect=db.get_bind().dialect)
+    plan = db.connection().exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    names = set()
+
+    def walk(node):
+        if "Index Name" in node:
+            names.add(node["Index Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan[0]["Plan"])
+    # Indexes on partitions are named after the partition
+    parents = db.execute(
+        text(
+            """
+            SELECT parent.relname FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            WHERE child.relname = ANY(:names)
+            """
+        ),
+        {"names": list(names)},
+    ).scalars()
+    return names | set(parents)
+
+
+def test_full_text_search_uses_search_vector_gin(db, history):
+    query = func.websearch_to_tsquery("simple", "coffee")
+    statement = select(Transaction.id).where(
+        Transaction.user_id == history, Transaction.search_vector.op("@@")(query)
+    )
+    assert "ix_transactions_user_search_vector" in plan_indexes(db, statement)
+
+
+def test_substring_search_uses_trigram_gin(db, history):
+    statement = select(Transaction.id).where(
+        Transaction.user_id == history,
+        Transaction.search_text.contains("bottle", autoescape=True),
+    )
+    assert "ix_transactions_user_search_text_trgm" in plan_indexes(db, statement)
+
+
+@pytest.mark.parametrize("match", ["any", "all"])
+def test_tag_filters_use_tags_gin(db, history, match):
+    tags = ["travel", "coffee"]
+    condition = Transaction.tags.contains(tags) if match == "all" else Transaction.tags.overlap(tags)
+    statement = select(Transaction.id).where(Transaction.user_id == history, condition)
+    assert "ix_transactions_user_tags" in plan_indexes(db, statement)
+
+
+def test_duplicate_lookup_uses_fingerprint_hash(db, history):
+    fingerprint = db.execute(
+        select(Transaction.fingerprint).where(Transaction.description == "Blue Bottle Coffee")
+    ).scalar_one()
+    statement = select(Transaction.id).where(Transaction.fingerprint == fingerprint)
+    assert "ix_transactions_fingerprint" in plan_indexes(db, statement)
+
+
+def test_keyset_page_uses_user_date_index(db, history):
+    statement = (
+        select(Transaction.id, Transaction.amount)
+        .where(Transaction.user_id == history)
+        .order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
+        .limit(50)
+    )
+    assert "ix_transactions_user_date_id" in plan_indexes(db, statement)
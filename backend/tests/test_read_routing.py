@@ -0,0 +1,114 @@
+"""Read-your-writes routing between a primary and a lagging replica.
+
+Two SQLite databases stand in for the primary and the replica; the
+replica never receives the writes, like a replica that has not caught up.
+"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from app.core import read_routing
+from app.core.cache import LRUCacheBackend
+from app.core.read_routing import ReadRouter
+
+Base = declarative_base()
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    body = Column(String, nullable=False)
+
+
+class UnreachableReplica:
+    def connect(self):
+        raise ConnectionRefusedError("replica is down")
+
+
+@pytest.fixture
+def engines():
+    primary, replica = create_engine("sqlite://"), create_engine("sqlite://")
+    for engine in (primary, replica):
+        Base.metadata.create_all(engine)
+    return primary, replica
+
+
+@pytest.fixture
+def router(monkeypatch, engines):
+    router = ReadRouter(LRUCacheBackend(), window=10, max_lag=5.0, lag_check_interval=3600)
+    # Replica measured as in sync, so no lag probe runs
+    router.lag, router._lag_checked_at = 0.0, time.monotonic()
+    monkeypatch.setattr(read_routing, "read_router", router)
+    monkeypatch.setattr(read_routing, "get_async_replica_engine", lambda: engines[1])
+    return router
+
+
+def read_notes(router, engines, user_id):
+    """Notes visible to a user's read, wherever the router sends it."""
+    engine = asyncio.run(router.read_engine(user_id)) or engines[0]
+    with Session(engine) as db:
+        return db.scalars(select(Note.body).where(Note.user_id == user_id)).all()
+
+
+def write_note(engines, user_id, body):
+    with Session(engines[0], info={"user_id": user_id}) as db:
+        db.add(Note(user_id=user_id, body=body))
+        db.commit()
+
+
+def test_user_reads_own_write_from_primary(router, engines):
+    write_note(engines, 1, "groceries")
+
+    assert read_notes(router, engines, 1) == ["groceries"]
+    assert router.counters["sticky_reads"] == 1
+
+
+def test_other_users_read_from_replica(router, engines):
+    write_note(engines, 1, "groceries")
+
+    assert asyncio.run(router.read_engine(2)) is engines[1]
+    assert read_notes(router, engines, 2) == []
+    assert router.counters["replica_reads"] == 2
+
+
+def test_reads_and_rolled_back_writes_do_not_pin_to_primary(router, engines):
+    with Session(engines[0], info={"user_id": 1}) as db:
+        db.scalars(select(Note)).all()
+        db.commit()
+        db.add(Note(user_id=1, body="discarded"))
+        db.flush()
+        db.rollback()
+        db.commit()
+
+    assert not router.recently_wrote(1)
+    assert asyncio.run(router.read_engine(1)) is engines[1]
+
+
+def test_window_expires(router, engines, monkeypatch):
+    router.window = 1
+    write_note(engines, 1, "groceries")
+    assert router.recently_wrote(1)
+
+    real_monotonic = time.monotonic
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: real_monotonic() + 2)
+    assert not router.recently_wrote(1)
+
+
+def test_lagging_replica_is_bypassed(router, engines):
+    router.lag = 30.0
+
+    assert asyncio.run(router.read_engine(2)) is None
+    assert router.counters["lagging_reads"] == 1
+
+
+def test_unreachable_replica_is_bypassed(router, monkeypatch):
+    router.lag_check_interval = 0
+    monkeypatch.setattr(read_routing, "get_async_replica_engine", lambda: UnreachableReplica())
+
+    assert asyncio.run(router.read_engine(2)) is None
+    assert router.lag is None
@@ -0,0 +1,36 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from app import crud
+from app.schemas.transaction import TransactionCreate
+from app.services.recurring import RecurringDetectionService
+
+pytestmark = pytest.mark.postgres
+
+
+def test_reading_series_never_detects(db, user, account, count_queries):
+    today = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    for months in range(6):
+        crud.transaction.create_with_user(
+            db,
+            obj_in=TransactionCreate(
+                account_id=account.id,
+                amount=Decimal("15.99"),
+                description="Netflix",
+                merchant="Netflix",
+                transaction_type="expense",
+                transaction_date=today - relativedelta(months=months),
+            ),
+            user_id=user.id,
+        )
+
+    with count_queries() as statements:
+        assert RecurringDetectionService.get_series(db, user.id) == []
+    assert all(s.lstrip().upper().startswith("SELECT") for s in statements)
+
+    RecurringDetectionService.refresh(db, user.id)
+    [series] = RecurringDetectionService.refresh(db, user.id)
+    assert (series.name, series.frequency) == ("Netflix", "monthly")
@@ -0,0 +1,25 @@
+from decimal import Decimal
+
+import pytest
+
+from app.services.transaction_import import TransactionImporter
+
+pytestmark = pytest.mark.postgres
+
+
+def record(amount):
+    return {"date": "2026-01-15", "amount": amount, "description": "Coffee"}
+
+
+@pytest.mark.parametrize("amount", ["NaN", "-Infinity", "sNaN", "1e30", "10000000000000.00"])
+def test_bad_amounts_skip_their_line(db, user, account, amount):
+    importer = TransactionImporter(db, user_id=user.id, account_id=account.id)
+
+    events = list(importer.run([(2, record("-4.50")), (3, record(amount))]))
+
+    assert events[-1]["status"] == "completed"
+    assert events[-1]["imported"] == 1
+    [error] = events[-1]["errors"]
+    assert error["line"] == 3 and "amount" in error["error"]
+    db.refresh(account)
+    assert account.balance == Decimal("-4.50")
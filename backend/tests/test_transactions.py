@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import func, insert, select, text
+
+from app import crud
+from app.crud.transaction_archive import archive_cutoff
+from app.models.spending_rollup import DailySpendingRollup
+from app.models.transaction import Transaction
+from app.models.transaction_archive import TransactionArchive
+from app.schemas.transaction import TransactionBatchDelete, TransactionCreate, TransactionUpdate
+from app.services.transaction_partitions import TransactionPartitionService
+
+pytestmark = pytest.mark.postgres
+
+
+def add_transactions(db, user_id, account_id, count, *, start=None, amount=Decimal("1.00")):
+    """Create `count` expenses through the CRUD layer, several per day."""
+    start = start or datetime.utcnow().replace(microsecond=0) - timedelta(days=10)
+    return [
+        crud.transaction.create_with_user(
+            db,
+            obj_in=TransactionCreate(
+                account_id=account_id,
+                amount=amount,
+                description=f"Purchase {index}",
+                transaction_type="expense",
+                transaction_date=start + timedelta(hours=index // 3),
+            ),
+            user_id=user_id,
+        )
+        for index in range(count)
+    ]
+
+
+def test_keyset_pages_match_offset_listing(db, user, account):
+    user_id = user.id
+    add_transactions(db, user_id, account.id, 25)
+    expected = [t.id for t in crud.transaction.get_by_user(db, user_id=user_id, limit=100)]
+
+    paged, after = [], None
+    while True:
+        page = crud.transaction.get_by_user(db, user_id=user_id, limit=7, after=after)
+        paged.extend(t.id for t in page)
+        if len(page) < 7:
+            break
+        after = (page[-1].transaction_date, page[-1].id)
+
+    assert len(expected) == 25
+    assert paged == expected
+
+
+def test_offset_pages_span_hot_and_archived_rows(db, user, account, count_queries):
+    add_transactions(db, user.id, account.id, 6, start=archive_cutoff() - relativedelta(months=1))
+    crud.transaction_archive.archive_before(db, before=archive_cutoff())
+    add_transactions(db, user.id, account.id, 6)
+    expected = [t.id for t in crud.transaction.get_by_user(db, user_id=user.id, limit=100)]
+
+    for skip in range(0, 12, 4):
+        with count_queries() as statements:
+            page = crud.transaction.get_by_user(db, user_id=user.id, skip=skip, limit=4)
+        assert [t.id for t in page] == expected[skip:skip + 4]
+        assert all(" OFFSET " in s for s in statements if "UNION ALL" in s)
+
+    assert len(expected) == 12
+    assert sum(isinstance(t, TransactionArchive) for t in page) == 4
+
+
+def test_orm_writes_filter_on_the_partition_key(db, user, account, count_queries):
+    created = add_transactions(db, user.id, account.id, 2)
+    changed, removed = created
+    changed.description = "Renamed"
+
+    with count_queries() as statements:
+        db.flush()
+        crud.transaction.delete(db, id=removed.id, transaction_date=removed.transaction_date)
+
+    writes = [s for s in statements if s.lstrip().upper().startswith(("UPDATE TRANSACTIONS", "DELETE FROM TRANSACTIONS"))]
+    assert len(writes) == 2
+    assert all("transactions.transaction_date = " in s for s in writes)
+
+
+def test_archived_partition_stays_readable(db, user, account):
+    month = (archive_cutoff() - relativedelta(months=2)).date()
+    db.execute(text("SELECT create_transaction_partitions(:month, 0)"), {"month": month})
+    db.execute(insert(Transaction), [{
+        "user_id": user.id,
+        "account_id": account.id,
+        "amount": Decimal("42.00"),
+        "description": "Old purchase",
+        "transaction_type": "expense",
+        "transaction_date": datetime.combine(month, datetime.min.time()) + timedelta(days=3),
+    }])
+
+    assert TransactionPartitionService.archive(db, month) == 1
+
+    rows = crud.transaction.get_by_user(db, user_id=user.id)
+    assert [(type(t), t.description) for t in rows] == [(TransactionArchive, "Old purchase")]
+
+
+@pytest.mark.parametrize("drop", [False, True])
+def test_partitions_newer_than_the_cutoff_are_not_archived(db, drop):
+    month = datetime.utcnow().date().replace(day=1)
+    with pytest.raises(ValueError):
+        TransactionPartitionService.archive(db, month, drop=drop)
+
+
+def test_dropped_partition_leaves_the_rollup(db, user, account):
+    month = (archive_cutoff() - relativedelta(months=2)).date()
+    db.execute(text("SELECT create_transaction_partitions(:month, 0)"), {"month": month})
+    add_transactions(db, user.id, account.id, 3, start=datetime.combine(month, datetime.min.time()))
+    add_transactions(db, user.id, account.id, 2)
+
+    assert TransactionPartitionService.archive(db, month, drop=True) is None
+
+    assert crud.spending_rollup.check_drift(db, user_id=user.id) == []
+    assert db.scalar(
+        select(func.sum(DailySpendingRollup.transaction_count))
+        .where(DailySpendingRollup.user_id == user.id)
+    ) == 2
+
+
+@pytest.fixture
+def archived(db, user, account):
+    """An old expense moved to the archive by the archive job."""
+    old_date = archive_cutoff() - relativedelta(months=1)
+    created = add_transactions(db, user.id, account.id, 1, start=old_date, amount=Decimal("30.00"))[0]
+    transaction_id = created.id
+    crud.transaction_archive.archive_before(db, before=archive_cutoff())
+    db.expunge_all()
+    return transaction_id
+
+
+def test_archived_transaction_is_found_by_id(db, user, archived):
+    found = crud.transaction.get_user_transaction(db, transaction_id=archived, user_id=user.id)
+    assert isinstance(found, TransactionArchive)
+
+
+def test_changing_an_archived_transaction_restores_it(db, user, account, archived):
+    found = crud.transaction.get_user_transaction(
+        db, transaction_id=archived, user_id=user.id, restore_archived=True
+    )
+    assert isinstance(found, Transaction)
+
+    crud.transaction.update(db, db_obj=found, obj_in=TransactionUpdate(amount=Decimal("10.00")))
+    db.refresh(account)
+    assert account.balance == Decimal("-10.00")
+    assert db.get(TransactionArchive, archived) is None
+
+
+def test_batch_deletes_an_archived_transaction(db, user, account, archived):
+    results = crud.transaction.apply_batch(
+        db, operations=[TransactionBatchDelete(op="delete", id=archived)], user_id=user.id
+    )
+    assert results[0].status == "ok"
+    db.refresh(account)
+    assert account.balance == Decimal("0.00")
+    assert crud.transaction.get_user_transaction(db, transaction_id=archived, user_id=user.id) is None